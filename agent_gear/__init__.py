@@ -30,12 +30,21 @@ External Path Example:
 
 from __future__ import annotations
 
+import asyncio
+import builtins
+import functools
+import itertools
 import os
+import re
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast, overload
 
 from agent_gear._rust_core import (
     FileMetadata,
+    FileSystemSnapshot,
     SearchOptions,
     SearchResult,
     __version__,
@@ -45,6 +54,56 @@ from agent_gear._rust_core import FileSystem as _RustFileSystem
 if TYPE_CHECKING:
     from agent_gear.python_backend import PythonFileBackend
 
+# Path arguments accepted by the wrappers; normalized with os.fsdecode()
+type _AnyPath = str | bytes | os.PathLike[str] | os.PathLike[bytes]
+
+# Absolute paths remembered by FileSystem._is_within_root before resetting
+_WITHIN_CACHE_SIZE = 4096
+
+# list()/glob() results remembered per FileSystem before resetting
+_LIST_CACHE_SIZE = 64
+
+
+class _SharedHandle:
+    """A Rust handle shared by FileSystem.open() callers, with a refcount."""
+
+    __slots__ = ("inner", "refs")
+
+    def __init__(self, inner: _RustFileSystem) -> None:
+        self.inner = inner
+        self.refs = 0
+
+
+# Handles reused by FileSystem.open(), keyed by (realpath(root), auto_watch)
+_HANDLE_CACHE: dict[tuple[str, bool], _SharedHandle] = {}
+_HANDLE_CACHE_LOCK = threading.Lock()
+
+
+def _acquire_handle(root: str, auto_watch: bool) -> tuple[tuple[str, bool], _RustFileSystem]:
+    """Get the shared Rust handle for root, creating it on first use."""
+    key = (os.path.realpath(root), auto_watch)
+    with _HANDLE_CACHE_LOCK:
+        shared = _HANDLE_CACHE.get(key)
+        if shared is None:
+            shared = _HANDLE_CACHE[key] = _SharedHandle(_RustFileSystem(root, auto_watch))
+        shared.refs += 1
+        return key, shared.inner
+
+
+def _release_handle(key: tuple[str, bool]) -> bool:
+    """Drop one reference to a shared handle.
+
+    Returns:
+        True if that was the last reference and the handle should be closed.
+    """
+    with _HANDLE_CACHE_LOCK:
+        shared = _HANDLE_CACHE[key]
+        shared.refs -= 1
+        if shared.refs > 0:
+            return False
+        del _HANDLE_CACHE[key]
+        return True
+
 
 class _PythonSearchResult:
     """Python-side SearchResult for external path grep results.
@@ -52,6 +111,8 @@ class _PythonSearchResult:
     Matches the interface of the Rust SearchResult class.
     """
 
+    __slots__ = ("file", "line_number", "content", "context_before", "context_after")
+
     def __init__(
         self,
         file: str,
@@ -67,20 +128,85 @@ class _PythonSearchResult:
         self.context_after = context_after or []
 
 
-def _create_search_result(
-    file: str,
-    line_number: int,
-    content: str,
-    context_before: list[str] | None = None,
-    context_after: list[str] | None = None,
-) -> _PythonSearchResult:
-    """Create a Python SearchResult object."""
-    return _PythonSearchResult(file, line_number, content, context_before, context_after)
+async def _empty_batch() -> dict[str, str]:
+    return {}
+
+
+def _split_pattern_base(pattern: str) -> tuple[str, str | None]:
+    """Split an absolute pattern into its top-level directory and the rest.
+
+    "/tmp/**/*.py" -> ("/tmp", "**/*.py"); "/tmp" -> ("/tmp", None).
+    """
+    slash = pattern.find("/", 1)
+    if slash == -1:
+        return pattern, None
+    return pattern[:slash], pattern[slash + 1 :]
+
+
+class PathList(Sequence[str]):
+    """Read-only sequence of paths packed into a single buffer.
+
+    Wraps the ``(buffer, offsets)`` pair returned by FileSystem.list_bytes().
+    Paths are decoded only when accessed, so listing a large tree does not
+    create one Python string per path up front.
+
+    Example:
+        >>> paths = PathList(*fs.list_bytes("**/*.py"))
+        >>> len(paths), paths[0]
+    """
+
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self, buffer: bytes, offsets: list[int]) -> None:
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("PathList index out of range")
+        # Each path is followed by a NUL separator
+        return self._buffer[self._offsets[index] : self._offsets[index + 1] - 1].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._buffer:
+            return iter(())
+        return (path.decode() for path in self._buffer[:-1].split(b"\0"))
+
+    def __repr__(self) -> str:
+        return f"PathList({len(self)} paths)"
+
+
+def _pack_paths(paths: list[str]) -> tuple[bytes, list[int]]:
+    """Pack paths the way FileSystem.list_bytes() does."""
+    offsets = [0]
+    chunks = []
+    for path in paths:
+        chunk = path.encode() + b"\0"
+        chunks.append(chunk)
+        offsets.append(offsets[-1] + len(chunk))
+    return b"".join(chunks), offsets
+
 
 __all__ = [
     "FileSystem",
     "AsyncFileSystem",
+    "PathList",
     "FileMetadata",
+    "FileSystemSnapshot",
     "SearchOptions",
     "SearchResult",
     "__version__",
@@ -113,25 +239,77 @@ class FileSystem:
         >>> fs = FileSystem("/project", allow_external=True)
         >>> # Read file outside project directory
         >>> content = fs.read_file("/tmp/external.txt")
+
+    Shared Handle Example:
+        >>> # Reuses the index and watcher of any open handle on the same root
+        >>> fs = FileSystem.open("/project")
     """
 
+    _inner: _RustFileSystem
+    _cache_key: tuple[str, bool] | None
+    _closed: bool
+    _root: str
+    _root_prefix: str
+    _within_cache: dict[str, bool]
+    _list_cache: dict[tuple[str, bool], tuple[int, tuple[str, ...]]]
+    _allow_external: bool
     _python_backend: PythonFileBackend | None
 
     def __init__(
         self,
-        root: str,
+        root: _AnyPath,
         auto_watch: bool = True,
         allow_external: bool = False,
     ) -> None:
         """Initialize the FileSystem.
 
+        Args:
+            root: Root directory path (str, bytes or os.PathLike).
+            auto_watch: Whether to automatically watch for file changes.
+            allow_external: Whether to allow operations on paths outside root.
+        """
+        root = os.fsdecode(root)
+        self._setup(_RustFileSystem(root, auto_watch), root, allow_external)
+
+    @classmethod
+    def open(
+        cls,
+        root: _AnyPath,
+        auto_watch: bool = True,
+        allow_external: bool = False,
+    ) -> FileSystem:
+        """Open a FileSystem that shares its index with other open handles.
+
+        Handles opened this way for the same real root path and auto_watch
+        setting share one Rust index and watcher, so only the first call pays
+        for the initial scan. The shared state is released when the last
+        handle is closed. Use the constructor to get an independent handle.
+
         Args:
             root: Root directory path.
             auto_watch: Whether to automatically watch for file changes.
             allow_external: Whether to allow operations on paths outside root.
+
+        Returns:
+            A FileSystem backed by the shared handle.
         """
-        self._inner = _RustFileSystem(root, auto_watch)
+        root = os.fsdecode(root)
+        key, inner = _acquire_handle(root, auto_watch)
+        fs = cls.__new__(cls)
+        fs._setup(inner, root, allow_external)
+        fs._cache_key = key
+        return fs
+
+    def _setup(self, inner: _RustFileSystem, root: str, allow_external: bool) -> None:
+        """Initialize wrapper state around a Rust handle."""
+        self._inner = inner
+        self._cache_key = None
+        self._closed = False
         self._root = os.path.abspath(root)
+        # join() adds a trailing separator unless there already is one ("/")
+        self._root_prefix = os.path.join(self._root, "")
+        self._within_cache = {}
+        self._list_cache = {}
         self._allow_external = allow_external
         self._python_backend = None
         if allow_external:
@@ -150,8 +328,14 @@ class FileSystem:
         """
         if not os.path.isabs(path):
             return True  # Relative paths are always within root
-        abs_path = os.path.abspath(path)
-        return abs_path.startswith(self._root + os.sep) or abs_path == self._root
+        within = self._within_cache.get(path)
+        if within is None:
+            abs_path = os.path.abspath(path)
+            within = abs_path == self._root or abs_path.startswith(self._root_prefix)
+            if len(self._within_cache) >= _WITHIN_CACHE_SIZE:
+                self._within_cache.clear()
+            self._within_cache[path] = within
+        return within
 
     def _check_external_allowed(self, path: str) -> None:
         """Check if external path access is allowed.
@@ -159,10 +343,11 @@ class FileSystem:
         Raises:
             ValueError: If path is external and allow_external=False.
         """
-        if not self._is_within_root(path) and not self._allow_external:
+        # The flag is fixed per instance; test it first so allowed handles
+        # never redo the root check their callers just made
+        if not self._allow_external and not self._is_within_root(path):
             raise ValueError(
-                f"Path '{path}' is outside root directory '{self._root}' "
-                "and allow_external=False"
+                f"Path '{path}' is outside root directory '{self._root}' and allow_external=False"
             )
 
     def wait_ready(self, timeout: float = 30.0) -> bool:
@@ -174,14 +359,7 @@ class FileSystem:
         Returns:
             True if index is ready, False if timeout was reached.
         """
-        import time
-
-        start = time.time()
-        while not self.is_ready():
-            if time.time() - start > timeout:
-                return False
-            time.sleep(0.1)
-        return True
+        return self._inner.wait_ready(timeout)
 
     def list(self, pattern: str = "**/*", only_files: bool = True) -> list[str]:
         """List files matching the given pattern from memory index.
@@ -195,22 +373,61 @@ class FileSystem:
 
         Note:
             If pattern starts with "/" and points outside root,
-            Python fallback is used for the listing.
+            Python fallback is used for the listing. While the index is
+            still being built, the first listing waits for it to finish.
         """
         # Check if pattern points to external path
         if pattern.startswith("/"):
-            # Extract base directory from pattern
-            parts = pattern.split("/")
-            base_path = "/" + parts[1] if len(parts) > 1 else "/"
+            base_path, remaining_pattern = _split_pattern_base(pattern)
             if not self._is_within_root(base_path):
                 self._check_external_allowed(base_path)
                 assert self._python_backend is not None
-                # Extract pattern after base path
-                remaining_pattern = "/".join(parts[2:]) if len(parts) > 2 else "**/*"
+                if remaining_pattern is None:
+                    remaining_pattern = "**/*"
                 return self._python_backend.list_files(base_path, remaining_pattern, only_files)
-        return self._inner.list(pattern, only_files)
+        return self._cached_list(pattern, only_files)
+
+    def _cached_list(self, pattern: str, only_files: bool) -> builtins.list[str]:
+        """List from the index, reusing the last result while it is current.
+
+        Results are tagged with the index generation, which the Rust side
+        bumps whenever a path is added or removed, so a cached list is never
+        stale; unchanged indexes answer repeated patterns without a scan.
+        """
+        # Read the generation first: a change racing with list() then only
+        # causes one extra refetch, never a stale hit
+        generation = self._inner.generation()
+        key = (pattern, only_files)
+        cached = self._list_cache.get(key)
+        if cached is not None and cached[0] == generation:
+            return list(cached[1])
+        files = self._inner.list(pattern, only_files)
+        if len(self._list_cache) >= _LIST_CACHE_SIZE:
+            self._list_cache.clear()
+        self._list_cache[key] = (generation, tuple(files))
+        return files
+
+    def list_bytes(
+        self, pattern: str = "**/*", only_files: bool = True
+    ) -> tuple[bytes, builtins.list[int]]:
+        """List files as one NUL-separated buffer instead of a list of strings.
+
+        Much lighter than list() for large trees; wrap the result in
+        PathList to index or iterate it like a sequence of str.
+
+        Args:
+            pattern: Glob pattern (default: "**/*"). Can be absolute path for external dirs.
+            only_files: If true, only return files (not directories).
+
+        Returns:
+            Tuple of (buffer, offsets) where path ``i`` is
+            ``buffer[offsets[i]:offsets[i + 1] - 1]``.
+        """
+        if pattern.startswith("/"):
+            return _pack_paths(self.list(pattern, only_files))
+        return self._inner.list_bytes(pattern, only_files)
 
-    def glob(self, pattern: str) -> list[str]:
+    def glob(self, pattern: str) -> builtins.list[str]:
         """Match files using glob pattern.
 
         Args:
@@ -225,16 +442,16 @@ class FileSystem:
         """
         # Check if pattern points to external path
         if pattern.startswith("/"):
-            parts = pattern.split("/")
-            base_path = "/" + parts[1] if len(parts) > 1 else "/"
+            base_path, remaining_pattern = _split_pattern_base(pattern)
             if not self._is_within_root(base_path):
                 self._check_external_allowed(base_path)
                 assert self._python_backend is not None
-                remaining_pattern = "/".join(parts[2:]) if len(parts) > 2 else "*"
+                if remaining_pattern is None:
+                    remaining_pattern = "*"
                 return self._python_backend.glob(base_path, remaining_pattern)
-        return self._inner.glob(pattern)
+        return self._cached_list(pattern, True)
 
-    def read_file(self, path: str, encoding: str = "utf-8") -> str:
+    def read_file(self, path: _AnyPath, encoding: str = "utf-8") -> str:
         """Read a single file.
 
         Args:
@@ -247,13 +464,14 @@ class FileSystem:
         Raises:
             ValueError: If path is external and allow_external=False.
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.read_file(path, encoding)
         self._check_external_allowed(path)
         assert self._python_backend is not None
         return self._python_backend.read_file(path, encoding)
 
-    def read_batch(self, paths: list[str]) -> dict[str, str]:
+    def read_batch(self, paths: Sequence[_AnyPath]) -> dict[str, str]:
         """Read multiple files in parallel.
 
         Args:
@@ -266,31 +484,174 @@ class FileSystem:
             For mixed internal/external paths, internal paths use Rust,
             external paths use Python. All paths must be allowed.
         """
-        # Separate internal and external paths
-        internal_paths = []
-        external_paths = []
-        for p in paths:
-            if self._is_within_root(p):
-                internal_paths.append(p)
-            else:
-                self._check_external_allowed(p)
-                external_paths.append(p)
+        internal_paths, external_paths = self._partition_paths(paths)
 
         # Read internal paths with Rust
         result = self._inner.read_batch(internal_paths) if internal_paths else {}
 
-        # Read external paths with Python
-        if external_paths and self._python_backend:
-            for p in external_paths:
-                try:
-                    result[p] = self._python_backend.read_file(p)
-                except Exception as e:
-                    # Match Rust behavior: skip failed reads
-                    pass
-
+        # Read external paths with Python (failed reads are skipped, as in Rust)
+        if external_paths:
+            assert self._python_backend is not None
+            result.update(self._python_backend.read_batch(external_paths))
         return result
 
-    def read_lines(self, path: str, start_line: int = 0, count: int | None = None) -> list[str]:
+    def _partition_paths(
+        self, paths: Sequence[_AnyPath]
+    ) -> tuple[builtins.list[str], builtins.list[str]]:
+        """Split paths into (internal, external) without any I/O.
+
+        Each path is classified once; external access is checked once for the
+        whole batch.
+
+        Raises:
+            ValueError: If a path is external and allow_external=False.
+        """
+        decoded = [os.fsdecode(p) for p in paths]
+        within = [self._is_within_root(p) for p in decoded]
+        if all(within):
+            return decoded, []
+        internal = list(itertools.compress(decoded, within))
+        external = [p for p, w in zip(decoded, within, strict=True) if not w]
+        self._check_external_allowed(external[0])
+        return internal, external
+
+    def read_batch_bytes(self, paths: Sequence[_AnyPath]) -> builtins.list[bytes | None]:
+        """Read multiple files in parallel as raw bytes.
+
+        Cheaper than read_batch() when the caller does not need decoded text:
+        no UTF-8 decoding, and results are a list in the order of ``paths``.
+
+        Args:
+            paths: List of file paths.
+
+        Returns:
+            List of file contents in the same order as ``paths``
+            (None for files that could not be read).
+
+        Raises:
+            ValueError: If a path is external and allow_external=False.
+        """
+        str_paths = [os.fsdecode(p) for p in paths]
+        for p in str_paths:
+            self._check_external_allowed(p)
+        return self._inner.read_batch_bytes(str_paths)
+
+    def read_batch_concat(self, paths: Sequence[_AnyPath]) -> tuple[bytes, builtins.list[int]]:
+        """Read multiple files in parallel into one contiguous buffer.
+
+        The whole batch is a single ``bytes`` object; slice it (ideally through
+        a ``memoryview``) to get individual files without further copies.
+
+        Args:
+            paths: List of file paths.
+
+        Returns:
+            Tuple of (buffer, offsets) where file ``i`` is
+            ``buffer[offsets[i]:offsets[i + 1]]`` (empty for unreadable files).
+
+        Raises:
+            ValueError: If a path is external and allow_external=False.
+        """
+        str_paths = [os.fsdecode(p) for p in paths]
+        for p in str_paths:
+            self._check_external_allowed(p)
+        return self._inner.read_batch_concat(str_paths)
+
+    def read_batch_views(self, paths: Sequence[_AnyPath]) -> dict[str, memoryview]:
+        """Read multiple files in parallel as views into one shared buffer.
+
+        Built on read_batch_concat(): each file is a ``memoryview`` slice of
+        the same buffer, so nothing is decoded or copied per file. Decode a
+        view with ``bytes(view).decode()`` only when text is needed.
+
+        Args:
+            paths: List of file paths.
+
+        Returns:
+            Dict mapping path to a read-only view of its bytes (empty for
+            unreadable files).
+
+        Raises:
+            ValueError: If a path is external and allow_external=False.
+        """
+        str_paths = [os.fsdecode(p) for p in paths]
+        buffer, offsets = self.read_batch_concat(str_paths)
+        view = memoryview(buffer)
+        return {p: view[offsets[i] : offsets[i + 1]] for i, p in enumerate(str_paths)}
+
+    def copy_batch(self, pairs: Sequence[tuple[_AnyPath, _AnyPath]]) -> int:
+        """Copy files in parallel without passing their contents through Python.
+
+        Data is moved in the kernel where the platform allows it
+        (``copy_file_range``/``sendfile`` on Linux), falling back to a
+        user-space copy across filesystems. Destination directories are
+        created as needed.
+
+        Args:
+            pairs: List of (source, destination) path pairs.
+
+        Returns:
+            Total number of bytes copied.
+
+        Raises:
+            ValueError: If a path is external and allow_external=False,
+                or a source file does not exist.
+            IOError: If a copy fails.
+        """
+        str_pairs = [(os.fsdecode(src), os.fsdecode(dst)) for src, dst in pairs]
+        for src, dst in str_pairs:
+            self._check_external_allowed(src)
+            self._check_external_allowed(dst)
+        return self._inner.copy_batch(str_pairs)
+
+    def read_batch_into(self, paths: Sequence[_AnyPath], out_dir: _AnyPath) -> int:
+        """Copy multiple files into a directory, preserving their layout.
+
+        Each path is copied to ``out_dir`` under its path relative to the
+        root (external files keep only their file name). See copy_batch().
+
+        Args:
+            paths: List of file paths.
+            out_dir: Destination directory (relative to root or absolute).
+
+        Returns:
+            Total number of bytes copied.
+        """
+        out = os.fsdecode(out_dir)
+        pairs = []
+        for p in map(os.fsdecode, paths):
+            if self._is_within_root(p):
+                rel = os.path.relpath(os.path.join(self._root, p), self._root)
+            else:
+                rel = os.path.basename(p)
+            pairs.append((p, os.path.join(out, rel)))
+        return self.copy_batch(pairs)
+
+    def read_file_view(self, path: _AnyPath) -> memoryview:
+        """Memory-map a file and return a zero-copy view of its bytes.
+
+        Nothing is copied or decoded up front, so slicing out a header or
+        scanning a large file is cheap: e.g. ``view[:1024].tobytes().decode()``.
+
+        Args:
+            path: File path (relative to root or absolute).
+
+        Returns:
+            Read-only memoryview over the file contents.
+
+        Raises:
+            ValueError: If path is external and allow_external=False.
+        """
+        path = os.fsdecode(path)
+        if self._is_within_root(path):
+            return memoryview(self._inner.read_file_view(path))
+        self._check_external_allowed(path)
+        assert self._python_backend is not None
+        return self._python_backend.read_file_view(path)
+
+    def read_lines(
+        self, path: _AnyPath, start_line: int = 0, count: int | None = None
+    ) -> builtins.list[str]:
         """Read specific lines from a file (for large files).
 
         Efficiently reads a range of lines without loading the entire file.
@@ -310,13 +671,40 @@ class FileSystem:
             >>> # Read lines 1000-1100
             >>> lines = fs.read_lines("large_log.txt", 1000, 100)
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.read_lines(path, start_line, count)
         self._check_external_allowed(path)
         assert self._python_backend is not None
         return self._python_backend.read_lines(path, start_line, count)
 
-    def read_file_range(self, path: str, offset: int, limit: int) -> str:
+    def read_lines_iter(
+        self, path: _AnyPath, start_line: int = 0, count: int | None = None
+    ) -> Iterator[str]:
+        """Iterate over lines of a file without building a list.
+
+        Like read_lines(), but each line is decoded only when reached, so
+        memory stays flat however many lines are consumed.
+
+        Args:
+            path: File path.
+            start_line: Starting line number (0-indexed).
+            count: Number of lines to yield (None = read to end).
+
+        Returns:
+            Iterator of line strings (without trailing newlines).
+        """
+        path = os.fsdecode(path)
+        if self._is_within_root(path):
+            return iter(self._inner.read_lines_iter(path, start_line, count))
+        self._check_external_allowed(path)
+        assert self._python_backend is not None
+        # The backend generator is lazy; check now so a missing file raises here
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        return self._python_backend.iter_lines(path, start_line, count)
+
+    def read_file_range(self, path: _AnyPath, offset: int, limit: int) -> str:
         """Read a byte range from a file.
 
         Args:
@@ -327,13 +715,14 @@ class FileSystem:
         Returns:
             Content as string.
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.read_file_range(path, offset, limit)
         self._check_external_allowed(path)
         assert self._python_backend is not None
         return self._python_backend.read_file_range(path, offset, limit)
 
-    def write_file(self, path: str, content: str) -> bool:
+    def write_file(self, path: _AnyPath, content: str) -> bool:
         """Write content to file atomically.
 
         Args:
@@ -343,13 +732,14 @@ class FileSystem:
         Returns:
             True if successful.
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.write_file(path, content)
         self._check_external_allowed(path)
         assert self._python_backend is not None
         return self._python_backend.write_file(path, content)
 
-    def write_file_fast(self, path: str, content: str) -> bool:
+    def write_file_fast(self, path: _AnyPath, content: str) -> bool:
         """Write content to file without atomicity guarantee (fast mode).
 
         Much faster than write_file() but does not guarantee data integrity
@@ -362,6 +752,7 @@ class FileSystem:
         Returns:
             True if successful.
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.write_file_fast(path, content)
         self._check_external_allowed(path)
@@ -370,7 +761,7 @@ class FileSystem:
 
     def edit_replace(
         self,
-        path: str,
+        path: _AnyPath,
         old_text: str,
         new_text: str,
         strict: bool = True,
@@ -386,6 +777,7 @@ class FileSystem:
         Returns:
             True if replacement was made.
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.edit_replace(path, old_text, new_text, strict)
         self._check_external_allowed(path)
@@ -398,14 +790,22 @@ class FileSystem:
         glob_pattern: str = "**/*",
         case_sensitive: bool = False,
         max_results: int = 1000,
-    ) -> list[SearchResult]:
+        before: int = 0,
+        after: int = 0,
+    ) -> builtins.list[SearchResult]:
         """Search files for content matching query.
 
+        Context lines are collected in the same pass as the match, while the
+        file is still in memory, so there is no need to call read_lines()
+        for each hit afterwards.
+
         Args:
             query: Search pattern (regex).
             glob_pattern: File pattern to search in. Can be absolute path for external dirs.
             case_sensitive: Case sensitive search.
             max_results: Maximum number of results.
+            before: Context lines to attach before each match (context_before).
+            after: Context lines to attach after each match (context_after).
 
         Returns:
             List of SearchResult objects.
@@ -416,25 +816,104 @@ class FileSystem:
         """
         # Check if pattern points to external path
         if glob_pattern.startswith("/"):
-            # Extract base directory from pattern
             # e.g., "/tmp/**/*.py" -> "/tmp"
-            parts = glob_pattern.split("/")
-            base_path = "/" + parts[1] if len(parts) > 1 else "/"
+            base_path, remaining_pattern = _split_pattern_base(glob_pattern)
             if not self._is_within_root(base_path):
                 self._check_external_allowed(base_path)
                 assert self._python_backend is not None
-                results = self._python_backend.grep(
-                    query, base_path, glob_pattern[len(base_path):].lstrip("/"),
-                    case_sensitive, max_results
+                # Row tuples become results as they are produced, so no
+                # intermediate dict or list is built per match
+                rows = self._python_backend.grep_iter(
+                    query,
+                    base_path,
+                    (remaining_pattern or "").lstrip("/"),
+                    case_sensitive,
+                    max_results,
+                    before,
+                    after,
+                )
+                # _PythonSearchResult mirrors SearchResult's interface
+                return cast(
+                    "builtins.list[SearchResult]", [_PythonSearchResult(*row) for row in rows]
                 )
-                # Convert dict results to SearchResult-like objects
-                return [
-                    _create_search_result(r["file"], r["line_number"], r["content"])
-                    for r in results
-                ]
-        return self._inner.grep(query, glob_pattern, case_sensitive, max_results)
-
-    def get_metadata(self, path: str) -> FileMetadata | dict:
+        return self._inner.grep(query, glob_pattern, case_sensitive, max_results, before, after)
+
+    def grep_iter(
+        self,
+        query: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> Iterator[SearchResult]:
+        """Search files lazily, yielding results as they are found.
+
+        The search runs in the background and stops when the iterator is
+        discarded, so breaking out early skips the remaining work.
+
+        Args:
+            query: Search pattern (regex).
+            glob_pattern: File pattern to search in. Can be absolute path for external dirs.
+            case_sensitive: Case sensitive search.
+            max_results: Maximum number of results.
+
+        Returns:
+            Iterator of SearchResult objects (in no particular order).
+        """
+        if glob_pattern.startswith("/"):
+            return iter(self.grep(query, glob_pattern, case_sensitive, max_results))
+        return iter(self._inner.grep_iter(query, glob_pattern, case_sensitive, max_results))
+
+    def grep_any(
+        self,
+        query: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+    ) -> bool:
+        """Check whether any file matches query, stopping at the first hit.
+
+        Args:
+            query: Search pattern (regex).
+            glob_pattern: File pattern to search in.
+            case_sensitive: Case sensitive search.
+
+        Returns:
+            True if at least one line matches.
+        """
+        results = self.grep_iter(query, glob_pattern, case_sensitive, max_results=1)
+        return next(results, None) is not None
+
+    def grep_multi(
+        self,
+        queries: builtins.list[str],
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> dict[str, builtins.list[SearchResult]]:
+        """Search files for several literal strings in a single pass.
+
+        All queries are matched together, so each file is read and scanned
+        once instead of once per query.
+
+        Args:
+            queries: Literal strings to search for (not regexes).
+            glob_pattern: File pattern to search in. Can be absolute path for external dirs.
+            case_sensitive: Case sensitive search (only ASCII letters are folded otherwise).
+            max_results: Maximum number of results per query.
+
+        Returns:
+            Dict mapping each query to its list of SearchResult objects.
+        """
+        if glob_pattern.startswith("/"):
+            base_path, _ = _split_pattern_base(glob_pattern)
+            if not self._is_within_root(base_path):
+                self._check_external_allowed(base_path)
+                return {
+                    query: self.grep(re.escape(query), glob_pattern, case_sensitive, max_results)
+                    for query in queries
+                }
+        return self._inner.grep_multi(queries, glob_pattern, case_sensitive, max_results)
+
+    def get_metadata(self, path: _AnyPath) -> FileMetadata | dict[str, Any]:
         """Get file metadata.
 
         Args:
@@ -443,16 +922,43 @@ class FileSystem:
         Returns:
             FileMetadata object (Rust) or dict (Python fallback).
         """
+        path = os.fsdecode(path)
         if self._is_within_root(path):
             return self._inner.get_metadata(path)
         self._check_external_allowed(path)
         assert self._python_backend is not None
         return self._python_backend.get_metadata(path)
 
+    def snapshot(self) -> FileSystemSnapshot:
+        """Take an immutable snapshot of the file index.
+
+        The snapshot supports list(), glob() and get_metadata() for paths
+        inside root. It is not affected by later file changes and reads it
+        without any locking, so an agent can pin a consistent view of the
+        tree for the duration of a task.
+
+        Returns:
+            FileSystemSnapshot of the current index.
+
+        Raises:
+            RuntimeError: If the index is not ready yet.
+        """
+        return self._inner.snapshot()
+
     def refresh(self) -> None:
         """Force refresh the file index."""
         self._inner.refresh()
 
+    def simd_backend(self) -> str:
+        """Report the SIMD instruction set used by grep's literal search.
+
+        Selected at runtime for the current CPU.
+
+        Returns:
+            "avx2", "sse2", "neon" or "none".
+        """
+        return self._inner.simd_backend()
+
     def is_ready(self) -> bool:
         """Check if the index is ready."""
         return self._inner.is_ready()
@@ -462,20 +968,33 @@ class FileSystem:
         return self._inner.is_watching()
 
     def close(self) -> None:
-        """Close the filesystem and release resources."""
-        self._inner.close()
+        """Close the filesystem and release resources.
+
+        For handles from open(), the shared index is only closed once every
+        handle on it has been closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._cache_key is None or _release_handle(self._cache_key):
+            self._inner.close()
+        if self._python_backend is not None:
+            self._python_backend.close()
 
     def __enter__(self) -> FileSystem:
         return self
 
-    def __exit__(self, *args) -> None:
+    def __exit__(self, *args: object) -> None:
         self.close()
 
 
 class AsyncFileSystem:
     """Async wrapper for FileSystem using asyncio.
 
-    Provides async/await API by running blocking operations in a thread pool.
+    Provides async/await API. Index, read and search operations on paths
+    inside root await native futures from the Rust core (driven by Tokio);
+    everything else runs the blocking call on a thread pool owned by the
+    instance and sized for I/O concurrency.
     All methods that perform I/O are async.
 
     Args:
@@ -495,9 +1014,14 @@ class AsyncFileSystem:
         ...     content = await fs.read_file("/tmp/external.txt")
     """
 
+    _sync: FileSystem
+    _inner: _RustFileSystem
+    _is_within_root: Callable[[str], bool]
+    _executor: ThreadPoolExecutor
+
     def __init__(
         self,
-        root: str,
+        root: _AnyPath,
         auto_watch: bool = True,
         allow_external: bool = False,
     ) -> None:
@@ -508,7 +1032,43 @@ class AsyncFileSystem:
             auto_watch: Whether to automatically watch for file changes.
             allow_external: Whether to allow operations on paths outside root.
         """
-        self._sync = FileSystem(root, auto_watch, allow_external)
+        self._bind(FileSystem(root, auto_watch, allow_external))
+
+    @classmethod
+    def open(
+        cls,
+        root: _AnyPath,
+        auto_watch: bool = True,
+        allow_external: bool = False,
+    ) -> AsyncFileSystem:
+        """Open an AsyncFileSystem sharing its index with other open handles.
+
+        See FileSystem.open() for the sharing rules.
+        """
+        afs = cls.__new__(cls)
+        afs._bind(FileSystem.open(root, auto_watch, allow_external))
+        return afs
+
+    def _bind(self, sync: FileSystem) -> None:
+        """Attach the wrapped FileSystem.
+
+        The Rust handle and the root check are cached on the instance so that
+        in-root calls go straight to ``_inner`` instead of through the
+        FileSystem wrapper; ``_sync`` is only needed to route external paths
+        and to release shared handles on close().
+        """
+        self._sync = sync
+        self._inner = sync._inner
+        self._is_within_root = sync._is_within_root
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(16, (os.cpu_count() or 1) * 4), thread_name_prefix="agent-gear-fs"
+        )
+
+    def _run[T](self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> asyncio.Future[T]:
+        """Run a blocking call on this instance's thread pool."""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        return asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
 
     async def wait_ready(self, timeout: float = 30.0) -> bool:
         """Wait for the index to be ready (async).
@@ -519,37 +1079,85 @@ class AsyncFileSystem:
         Returns:
             True if index is ready, False if timeout was reached.
         """
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.wait_ready, timeout)
+        return await self._inner.wait_ready_async(timeout)
 
     async def list(self, pattern: str = "**/*", only_files: bool = True) -> list[str]:
         """List files matching the given pattern from memory index (async)."""
-        import asyncio
+        if pattern.startswith("/"):
+            return await self._run(self._sync.list, pattern, only_files)
+        return await self._inner.list_async(pattern, only_files)
 
-        return await asyncio.to_thread(self._sync.list, pattern, only_files)
+    async def list_bytes(
+        self, pattern: str = "**/*", only_files: bool = True
+    ) -> tuple[bytes, builtins.list[int]]:
+        """List files as one NUL-separated buffer (async)."""
+        return await self._run(self._sync.list_bytes, pattern, only_files)
 
-    async def glob(self, pattern: str) -> list[str]:
+    async def glob(self, pattern: str) -> builtins.list[str]:
         """Match files using glob pattern (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.glob, pattern)
+        if pattern.startswith("/"):
+            return await self._run(self._sync.glob, pattern)
+        return await self._inner.glob_async(pattern)
 
-    async def read_file(self, path: str, encoding: str = "utf-8") -> str:
+    async def read_file(self, path: _AnyPath, encoding: str = "utf-8") -> str:
         """Read a single file (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.read_file, path, encoding)
+        path = os.fsdecode(path)
+        if self._is_within_root(path):
+            return await self._inner.read_file_async(path, encoding)
+        return await self._run(self._sync.read_file, path, encoding)
 
-    async def read_batch(self, paths: list[str]) -> dict[str, str]:
+    async def read_batch(self, paths: Sequence[_AnyPath]) -> dict[str, str]:
         """Read multiple files in parallel (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.read_batch, paths)
+        internal_paths, external_paths = self._sync._partition_paths(paths)
+        if not external_paths:
+            return await self._inner.read_batch_async(internal_paths)
+
+        # Internal paths go to Rust while each external read runs on the
+        # shared executor, all awaited together
+        backend = self._sync._python_backend
+        assert backend is not None
+        internal, external = await asyncio.gather(
+            self._inner.read_batch_async(internal_paths) if internal_paths else _empty_batch(),
+            asyncio.gather(*(self._run(backend.try_read_file, p) for p in external_paths)),
+        )
+        internal.update(
+            (p, c) for p, c in zip(external_paths, external, strict=True) if c is not None
+        )
+        return internal
+
+    async def read_batch_bytes(self, paths: Sequence[_AnyPath]) -> builtins.list[bytes | None]:
+        """Read multiple files in parallel as raw bytes (async)."""
+        str_paths = [os.fsdecode(p) for p in paths]
+        target = self._inner if all(map(self._is_within_root, str_paths)) else self._sync
+        return await self._run(target.read_batch_bytes, str_paths)
+
+    async def read_batch_concat(
+        self, paths: Sequence[_AnyPath]
+    ) -> tuple[bytes, builtins.list[int]]:
+        """Read multiple files in parallel into one contiguous buffer (async)."""
+        str_paths = [os.fsdecode(p) for p in paths]
+        target = self._inner if all(map(self._is_within_root, str_paths)) else self._sync
+        return await self._run(target.read_batch_concat, str_paths)
+
+    async def read_batch_views(self, paths: Sequence[_AnyPath]) -> dict[str, memoryview]:
+        """Read multiple files in parallel as views into one shared buffer (async)."""
+        return await self._run(self._sync.read_batch_views, paths)
+
+    async def copy_batch(self, pairs: Sequence[tuple[_AnyPath, _AnyPath]]) -> int:
+        """Copy files in parallel (async)."""
+        return await self._run(self._sync.copy_batch, pairs)
+
+    async def read_batch_into(self, paths: Sequence[_AnyPath], out_dir: _AnyPath) -> int:
+        """Copy multiple files into a directory, preserving their layout (async)."""
+        return await self._run(self._sync.read_batch_into, paths, out_dir)
+
+    async def read_file_view(self, path: _AnyPath) -> memoryview:
+        """Memory-map a file and return a zero-copy view of its bytes (async)."""
+        return await self._run(self._sync.read_file_view, path)
 
     async def read_lines(
-        self, path: str, start_line: int = 0, count: int | None = None
-    ) -> list[str]:
+        self, path: _AnyPath, start_line: int = 0, count: int | None = None
+    ) -> builtins.list[str]:
         """Read specific lines from a file (async).
 
         Args:
@@ -560,39 +1168,39 @@ class AsyncFileSystem:
         Returns:
             List of line strings (without trailing newlines).
         """
-        import asyncio
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.read_lines, path, start_line, count)
 
-        return await asyncio.to_thread(self._sync.read_lines, path, start_line, count)
-
-    async def read_file_range(self, path: str, offset: int, limit: int) -> str:
+    async def read_file_range(self, path: _AnyPath, offset: int, limit: int) -> str:
         """Read a byte range from a file (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.read_file_range, path, offset, limit)
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.read_file_range, path, offset, limit)
 
-    async def write_file(self, path: str, content: str) -> bool:
+    async def write_file(self, path: _AnyPath, content: str) -> bool:
         """Write content to file atomically (async)."""
-        import asyncio
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.write_file, path, content)
 
-        return await asyncio.to_thread(self._sync.write_file, path, content)
-
-    async def write_file_fast(self, path: str, content: str) -> bool:
+    async def write_file_fast(self, path: _AnyPath, content: str) -> bool:
         """Write content to file without atomicity guarantee (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.write_file_fast, path, content)
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.write_file_fast, path, content)
 
     async def edit_replace(
         self,
-        path: str,
+        path: _AnyPath,
         old_text: str,
         new_text: str,
         strict: bool = True,
     ) -> bool:
         """Replace text in file (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.edit_replace, path, old_text, new_text, strict)
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.edit_replace, path, old_text, new_text, strict=strict)
 
     async def grep(
         self,
@@ -600,40 +1208,72 @@ class AsyncFileSystem:
         glob_pattern: str = "**/*",
         case_sensitive: bool = False,
         max_results: int = 1000,
-    ) -> list[SearchResult]:
+        before: int = 0,
+        after: int = 0,
+    ) -> builtins.list[SearchResult]:
         """Search files for content matching query (async)."""
-        import asyncio
+        if glob_pattern.startswith("/"):
+            return await self._run(
+                self._sync.grep, query, glob_pattern, case_sensitive, max_results, before, after
+            )
+        return await self._inner.grep_async(
+            query, glob_pattern, case_sensitive, max_results, before, after
+        )
 
-        return await asyncio.to_thread(
-            self._sync.grep, query, glob_pattern, case_sensitive, max_results
+    async def grep_any(
+        self,
+        query: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+    ) -> bool:
+        """Check whether any file matches query (async)."""
+        return await self._run(self._sync.grep_any, query, glob_pattern, case_sensitive)
+
+    async def grep_multi(
+        self,
+        queries: builtins.list[str],
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> dict[str, builtins.list[SearchResult]]:
+        """Search files for several literal strings in a single pass (async)."""
+        if glob_pattern.startswith("/"):
+            return await self._run(
+                self._sync.grep_multi, queries, glob_pattern, case_sensitive, max_results
+            )
+        return await self._inner.grep_multi_async(
+            queries, glob_pattern, case_sensitive, max_results
         )
 
-    async def get_metadata(self, path: str) -> FileMetadata:
+    async def get_metadata(self, path: _AnyPath) -> FileMetadata | dict[str, Any]:
         """Get file metadata (async)."""
-        import asyncio
+        path = os.fsdecode(path)
+        target = self._inner if self._is_within_root(path) else self._sync
+        return await self._run(target.get_metadata, path)
 
-        return await asyncio.to_thread(self._sync.get_metadata, path)
+    async def snapshot(self) -> FileSystemSnapshot:
+        """Take an immutable snapshot of the file index (async)."""
+        return await self._run(self._inner.snapshot)
 
     async def refresh(self) -> None:
         """Force refresh the file index (async)."""
-        import asyncio
-
-        return await asyncio.to_thread(self._sync.refresh)
+        return await self._run(self._inner.refresh)
 
     def is_ready(self) -> bool:
         """Check if the index is ready (sync - non-blocking)."""
-        return self._sync.is_ready()
+        return self._inner.is_ready()
 
     def is_watching(self) -> bool:
         """Check if file watching is active (sync - non-blocking)."""
-        return self._sync.is_watching()
+        return self._inner.is_watching()
 
     def close(self) -> None:
         """Close the filesystem and release resources."""
         self._sync.close()
+        self._executor.shutdown(wait=False)
 
     async def __aenter__(self) -> AsyncFileSystem:
         return self
 
-    async def __aexit__(self, *args) -> None:
+    async def __aexit__(self, *args: object) -> None:
         self.close()
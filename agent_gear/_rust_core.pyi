@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import builtins
+from collections.abc import Awaitable
+
 __version__: str
 
 class FileMetadata:
@@ -34,12 +37,20 @@ class SearchOptions:
     context_lines: int
     """Number of context lines before/after match."""
 
+    before_context: int | None
+    """Context lines before a match (overrides context_lines when set)."""
+
+    after_context: int | None
+    """Context lines after a match (overrides context_lines when set)."""
+
     def __init__(
         self,
         case_sensitive: bool = False,
         max_results: int = 1000,
         max_file_size: int = 10485760,
         context_lines: int = 0,
+        before_context: int | None = None,
+        after_context: int | None = None,
     ) -> None: ...
 
 class SearchResult:
@@ -60,6 +71,60 @@ class SearchResult:
     context_after: list[str]
     """Context lines after the match."""
 
+class FileSystemSnapshot:
+    """Immutable point-in-time copy of the file index."""
+
+    def list(self, pattern: str = "**/*", only_files: bool = True) -> list[str]:
+        """List files matching the given pattern.
+
+        Args:
+            pattern: Glob pattern (default: "**/*").
+            only_files: If True, only return files (not directories).
+
+        Returns:
+            List of file paths relative to root.
+        """
+
+    def glob(self, pattern: str) -> builtins.list[str]:
+        """Match files using glob pattern.
+
+        Args:
+            pattern: Glob pattern.
+
+        Returns:
+            List of matching file paths relative to root.
+        """
+
+    def get_metadata(self, path: str) -> FileMetadata:
+        """Get file metadata as of the snapshot.
+
+        Args:
+            path: File path (relative to root or absolute).
+
+        Returns:
+            FileMetadata object.
+        """
+
+    def __len__(self) -> int: ...
+
+class MmapFile:
+    """Read-only memory-mapped file supporting the buffer protocol."""
+
+    def __len__(self) -> int: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+
+class GrepIter:
+    """Iterator over grep results produced by a background search."""
+
+    def __iter__(self) -> GrepIter: ...
+    def __next__(self) -> SearchResult: ...
+
+class LinesIter:
+    """Iterator over the lines of a file."""
+
+    def __iter__(self) -> LinesIter: ...
+    def __next__(self) -> str: ...
+
 class FileSystem:
     """High-performance file system interface.
 
@@ -85,7 +150,21 @@ class FileSystem:
             List of file paths relative to root.
         """
 
-    def glob(self, pattern: str) -> list[str]:
+    def list_bytes(
+        self, pattern: str = "**/*", only_files: bool = True
+    ) -> tuple[bytes, builtins.list[int]]:
+        """List files matching the pattern as one NUL-separated buffer.
+
+        Args:
+            pattern: Glob pattern (default: "**/*").
+            only_files: If true, only return files (not directories).
+
+        Returns:
+            Tuple of (buffer, offsets) where path ``i`` is
+            ``buffer[offsets[i]:offsets[i + 1] - 1]``.
+        """
+
+    def glob(self, pattern: str) -> builtins.list[str]:
         """Match files using glob pattern.
 
         Args:
@@ -106,7 +185,7 @@ class FileSystem:
             File content as string.
         """
 
-    def read_batch(self, paths: list[str]) -> dict[str, str]:
+    def read_batch(self, paths: builtins.list[str]) -> dict[str, str]:
         """Read multiple files in parallel.
 
         Args:
@@ -116,12 +195,54 @@ class FileSystem:
             Dict mapping path to content.
         """
 
+    def read_batch_bytes(self, paths: builtins.list[str]) -> builtins.list[bytes | None]:
+        """Read multiple files in parallel as bytes.
+
+        Args:
+            paths: List of file paths.
+
+        Returns:
+            List of file contents in the same order as ``paths``
+            (None for files that could not be read).
+        """
+
+    def read_batch_concat(self, paths: builtins.list[str]) -> tuple[bytes, builtins.list[int]]:
+        """Read multiple files in parallel into one contiguous buffer.
+
+        Args:
+            paths: List of file paths.
+
+        Returns:
+            Tuple of (buffer, offsets) where file ``i`` is
+            ``buffer[offsets[i]:offsets[i + 1]]``.
+        """
+
+    def copy_batch(self, pairs: builtins.list[tuple[str, str]]) -> int:
+        """Copy files in parallel using in-kernel copies where available.
+
+        Args:
+            pairs: List of (source, destination) path pairs.
+
+        Returns:
+            Total number of bytes copied.
+        """
+
+    def read_file_view(self, path: str) -> MmapFile:
+        """Memory-map a file for zero-copy reading.
+
+        Args:
+            path: File path (relative to root or absolute).
+
+        Returns:
+            MmapFile supporting the buffer protocol (wrap in memoryview).
+        """
+
     def read_lines(
         self,
         path: str,
         start_line: int = 0,
         count: int | None = None,
-    ) -> list[str]:
+    ) -> builtins.list[str]:
         """Read specific lines from a file (for large files).
 
         Args:
@@ -133,6 +254,23 @@ class FileSystem:
             List of line strings (without trailing newlines).
         """
 
+    def read_lines_iter(
+        self,
+        path: str,
+        start_line: int = 0,
+        count: int | None = None,
+    ) -> LinesIter:
+        """Iterate over lines of a file without building a list.
+
+        Args:
+            path: File path.
+            start_line: Starting line number (0-indexed).
+            count: Number of lines to yield (None = read to end).
+
+        Returns:
+            Iterator of line strings (without trailing newlines).
+        """
+
     def read_file_range(
         self,
         path: str,
@@ -197,7 +335,9 @@ class FileSystem:
         glob_pattern: str = "**/*",
         case_sensitive: bool = False,
         max_results: int = 1000,
-    ) -> list[SearchResult]:
+        before: int = 0,
+        after: int = 0,
+    ) -> builtins.list[SearchResult]:
         """Search files for content matching query.
 
         Args:
@@ -205,11 +345,51 @@ class FileSystem:
             glob_pattern: File pattern to search in.
             case_sensitive: Case sensitive search.
             max_results: Maximum number of results.
+            before: Context lines to attach before each match.
+            after: Context lines to attach after each match.
 
         Returns:
             List of SearchResult objects.
         """
 
+    def grep_iter(
+        self,
+        query: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> GrepIter:
+        """Search files lazily, yielding results as they are found.
+
+        Args:
+            query: Search pattern (regex).
+            glob_pattern: File pattern to search in.
+            case_sensitive: Case sensitive search.
+            max_results: Maximum number of results.
+
+        Returns:
+            Iterator of SearchResult objects (in no particular order).
+        """
+
+    def grep_multi(
+        self,
+        queries: builtins.list[str],
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> dict[str, builtins.list[SearchResult]]:
+        """Search files for several literal strings in a single pass.
+
+        Args:
+            queries: Literal strings to search for (not regexes).
+            glob_pattern: File pattern to search in.
+            case_sensitive: Case sensitive search (ASCII-only folding otherwise).
+            max_results: Maximum number of results per query.
+
+        Returns:
+            Dict mapping each query to its list of SearchResult objects.
+        """
+
     def get_metadata(self, path: str) -> FileMetadata:
         """Get file metadata.
 
@@ -220,18 +400,82 @@ class FileSystem:
             FileMetadata object.
         """
 
+    def snapshot(self) -> FileSystemSnapshot:
+        """Take an immutable snapshot of the file index.
+
+        Returns:
+            FileSystemSnapshot of the current index.
+        """
+
     def refresh(self) -> None:
         """Force refresh the file index."""
 
+    def simd_backend(self) -> str:
+        """Report the SIMD instruction set used by the search routines.
+
+        Returns:
+            "avx2", "sse2", "neon" or "none".
+        """
+
     def is_ready(self) -> bool:
         """Check if the index is ready."""
 
+    def wait_ready(self, timeout: float = 30.0) -> bool:
+        """Block until the index is ready.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the index is ready, False if the timeout was reached.
+        """
+
+    def wait_ready_async(self, timeout: float = 30.0) -> Awaitable[bool]:
+        """Wait for the index to be ready without blocking the event loop."""
+
+    def list_async(
+        self, pattern: str = "**/*", only_files: bool = True
+    ) -> Awaitable[builtins.list[str]]:
+        """List files from the memory index, returning an awaitable."""
+
+    def glob_async(self, pattern: str) -> Awaitable[builtins.list[str]]:
+        """Match files using glob pattern, returning an awaitable."""
+
+    def read_file_async(self, path: str, encoding: str = "utf-8") -> Awaitable[str]:
+        """Read a single file, returning an awaitable."""
+
+    def read_batch_async(self, paths: builtins.list[str]) -> Awaitable[dict[str, str]]:
+        """Read multiple files in parallel, returning an awaitable."""
+
+    def grep_async(
+        self,
+        query: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+        before: int = 0,
+        after: int = 0,
+    ) -> Awaitable[builtins.list[SearchResult]]:
+        """Search files for content matching query, returning an awaitable."""
+
     def is_watching(self) -> bool:
         """Check if file watching is active."""
 
+    def generation(self) -> int:
+        """Get the index generation, which changes whenever paths are added or removed."""
+
     def pending_changes(self) -> int:
         """Get the number of pending file change events."""
 
+    def grep_multi_async(
+        self,
+        queries: builtins.list[str],
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+    ) -> Awaitable[dict[str, builtins.list[SearchResult]]]:
+        """Search files for several literal strings, returning an awaitable."""
+
     def close(self) -> None:
         """Close the filesystem and release resources."""
 
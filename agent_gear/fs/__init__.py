@@ -7,6 +7,8 @@ for convenience.
 from agent_gear import (
     FileMetadata,
     FileSystem,
+    FileSystemSnapshot,
+    PathList,
     SearchOptions,
     SearchResult,
 )
@@ -14,6 +16,8 @@ from agent_gear import (
 __all__ = [
     "FileSystem",
     "FileMetadata",
+    "FileSystemSnapshot",
+    "PathList",
     "SearchOptions",
     "SearchResult",
 ]
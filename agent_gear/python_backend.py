@@ -7,10 +7,331 @@ functions for all operations.
 
 from __future__ import annotations
 
-import fnmatch
+import functools
+import itertools
+import mmap
 import os
 import re
+import stat
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Literal
+
+# Files at least this large are decoded from an mmap instead of a read buffer
+_MMAP_READ_THRESHOLD = 1 << 20
+
+# os.open flags; descriptors are non-inheritable by default, and O_BINARY
+# stops Windows from translating newlines on raw reads
+_O_READ = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_O_WRITE = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Characters that make a glob segment a pattern rather than a literal name
+_GLOB_MAGIC = re.compile(r"[*?\[]")
+
+# Tokens whose meaning depends on what surrounds a line, so searching the
+# whole file at once could miss a match that the per-line search finds.
+# Atomic groups and possessive quantifiers belong here too: they can consume
+# a newline and then refuse to backtrack out of it
+_LINE_SENSITIVE_TOKENS = (
+    "^",
+    "$",
+    "\\A",
+    "\\Z",
+    "(?<",
+    "(?=",
+    "(?!",
+    "(?>",
+    "*+",
+    "++",
+    "?+",
+    "}+",
+)
+
+# Regex metacharacters; a pattern without any of them is a plain literal
+_REGEX_META = frozenset(".^$*+?()[]{}|\\")
+
+# Walks grep keeps for reuse; the cache is simply cleared when full
+_GREP_FILES_CACHE_SIZE = 32
+
+# Shortest literal worth a pre-scan; shorter ones match almost every file
+_MIN_LITERAL_LEN = 4
+
+# Escapes that stand for a class or an assertion rather than a character
+_CLASS_ESCAPES = frozenset("dDwWsSbBAZ")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, case_sensitive: bool) -> re.Pattern[str]:
+    """Compile a grep pattern, reusing the result for repeated queries.
+
+    Raises:
+        ValueError: If pattern is not a valid regex.
+    """
+    try:
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}") from e
+
+
+@functools.lru_cache(maxsize=256)
+def _required_literal(pattern: str) -> str | None:
+    """Find the longest literal every match of a regex must contain.
+
+    A conservative scan: patterns with alternation, groups or numeric escapes
+    are rejected, character classes and escapes like \\d break a literal run,
+    and a character followed by ``?``, ``*`` or ``{`` is treated as optional.
+
+    Args:
+        pattern: Regex source.
+
+    Returns:
+        The literal, or None if none of at least _MIN_LITERAL_LEN chars exists.
+    """
+    if "|" in pattern or "(" in pattern:
+        return None
+    runs: list[str] = []
+    run: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            run.append(pattern[i + 1])
+            i += 2
+            continue
+        if ch in "?*{":
+            if run:
+                run.pop()
+            if ch == "{":
+                i = pattern.find("}", i)
+                if i == -1:
+                    return None
+        elif ch == "[":
+            # Skip the class; "]" right after "[" or "[^" is a literal member
+            i += 2 if pattern.startswith("[^", i) else 1
+            if pattern.startswith("]", i):
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif ch == "\\":
+            if pattern[i + 1 : i + 2] not in _CLASS_ESCAPES:
+                return None
+            i += 1
+        elif ch in ".^$+)}]":
+            pass
+        else:
+            run.append(ch)
+            i += 1
+            continue
+        runs.append("".join(run))
+        run = []
+        i += 1
+    runs.append("".join(run))
+    literal = max(runs, key=len)
+    return literal if len(literal) >= _MIN_LITERAL_LEN else None
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment into a regex that never matches "/"."""
+    out: list[str] = []
+    i = 0
+    while i < len(segment):
+        ch = segment[i]
+        i += 1
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            # "]" right after "[" or "[!" is a class member, as in fnmatch
+            j = i + 1 if segment[i : i + 1] == "!" else i
+            j = segment.find("]", j + 1 if segment[j : j + 1] == "]" else j)
+            if j == -1:
+                out.append(re.escape(ch))
+                continue
+            body = segment[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            out.append(f"(?!/)[{body}]")
+        else:
+            out.append(re.escape(ch))
+    return "".join(out)
+
+
+# A compiled glob segment: "**", "..", a literal name, or a name predicate
+type _GlobSegment = str | Callable[[str], object]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> tuple[tuple[_GlobSegment, ...], bool]:
+    """Compile a pathlib-style glob into per-segment matchers.
+
+    Follows Path.glob: ``**`` as a whole segment matches any number of
+    directories, ``*``, ``?`` and ``[...]`` never match "/", and a trailing
+    "/" makes the pattern match directories only.
+
+    Args:
+        pattern: Glob relative to the base directory.
+
+    Returns:
+        Tuple of (segments, whether the last segment must be a directory).
+        Literal names stay plain strings; other segments become predicates
+        over an entry name.
+    """
+    dir_terminated = pattern.endswith("/")
+    segments: list[_GlobSegment] = []
+    for segment in pattern.split("/"):
+        if segment in ("", "."):
+            continue
+        if segment in ("**", "..") or (not _GLOB_MAGIC.search(segment) and os.name != "nt"):
+            segments.append(segment)
+        elif segment.startswith("*") and not _GLOB_MAGIC.search(segment[1:]) and os.name != "nt":
+            segments.append(_suffix_matcher(segment[1:]))
+        else:
+            flags = re.IGNORECASE if os.name == "nt" else 0
+            segments.append(re.compile(_translate_segment(segment), flags).fullmatch)
+    return tuple(segments), dir_terminated
+
+
+def _suffix_matcher(suffix: str) -> Callable[[str], bool]:
+    """Match "*.py"-style segments with str.endswith, faster than the regex."""
+    return lambda name: name.endswith(suffix)
+
+
+def _glob_select(
+    directory: str,
+    segments: tuple[_GlobSegment, ...],
+    dir_terminated: bool,
+    dir_stamps: list[tuple[str, int]] | None,
+) -> Iterator[tuple[str, os.DirEntry[str] | None]]:
+    """Yield (path, entry) for everything below directory matching segments.
+
+    Walks only the directories the pattern can reach, with one scandir per
+    directory. Like Path.glob, symlinked directories are followed when a
+    segment names them, but not while descending through ``**``. entry is
+    None for paths reached without scanning their parent. If dir_stamps is
+    given, each scanned directory (and each literal path probed) is recorded
+    with its mtime, taken before it is read, so a later change to the
+    listing can be detected.
+    """
+    if not segments:
+        yield directory, None
+        return
+    segment, rest = segments[0], segments[1:]
+    dironly = bool(rest) or dir_terminated
+
+    if segment == "..":
+        yield from _glob_select(os.path.join(directory, ".."), rest, dir_terminated, dir_stamps)
+        return
+
+    if segment == "**":
+        while rest[:1] == ("**",):
+            rest = rest[1:]
+        if rest[:1] == ("..",):
+            for start in _glob_select(directory, ("**",), False, dir_stamps):
+                yield from _glob_select(start[0], rest, dir_terminated, dir_stamps)
+            return
+        if not rest:
+            # A trailing "**" matches the directory it starts from
+            yield directory, None
+        # Walk the tree once, testing each entry against the segment after
+        # "**" on the same scan that finds the directories to descend into
+        head = rest[0] if rest else None
+        head_dironly = len(rest) > 1 or dir_terminated
+        stack = [directory]
+        while stack:
+            for entry in _scandir(stack.pop(), dir_stamps):
+                if head is not None and (
+                    entry.name == head if isinstance(head, str) else head(entry.name)
+                ):
+                    if not head_dironly:
+                        yield entry.path, entry
+                    elif entry.is_dir():
+                        yield from _glob_select(entry.path, rest[1:], dir_terminated, dir_stamps)
+                if entry.is_dir(follow_symlinks=False):
+                    if head is None:
+                        yield entry.path, entry
+                    stack.append(entry.path)
+        return
+
+    if isinstance(segment, str):
+        # A literal name needs one stat rather than a scan of the directory
+        path = os.path.join(directory, segment)
+        if dir_stamps is not None:
+            dir_stamps.append((path, _mtime_ns(path)))
+        if os.path.isdir(path) if dironly else os.path.lexists(path):
+            yield from _glob_select(path, rest, dir_terminated, dir_stamps)
+        return
+
+    for entry in _scandir(directory, dir_stamps):
+        if not segment(entry.name):
+            continue
+        if not dironly:
+            yield entry.path, entry
+        elif entry.is_dir():
+            yield from _glob_select(entry.path, rest, dir_terminated, dir_stamps)
+
+
+def _scandir(directory: str, dir_stamps: list[tuple[str, int]] | None) -> list[os.DirEntry[str]]:
+    """List a directory's entries, or none if it cannot be read."""
+    if dir_stamps is not None:
+        dir_stamps.append((directory, _mtime_ns(directory)))
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _mtime_ns(path: str) -> int:
+    """Return a path's mtime in nanoseconds, or -1 if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write data to a descriptor straight from the buffer.
+
+    Bypasses the buffered text I/O stack, so the encoded bytes are the only
+    copy of the content; a short write resumes from a memoryview slice.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """Stat a path with one syscall, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    """Read up to size bytes at offset without moving the file position.
+
+    Falls back to lseek + read where os.pread is missing (Windows).
+    """
+    chunks = []
+    while size > 0:
+        if hasattr(os, "pread"):
+            chunk = os.pread(fd, size, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            chunk = os.read(fd, size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+        offset += len(chunk)
+    return b"".join(chunks)
 
 
 class PythonFileBackend:
@@ -22,6 +343,14 @@ class PythonFileBackend:
     All methods accept absolute paths and perform operations directly on the filesystem.
     """
 
+    # Extensions grep skips without opening the file
+    _BINARY_EXTS = frozenset(
+        {".bin", ".png", ".jpg", ".jpeg", ".gif", ".pdf", ".zip", ".gz", ".so", ".o", ".pyc"}
+    )
+
+    # Leading bytes checked for NUL to detect binary files
+    _PROBE_SIZE = 512
+
     def __init__(self, max_file_size_mb: int = 10) -> None:
         """Initialize the Python file backend.
 
@@ -29,6 +358,34 @@ class PythonFileBackend:
             max_file_size_mb: Maximum file size in MB for search operations.
         """
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        # Shared by read_batch() and grep() so calls don't each build a pool;
+        # threads are only started once work is submitted
+        self._pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="agent-gear-external")
+        self._closed = False
+        # (path, glob) -> (directory mtimes seen by the walk, matching files)
+        self._grep_files_cache: dict[
+            tuple[str, str], tuple[tuple[tuple[str, int], ...], list[str]]
+        ] = {}
+
+    def close(self) -> None:
+        """Shut down the backend's thread pool without waiting for it.
+
+        The backend stays usable afterwards, like the Rust side of a closed
+        FileSystem; batch reads and grep just run serially on the caller.
+        """
+        self._closed = True
+        self._pool.shutdown(wait=False)
+
+    def _submit[T](self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """Run fn on the shared pool, or inline once the backend is closed."""
+        if not self._closed:
+            return self._pool.submit(fn, *args)
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
 
     def read_file(self, path: str, encoding: str = "utf-8") -> str:
         """Read entire file content.
@@ -44,12 +401,93 @@ class PythonFileBackend:
             FileNotFoundError: If file does not exist.
             IOError: If file cannot be read.
         """
-        file_path = Path(path)
-        if not file_path.exists():
+        st = _stat_or_none(path)
+        if st is None:
             raise FileNotFoundError(f"File not found: {path}")
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {path}")
-        return file_path.read_text(encoding=encoding)
+        if st.st_size < _MMAP_READ_THRESHOLD:
+            with open(path, encoding=encoding) as f:
+                return f.read()
+
+        # Decode straight from the mapped pages, skipping the copy into bytes
+        with open(path, "rb") as raw, mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, encoding)
+        # Match read_text()'s universal newline translation
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def read_batch(self, paths: list[str], encoding: str = "utf-8") -> dict[str, str]:
+        """Read multiple files concurrently, skipping unreadable ones.
+
+        Reads run on the backend's shared thread pool so their syscalls overlap.
+
+        Args:
+            paths: Absolute file paths.
+            encoding: Text encoding (default: utf-8).
+
+        Returns:
+            Dict mapping path to content for the files that could be read.
+        """
+        if len(paths) <= 1 or self._closed:
+            contents = [self.try_read_file(p, encoding) for p in paths]
+        else:
+            contents = list(self._pool.map(self.try_read_file, paths, itertools.repeat(encoding)))
+        return {p: c for p, c in zip(paths, contents, strict=True) if c is not None}
+
+    def try_read_file(self, path: str, encoding: str = "utf-8") -> str | None:
+        """Read file content, returning None if it cannot be read.
+
+        Args:
+            path: Absolute file path.
+            encoding: Text encoding (default: utf-8).
+
+        Returns:
+            File content, or None for missing, unreadable or undecodable files.
+        """
+        # One open, one fstat and one read per small file, where read_file()
+        # spends three stat calls before read_text() opens and stats again;
+        # large files keep read_file()'s mmap path
+        try:
+            fd = os.open(path, _O_READ)
+        except OSError:
+            return None
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            if st.st_size >= _MMAP_READ_THRESHOLD:
+                return self.read_file(path, encoding)
+            chunks = []
+            while chunk := os.read(fd, st.st_size + 1):
+                chunks.append(chunk)
+            text = b"".join(chunks).decode(encoding)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+        # Match read_text()'s universal newline translation
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def read_file_view(self, path: str) -> memoryview:
+        """Memory-map a file and return a read-only view of it.
+
+        Args:
+            path: Absolute file path.
+
+        Returns:
+            memoryview over the file contents.
+        """
+        if _stat_or_none(path) is None:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")  # empty files cannot be mapped
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
 
     def read_lines(
         self,
@@ -69,19 +507,48 @@ class PythonFileBackend:
         Returns:
             List of line strings (without trailing newlines).
         """
-        file_path = Path(path)
-        if not file_path.exists():
+        if _stat_or_none(path) is None:
             raise FileNotFoundError(f"File not found: {path}")
 
-        lines: list[str] = []
-        with open(file_path, encoding=encoding) as f:
-            for i, line in enumerate(f):
-                if i < start_line:
-                    continue
-                if count is not None and len(lines) >= count:
-                    break
-                lines.append(line.rstrip("\n\r"))
-        return lines
+        start_line = max(start_line, 0)
+        with open(path, encoding=encoding) as f:
+            if start_line == 0 and count is None:
+                # Whole file: one read and one split, both in C; newlines are
+                # already translated to "\n" by the text layer
+                lines = f.read().split("\n")
+                if lines[-1] == "":
+                    lines.pop()
+                return lines
+            # islice skips and stops in C, so only the requested lines reach
+            # the interpreter loop
+            stop = None if count is None else start_line + max(count, 0)
+            return [line.rstrip("\n\r") for line in itertools.islice(f, start_line, stop)]
+
+    def iter_lines(
+        self,
+        path: str,
+        start_line: int = 0,
+        count: int | None = None,
+        encoding: str = "utf-8",
+    ) -> Iterator[str]:
+        """Lazily yield specific lines from a file.
+
+        Args:
+            path: Absolute file path.
+            start_line: Starting line number (0-indexed).
+            count: Number of lines to yield (None = read to end).
+            encoding: Text encoding.
+
+        Yields:
+            Line strings (without trailing newlines).
+        """
+        if _stat_or_none(path) is None:
+            raise FileNotFoundError(f"File not found: {path}")
+
+        stop = None if count is None else start_line + count
+        with open(path, encoding=encoding) as f:
+            for line in itertools.islice(f, start_line, stop):
+                yield line.rstrip("\n\r")
 
     def read_file_range(
         self,
@@ -101,43 +568,66 @@ class PythonFileBackend:
         Returns:
             Content as string.
         """
-        file_path = Path(path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        with open(file_path, "rb") as f:
-            f.seek(offset)
-            data = f.read(limit)
+        # A single positioned read, without a stat or a buffered reader
+        try:
+            fd = os.open(path, _O_READ)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        try:
+            if limit < 0:
+                limit = max(os.fstat(fd).st_size - offset, 0)
+            data = _pread(fd, limit, offset)
+        finally:
+            os.close(fd)
         return data.decode(encoding)
 
-    def write_file(self, path: str, content: str, encoding: str = "utf-8") -> bool:
+    def write_file(
+        self,
+        path: str,
+        content: str,
+        encoding: str = "utf-8",
+        durability: Literal["none", "fsync", "fdatasync"] = "fdatasync",
+    ) -> bool:
         """Write content to file atomically (using temp file + rename).
 
         Args:
             path: Absolute file path.
             content: Content to write.
             encoding: Text encoding.
+            durability: How the temp file is flushed before the rename:
+                "fdatasync" syncs the data only, "fsync" also syncs the
+                metadata, and "none" leaves flushing to the OS for callers
+                that handle durability themselves.
 
         Returns:
             True if successful.
+
+        Raises:
+            ValueError: If durability is not a known mode.
         """
+        if durability not in ("none", "fsync", "fdatasync"):
+            raise ValueError(f"Unknown durability mode: {durability!r}")
         file_path = Path(path)
+        data = content.encode(encoding)
 
         # Create parent directories if needed
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to temp file first, then rename for atomicity
+        # Write to temp file first, then rename for atomicity; the sync goes
+        # through the descriptor the data was written with
         temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
         try:
-            temp_path.write_text(content, encoding=encoding)
-            # fsync to ensure data is on disk
-            fd = os.open(str(temp_path), os.O_RDONLY)
+            fd = os.open(temp_path, _O_WRITE, 0o666)
             try:
-                os.fsync(fd)
+                _write_all(fd, data)
+                if durability == "fdatasync" and hasattr(os, "fdatasync"):
+                    os.fdatasync(fd)
+                elif durability != "none":
+                    os.fsync(fd)
             finally:
                 os.close(fd)
             # Atomic rename
-            temp_path.rename(file_path)
+            os.replace(temp_path, file_path)
             return True
         except Exception:
             if temp_path.exists():
@@ -156,8 +646,13 @@ class PythonFileBackend:
             True if successful.
         """
         file_path = Path(path)
+        data = content.encode(encoding)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding=encoding)
+        fd = os.open(file_path, _O_WRITE, 0o666)
+        try:
+            _write_all(fd, data)
+        finally:
+            os.close(fd)
         return True
 
     def edit_replace(
@@ -183,22 +678,27 @@ class PythonFileBackend:
         Raises:
             ValueError: If strict mode and text not found or not unique.
         """
-        file_path = Path(path)
-        if not file_path.exists():
+        if _stat_or_none(path) is None:
             raise FileNotFoundError(f"File not found: {path}")
 
-        content = file_path.read_text(encoding=encoding)
-        count = content.count(old_text)
+        with open(path, encoding=encoding) as f:
+            content = f.read()
+        first = content.find(old_text)
 
-        if count == 0:
+        if first < 0:
             if strict:
                 raise ValueError(f"Text not found in file: {path}")
             return False
 
-        if count > 1 and strict:
+        # Uniqueness only needs a search past the first match; the full count
+        # is taken just for the error message. An empty old_text matches at
+        # every position, hence the step of at least one.
+        end = first + len(old_text)
+        if strict and content.find(old_text, end or 1) >= 0:
+            count = content.count(old_text)
             raise ValueError(f"Text found {count} times in file (must be unique): {path}")
 
-        new_content = content.replace(old_text, new_text, 1)
+        new_content = content[:first] + new_text + content[end:]
         return self.write_file(path, new_content, encoding)
 
     def list_files(
@@ -217,20 +717,48 @@ class PythonFileBackend:
         Returns:
             List of absolute file paths.
         """
-        base_path = Path(path)
-        if not base_path.exists() or not base_path.is_dir():
+        return self._walk_files(path, pattern, only_files)
+
+    def _walk_files(
+        self,
+        path: str,
+        pattern: str,
+        only_files: bool,
+        dir_stamps: list[tuple[str, int]] | None = None,
+    ) -> list[str]:
+        """Implement list_files(), optionally recording directory mtimes.
+
+        See _glob_select() for dir_stamps; the base path is always recorded,
+        so a listing that found nothing is invalidated once the path appears.
+        """
+        if dir_stamps is not None:
+            dir_stamps.append((path, _mtime_ns(path)))
+        st = _stat_or_none(path)
+        if st is None or not stat.S_ISDIR(st.st_mode):
             return []
 
         # Handle pattern
         if pattern.startswith("/"):
             pattern = pattern.lstrip("/")
+        if not pattern:
+            return []
+
+        segments, dir_terminated = _compile_glob(pattern)
+        if not segments:
+            return []
+        # Patterns ending in "/" or "**" only ever match directories
+        if only_files and (dir_terminated or segments[-1] == "**"):
+            return []
 
         results: list[str] = []
-        for matched_path in base_path.glob(pattern):
-            if only_files and not matched_path.is_file():
+        for match, entry in _glob_select(str(Path(path)), segments, dir_terminated, dir_stamps):
+            if only_files and not (entry.is_file() if entry else os.path.isfile(match)):
                 continue
-            results.append(str(matched_path))
+            results.append(match)
 
+        # Non-adjacent "**" segments can reach the same path more than once
+        if segments.count("**") > 1:
+            results = list(dict.fromkeys(results))
         results.sort()
         return results
 
@@ -248,68 +776,215 @@ class PythonFileBackend:
 
     def grep(
         self,
-        pattern: str,
+        pattern: str | re.Pattern[str],
         path: str,
         glob_pattern: str = "**/*",
         case_sensitive: bool = False,
         max_results: int = 1000,
-    ) -> list[dict]:
+        before: int = 0,
+        after: int = 0,
+    ) -> list[dict[str, Any]]:
         """Search files for content matching pattern.
 
         Args:
-            pattern: Regex search pattern.
+            pattern: Regex search pattern, or a compiled pattern (whose own
+                flags then apply instead of case_sensitive).
             path: Base directory to search in.
             glob_pattern: File pattern to search in.
             case_sensitive: Case sensitive search.
             max_results: Maximum number of results.
+            before: Context lines to attach before each match.
+            after: Context lines to attach after each match.
 
         Returns:
             List of dicts with 'file', 'line_number', 'content' keys.
         """
-        try:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            regex = re.compile(pattern, flags)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}") from e
-
-        base_path = Path(path)
-        if not base_path.exists():
-            return []
+        rows = self.grep_iter(
+            pattern, path, glob_pattern, case_sensitive, max_results, before, after
+        )
+        return [
+            {
+                "file": file,
+                "line_number": line_number,
+                "content": content,
+                "context_before": context_before,
+                "context_after": context_after,
+            }
+            for file, line_number, content, context_before, context_after in rows
+        ]
+
+    def grep_iter(
+        self,
+        pattern: str | re.Pattern[str],
+        path: str,
+        glob_pattern: str = "**/*",
+        case_sensitive: bool = False,
+        max_results: int = 1000,
+        before: int = 0,
+        after: int = 0,
+    ) -> Iterator[tuple[str, int, str, list[str], list[str]]]:
+        """Search files lazily, yielding each match as it is found.
 
-        results: list[dict] = []
-        files = self.list_files(path, glob_pattern, only_files=True)
+        Takes the same arguments as grep(); files are only read as the
+        iterator is consumed. Matches are plain tuples rather than grep()'s
+        dicts, so callers that build their own objects skip an allocation
+        per match.
 
-        for file_path in files:
-            if len(results) >= max_results:
-                break
+        Yields:
+            (file, line_number, content, context_before, context_after)
+            tuples.
 
-            fp = Path(file_path)
-            try:
-                if fp.stat().st_size > self.max_file_size_bytes:
+        Raises:
+            ValueError: If pattern is not a valid regex (on first iteration).
+        """
+        if isinstance(pattern, re.Pattern):
+            regex = pattern
+        else:
+            regex = _compile_pattern(pattern, case_sensitive)
+
+        if _stat_or_none(path) is None:
+            return
+
+        # Files without a literal every match needs are skipped with a plain
+        # bytes search (memmem) before any decoding or regex work
+        literal = _required_literal(regex.pattern)
+        if regex.flags & re.VERBOSE or (
+            literal is not None
+            and regex.flags & re.IGNORECASE
+            and literal.lower() != literal.upper()
+        ):
+            literal = None
+        needle = literal.encode() if literal is not None else None
+        # A pattern that is entirely literal is matched with str containment,
+        # which skips the regex engine altogether
+        plain: str | None = regex.pattern
+        if (
+            regex.flags & re.VERBOSE
+            or any(ch in _REGEX_META for ch in regex.pattern)
+            or (regex.flags & re.IGNORECASE and regex.pattern.lower() != regex.pattern.upper())
+        ):
+            plain = None
+        # Without anchors, lookarounds or backtracking barriers, a line can
+        # only match if the whole file does, so one search in C rules out
+        # most files before the line-by-line loop
+        whole_file = not any(token in regex.pattern for token in _LINE_SENSITIVE_TOKENS)
+
+        files = self._grep_files(path, glob_pattern)
+        window = 2 * min(8, len(files))
+        if max_results <= 0 or not window:
+            return
+
+        # Reads run on the shared pool so they overlap, with a bounded window
+        # of files in flight; decoding and matching hold the GIL anyway, so
+        # they stay on this thread and consume the reads in file order
+        found = 0
+        remaining = iter(files)
+        pending = deque(
+            self._submit(self._read_candidate, f, needle)
+            for f in itertools.islice(remaining, window)
+        )
+        try:
+            for file_path in files:
+                data = pending.popleft().result()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    pending.append(self._submit(self._read_candidate, next_file, needle))
+                if data is None:
+                    continue
+                try:
+                    content = str(data, "utf-8")
+                except UnicodeDecodeError:
+                    continue
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+                if plain is not None:
+                    if plain not in content:
+                        continue
+                elif whole_file and regex.search(content) is None:
                     continue
-            except OSError:
-                continue
-
-            try:
-                content = fp.read_text()
-            except (UnicodeDecodeError, PermissionError, OSError):
-                continue
 
-            for line_num, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    results.append({
-                        "file": file_path,
-                        "line_number": line_num,
-                        "content": line,
-                        "context_before": [],
-                        "context_after": [],
-                    })
-                    if len(results) >= max_results:
-                        break
+                lines = content.splitlines()
+                if plain is not None:
+                    hits = ((n, line) for n, line in enumerate(lines, 1) if plain in line)
+                else:
+                    hits = ((n, line) for n, line in enumerate(lines, 1) if regex.search(line))
+                for line_num, line in hits:
+                    yield (
+                        file_path,
+                        line_num,
+                        line,
+                        lines[max(line_num - 1 - before, 0) : line_num - 1],
+                        lines[line_num : line_num + after],
+                    )
+                    found += 1
+                    if found >= max_results:
+                        return
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _grep_files(self, path: str, glob_pattern: str) -> list[str]:
+        """List the files grep searches, reusing an earlier walk if possible.
+
+        Adding, removing or renaming an entry bumps its directory's mtime, so
+        a cached listing stays valid while every directory the walk visited
+        still has the mtime recorded for it; checking that costs one stat per
+        directory instead of a scandir per directory and a match per entry.
 
-        return results
+        Returns:
+            Matching file paths; the list is shared with the cache and must
+            not be modified.
+        """
+        key = (path, glob_pattern)
+        cached = self._grep_files_cache.get(key)
+        if cached is not None and all(_mtime_ns(d) == mtime for d, mtime in cached[0]):
+            return cached[1]
+        dir_stamps: list[tuple[str, int]] = []
+        files = self._walk_files(path, glob_pattern, True, dir_stamps)
+        if len(self._grep_files_cache) >= _GREP_FILES_CACHE_SIZE:
+            self._grep_files_cache.clear()
+        self._grep_files_cache[key] = (tuple(dir_stamps), files)
+        return files
+
+    def _read_candidate(self, file_path: str, needle: bytes | None) -> bytes | mmap.mmap | None:
+        """Read a file for grep.
+
+        Binary files are rejected by extension or by a NUL byte in the first
+        _PROBE_SIZE bytes, before the rest of the file is read. Files of at
+        least _MMAP_READ_THRESHOLD bytes are mapped instead of copied, so the
+        literal search runs over the page cache and a non-matching file never
+        becomes a Python object.
 
-    def get_metadata(self, path: str) -> dict:
+        Returns:
+            File bytes or an open read-only mapping the caller must close, or
+            None if the file is binary, too large, unreadable or lacks the
+            required literal.
+        """
+        if os.path.splitext(file_path)[1].lower() in self._BINARY_EXTS:
+            return None
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.max_file_size_bytes:
+                    return None
+                head = f.read(self._PROBE_SIZE)
+                if b"\x00" in head:
+                    return None
+                data: bytes | mmap.mmap
+                if size < _MMAP_READ_THRESHOLD:
+                    data = head + f.read()
+                else:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if needle is not None and data.find(needle) == -1:
+            if isinstance(data, mmap.mmap):
+                data.close()
+            return None
+        return data
+
+    def get_metadata(self, path: str) -> dict[str, Any]:
         """Get file metadata.
 
         Args:
@@ -318,26 +993,26 @@ class PythonFileBackend:
         Returns:
             Dict with size, mtime, is_dir, is_binary keys.
         """
-        file_path = Path(path)
-        if not file_path.exists():
+        st = _stat_or_none(path)
+        if st is None:
             raise FileNotFoundError(f"File not found: {path}")
+        is_dir = stat.S_ISDIR(st.st_mode)
 
-        stat = file_path.stat()
-        is_dir = file_path.is_dir()
-
-        # Simple binary detection: check for null bytes in first 512 bytes
+        # Simple binary detection: check for null bytes in the first bytes
         is_binary = False
         if not is_dir:
             try:
-                with open(file_path, "rb") as f:
-                    chunk = f.read(512)
-                    is_binary = b"\x00" in chunk
-            except (OSError, PermissionError):
+                fd = os.open(path, _O_READ)
+                try:
+                    is_binary = b"\x00" in _pread(fd, self._PROBE_SIZE, 0)
+                finally:
+                    os.close(fd)
+            except OSError:
                 pass
 
         return {
-            "size": stat.st_size,
-            "mtime": stat.st_mtime,
+            "size": st.st_size,
+            "mtime": st.st_mtime,
             "is_dir": is_dir,
             "is_binary": is_binary,
         }
@@ -6,10 +6,11 @@
 use dashmap::DashMap;
 use globset::{Glob, GlobMatcher};
 use pyo3::prelude::*;
+use std::collections::HashMap;
 use std::path::{Path, PathBuf};
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::RwLock;
-use std::time::SystemTime;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Arc, Condvar, Mutex, RwLock};
+use std::time::{Duration, SystemTime};
 
 use crate::utils::error::{AgentGearError, Result};
 
@@ -19,6 +20,9 @@ const GLOB_CACHE_SIZE: usize = 128;
 /// Threshold for using parallel iteration (below this, serial is faster)
 const PARALLEL_ITER_THRESHOLD: usize = 500;
 
+/// How long a listing waits for an index build in progress before giving up
+const READY_GATE_TIMEOUT: Duration = Duration::from_secs(30);
+
 /// File metadata stored in the index
 #[pyclass]
 #[derive(Clone, Debug)]
@@ -51,8 +55,12 @@ impl FileMetadata {
 }
 
 /// Lock-free glob cache using DashMap
+///
+/// Matchers are shared behind an `Arc`: a `GlobMatcher` owns its pattern
+/// string, token list and regex, so handing out clones on every hit would
+/// cost a deep copy per `list`/`glob` call.
 struct GlobCache {
-    cache: DashMap<String, GlobMatcher>,
+    cache: DashMap<String, Arc<GlobMatcher>>,
     capacity: usize,
 }
 
@@ -66,12 +74,12 @@ impl GlobCache {
 
     /// Get a cached matcher (lock-free read)
     #[inline]
-    fn get(&self, pattern: &str) -> Option<GlobMatcher> {
-        self.cache.get(pattern).map(|r| r.clone())
+    fn get(&self, pattern: &str) -> Option<Arc<GlobMatcher>> {
+        self.cache.get(pattern).map(|r| Arc::clone(r.value()))
     }
 
     /// Insert a matcher, evicting random entry if at capacity
-    fn insert(&self, pattern: String, matcher: GlobMatcher) {
+    fn insert(&self, pattern: String, matcher: Arc<GlobMatcher>) {
         // Simple capacity control: remove one random entry if full
         if self.cache.len() >= self.capacity {
             if let Some(entry) = self.cache.iter().next() {
@@ -104,8 +112,17 @@ pub struct FileIndex {
     /// Whether the index is currently being built
     is_building: AtomicBool,
 
+    /// Lock paired with `ready_cond` for blocking readiness waits
+    ready_lock: Mutex<()>,
+
+    /// Signaled whenever a build completes
+    ready_cond: Condvar,
+
     /// Lock-free cache for compiled glob patterns
     glob_cache: GlobCache,
+
+    /// Bumped whenever the set of indexed paths changes
+    generation: AtomicU64,
 }
 
 impl FileIndex {
@@ -118,21 +135,46 @@ impl FileIndex {
             all_files: RwLock::new(Vec::new()),
             is_ready: AtomicBool::new(false),
             is_building: AtomicBool::new(false),
+            ready_lock: Mutex::new(()),
+            ready_cond: Condvar::new(),
             glob_cache: GlobCache::new(GLOB_CACHE_SIZE),
+            generation: AtomicU64::new(0),
         }
     }
 
     /// Build the index by scanning the directory
     pub fn build(&self) -> Result<()> {
-        // Prevent concurrent builds
-        if self
-            .is_building
-            .compare_exchange(false, true, Ordering::SeqCst, Ordering::SeqCst)
-            .is_err()
-        {
+        if !self.start_building() {
             return Ok(()); // Already building
         }
+        self.scan()
+    }
+
+    /// Build the index on a background thread
+    ///
+    /// The index counts as building as soon as this returns, so listings
+    /// issued right away wait for the scan instead of failing.
+    pub fn spawn_build(self: &Arc<Self>) {
+        if !self.start_building() {
+            return;
+        }
+        let index = Arc::clone(self);
+        std::thread::spawn(move || {
+            if let Err(e) = index.scan() {
+                tracing::error!("Failed to build index: {}", e);
+            }
+        });
+    }
+
+    /// Claim the right to build; false if a build is already running
+    fn start_building(&self) -> bool {
+        self.is_building
+            .compare_exchange(false, true, Ordering::SeqCst, Ordering::SeqCst)
+            .is_ok()
+    }
 
+    /// Scan the directory into the index (the caller holds `is_building`)
+    fn scan(&self) -> Result<()> {
         // Clear existing entries
         self.entries.clear();
         self.dir_children.clear();
@@ -148,7 +190,6 @@ impl FileIndex {
             .git_exclude(true) // Respect .git/info/exclude
             .build_parallel();
 
-        use std::sync::Mutex;
         let all_files_mutex = Mutex::new(&mut all_files);
 
         walker.run(|| {
@@ -212,13 +253,22 @@ impl FileIndex {
         if let Ok(mut files) = self.all_files.write() {
             *files = all_files;
         }
+        self.generation.fetch_add(1, Ordering::Release);
 
         self.is_ready.store(true, Ordering::SeqCst);
         self.is_building.store(false, Ordering::SeqCst);
+        self.notify_ready();
 
         Ok(())
     }
 
+    /// Wake all threads blocked in `wait_ready`
+    fn notify_ready(&self) {
+        // Hold the lock so a waiter cannot miss the wakeup between its check and wait
+        let _guard = self.ready_lock.lock().unwrap_or_else(|e| e.into_inner());
+        self.ready_cond.notify_all();
+    }
+
     /// Check if a file is binary by reading the first few bytes
     fn is_binary_file(path: &Path) -> bool {
         use std::io::Read;
@@ -238,19 +288,57 @@ impl FileIndex {
         self.is_ready.load(Ordering::SeqCst)
     }
 
+    /// Block until the index is ready or the timeout elapses
+    ///
+    /// Returns true if the index is ready.
+    pub fn wait_ready(&self, timeout: Duration) -> bool {
+        let guard = self.ready_lock.lock().unwrap_or_else(|e| e.into_inner());
+        let _ = self
+            .ready_cond
+            .wait_timeout_while(guard, timeout, |_| !self.is_ready());
+        self.is_ready()
+    }
+
+    /// Current generation of the index
+    ///
+    /// Changes whenever a build completes or a path is added or removed, so
+    /// callers can tell whether a cached `list` result is still current.
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Acquire)
+    }
+
     /// Refresh the index
     pub fn refresh(&self) -> Result<()> {
+        // A running build may have walked the tree before the latest
+        // changes, so wait for it to finish and then rescan; readiness is
+        // left to that build, which may complete at any moment
+        while !self.start_building() {
+            self.wait_ready(READY_GATE_TIMEOUT);
+        }
+        // Not ready but building: listings wait for the rescan
         self.is_ready.store(false, Ordering::SeqCst);
-        self.build()
+        self.scan()
+    }
+
+    /// Succeed once the index is ready, waiting out a build in progress
+    ///
+    /// Only the first listing after startup or a refresh actually blocks;
+    /// afterwards this is a single atomic load.
+    fn ensure_ready(&self) -> Result<()> {
+        if self.is_ready()
+            || (self.is_building.load(Ordering::SeqCst) && self.wait_ready(READY_GATE_TIMEOUT))
+        {
+            Ok(())
+        } else {
+            Err(AgentGearError::IndexNotReady)
+        }
     }
 
     /// List files matching a glob pattern
     pub fn list(&self, pattern: &str, only_files: bool) -> Result<Vec<String>> {
         use rayon::prelude::*;
 
-        if !self.is_ready() {
-            return Err(AgentGearError::IndexNotReady);
-        }
+        self.ensure_ready()?;
 
         // Fast path: "**/*" matches everything
         let match_all = pattern == "**/*" || pattern == "**";
@@ -433,7 +521,7 @@ impl FileIndex {
 
     /// Compile a glob pattern with lock-free caching
     #[inline]
-    fn compile_glob(&self, pattern: &str) -> Result<GlobMatcher> {
+    pub(crate) fn compile_glob(&self, pattern: &str) -> Result<Arc<GlobMatcher>> {
         // Fast path: lock-free cache lookup
         if let Some(matcher) = self.glob_cache.get(pattern) {
             return Ok(matcher);
@@ -441,10 +529,11 @@ impl FileIndex {
 
         // Cache miss: compile and store
         let matcher = Glob::new(pattern)
-            .map(|g| g.compile_matcher())
+            .map(|g| Arc::new(g.compile_matcher()))
             .map_err(AgentGearError::Glob)?;
 
-        self.glob_cache.insert(pattern.to_string(), matcher.clone());
+        self.glob_cache
+            .insert(pattern.to_string(), Arc::clone(&matcher));
         Ok(matcher)
     }
 
@@ -517,6 +606,7 @@ impl FileIndex {
                 }
             }
         }
+        self.generation.fetch_add(1, Ordering::Release);
 
         Ok(())
     }
@@ -580,10 +670,126 @@ impl FileIndex {
                     files.retain(|p| p != path);
                 }
             }
+            self.generation.fetch_add(1, Ordering::Release);
         }
     }
 }
 
+/// Immutable point-in-time copy of the file index
+///
+/// Built once by `FileSystem.snapshot()`. Afterwards reads take no locks at
+/// all, so a snapshot can be pinned for the duration of a task and shared
+/// between threads while the watcher keeps updating the live index.
+#[pyclass(frozen, name = "FileSystemSnapshot")]
+pub struct IndexSnapshot {
+    /// Live index, used for its root and glob matcher cache only
+    index: Arc<FileIndex>,
+
+    /// Relative paths of all files
+    files: Vec<String>,
+
+    /// Metadata for files and directories, keyed by relative path
+    entries: HashMap<String, FileMetadata>,
+}
+
+impl IndexSnapshot {
+    /// Copy the current contents of a ready index
+    pub fn new(index: Arc<FileIndex>) -> Result<Self> {
+        index.ensure_ready()?;
+
+        let all_files = index
+            .all_files
+            .read()
+            .map_err(|_| AgentGearError::Internal("Failed to acquire read lock".to_string()))?;
+        let files = all_files
+            .iter()
+            .map(|p| index.relative_path_fast(p))
+            .collect();
+        let entries = index
+            .entries
+            .iter()
+            .map(|entry| (index.relative_path_fast(entry.key()), entry.value().clone()))
+            .collect();
+        drop(all_files);
+
+        Ok(Self {
+            index,
+            files,
+            entries,
+        })
+    }
+
+    /// List paths matching a glob pattern
+    fn matching(&self, pattern: &str, only_files: bool) -> Result<Vec<String>> {
+        let matcher = if pattern == "**/*" || pattern == "**" {
+            None
+        } else {
+            Some(self.index.compile_glob(pattern)?)
+        };
+        let is_match = |path: &&String| match &matcher {
+            Some(matcher) => matcher.is_match(path.as_str()),
+            None => true,
+        };
+
+        Ok(if only_files {
+            self.files.iter().filter(is_match).cloned().collect()
+        } else {
+            self.entries.keys().filter(is_match).cloned().collect()
+        })
+    }
+}
+
+#[pymethods]
+impl IndexSnapshot {
+    /// List files matching the given pattern
+    ///
+    /// Args:
+    ///     pattern: Glob pattern (default: "**/*")
+    ///     only_files: If true, only return files (not directories)
+    ///
+    /// Returns:
+    ///     List of file paths relative to root
+    #[pyo3(signature = (pattern = "**/*", only_files = true))]
+    pub fn list(&self, py: Python<'_>, pattern: &str, only_files: bool) -> PyResult<Vec<String>> {
+        py.allow_threads(|| self.matching(pattern, only_files))
+            .map_err(|e| e.into())
+    }
+
+    /// Match files using glob pattern
+    ///
+    /// Args:
+    ///     pattern: Glob pattern
+    ///
+    /// Returns:
+    ///     List of matching file paths relative to root
+    pub fn glob(&self, py: Python<'_>, pattern: &str) -> PyResult<Vec<String>> {
+        self.list(py, pattern, true)
+    }
+
+    /// Get file metadata as of the snapshot
+    ///
+    /// Args:
+    ///     path: File path (relative to root or absolute)
+    ///
+    /// Returns:
+    ///     FileMetadata object
+    pub fn get_metadata(&self, path: &str) -> PyResult<FileMetadata> {
+        let full_path = self.index.root().join(path);
+        self.entries
+            .get(&self.index.relative_path_fast(&full_path))
+            .cloned()
+            .ok_or_else(|| AgentGearError::PathNotFound(path.to_string()).into())
+    }
+
+    fn __len__(&self) -> usize {
+        self.files.len()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("FileSystemSnapshot(files={})", self.files.len())
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -611,6 +817,32 @@ mod tests {
         assert!(!index.is_empty());
     }
 
+    #[test]
+    fn test_glob_cache_shares_matcher() {
+        let dir = tempdir().unwrap();
+        let index = FileIndex::new(dir.path().to_path_buf());
+
+        let first = index.compile_glob("**/*.rs").unwrap();
+        let second = index.compile_glob("**/*.rs").unwrap();
+        assert!(Arc::ptr_eq(&first, &second));
+        assert!(index.compile_glob("[").is_err());
+    }
+
+    #[test]
+    fn test_wait_ready() {
+        let dir = tempdir().unwrap();
+        create_test_files(dir.path());
+
+        let index = std::sync::Arc::new(FileIndex::new(dir.path().to_path_buf()));
+        assert!(!index.wait_ready(Duration::from_millis(10)));
+
+        let index_clone = std::sync::Arc::clone(&index);
+        let handle = std::thread::spawn(move || index_clone.build().unwrap());
+
+        assert!(index.wait_ready(Duration::from_secs(5)));
+        handle.join().unwrap();
+    }
+
     #[test]
     fn test_list_all() {
         let dir = tempdir().unwrap();
@@ -638,6 +870,72 @@ mod tests {
         assert_eq!(src_files.len(), 2); // main.rs, lib.rs
     }
 
+    #[test]
+    fn test_list_waits_for_background_build() {
+        let dir = tempdir().unwrap();
+        create_test_files(dir.path());
+
+        let index = Arc::new(FileIndex::new(dir.path().to_path_buf()));
+        assert!(index.list("**/*", true).is_err());
+
+        index.spawn_build();
+        assert_eq!(index.glob("**/*.rs").unwrap().len(), 3);
+        assert!(index.is_ready());
+    }
+
+    #[test]
+    fn test_refresh_during_background_build() {
+        let dir = tempdir().unwrap();
+        create_test_files(dir.path());
+
+        let index = Arc::new(FileIndex::new(dir.path().to_path_buf()));
+        index.spawn_build();
+        std::fs::write(dir.path().join("src/new.rs"), "fn new() {}").unwrap();
+        index.refresh().unwrap();
+
+        assert!(index.is_ready());
+        assert_eq!(index.list("**/*", true).unwrap().len(), 5);
+        assert_eq!(index.glob("**/*.rs").unwrap().len(), 4);
+    }
+
+    #[test]
+    fn test_snapshot_is_immutable() {
+        let dir = tempdir().unwrap();
+        create_test_files(dir.path());
+
+        let index = Arc::new(FileIndex::new(dir.path().to_path_buf()));
+        assert!(IndexSnapshot::new(Arc::clone(&index)).is_err());
+        index.build().unwrap();
+
+        let snapshot = IndexSnapshot::new(Arc::clone(&index)).unwrap();
+        let new_file = dir.path().join("src/new.rs");
+        std::fs::write(&new_file, "fn new() {}").unwrap();
+        index.add_path(&new_file).unwrap();
+
+        assert_eq!(index.glob("**/*.rs").unwrap().len(), 4);
+        assert_eq!(snapshot.matching("**/*.rs", true).unwrap().len(), 3);
+        assert_eq!(snapshot.matching("**/*", true).unwrap().len(), 4);
+        assert!(snapshot.entries.contains_key("src/main.rs"));
+        assert!(!snapshot.entries.contains_key("src/new.rs"));
+    }
+
+    #[test]
+    fn test_generation_tracks_changes() {
+        let dir = tempdir().unwrap();
+        create_test_files(dir.path());
+
+        let index = FileIndex::new(dir.path().to_path_buf());
+        index.build().unwrap();
+        let built = index.generation();
+
+        let main_rs = dir.path().join("src/main.rs");
+        index.update_path(&main_rs).unwrap();
+        assert_eq!(index.generation(), built);
+
+        index.remove_path(&main_rs);
+        assert!(index.generation() > built);
+    }
+
     #[test]
     fn test_metadata() {
         let dir = tempdir().unwrap();
@@ -5,61 +5,145 @@
 //! - Atomic file writing
 //! - Text replacement with safety checks
 
+use memmap2::Mmap;
+use pyo3::exceptions::PyBufferError;
+use pyo3::ffi;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyString};
 use rayon::prelude::*;
 use std::collections::HashMap;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 
 use crate::utils::error::{AgentGearError, Result};
 
 /// Read a single file as text
 ///
+/// The bytes are decoded once, straight into a Python `str` (see
+/// `decode_utf8`), instead of being validated into a Rust `String` and then
+/// decoded a second time on conversion.
+///
 /// # Arguments
 /// * `py` - Python GIL token
 /// * `path` - Path to the file
 /// * `encoding` - Text encoding (currently only utf-8 is fully supported)
-pub fn read_file(py: Python<'_>, path: &Path, _encoding: &str) -> PyResult<String> {
-    py.allow_threads(|| {
-        std::fs::read_to_string(path).map_err(|e| {
+pub fn read_file<'py>(
+    py: Python<'py>,
+    path: &Path,
+    _encoding: &str,
+) -> PyResult<Bound<'py, PyString>> {
+    let bytes = py.allow_threads(|| {
+        std::fs::read(path).map_err(|e| {
             if e.kind() == std::io::ErrorKind::NotFound {
                 AgentGearError::PathNotFound(path.display().to_string())
             } else {
                 AgentGearError::Io(e)
             }
         })
+    })?;
+    decode_utf8(py, &bytes)
+}
+
+/// Decode UTF-8 bytes into a Python `str` in a single pass
+///
+/// CPython's decoder validates and copies in one go, with a word-at-a-time
+/// fast path that produces a compact 1-byte string for ASCII input (the
+/// common case for source files).
+///
+/// # Errors
+/// Invalid UTF-8 raises `IOError`, matching `std::fs::read_to_string`.
+pub fn decode_utf8<'py>(py: Python<'py>, bytes: &[u8]) -> PyResult<Bound<'py, PyString>> {
+    unsafe {
+        let ptr = ffi::PyUnicode_DecodeUTF8(
+            bytes.as_ptr() as *const std::os::raw::c_char,
+            bytes.len() as ffi::Py_ssize_t,
+            std::ptr::null(),
+        );
+        if ptr.is_null() {
+            // Replace the UnicodeDecodeError with the error read_to_string gives
+            drop(PyErr::fetch(py));
+            return Err(AgentGearError::Io(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                "stream did not contain valid UTF-8",
+            ))
+            .into());
+        }
+        Ok(Bound::from_owned_ptr(py, ptr).downcast_into_unchecked())
+    }
+}
+
+/// Read a single file as text without touching the GIL
+pub fn read_file_internal(path: &Path) -> Result<String> {
+    std::fs::read_to_string(path).map_err(|e| {
+        if e.kind() == std::io::ErrorKind::NotFound {
+            AgentGearError::PathNotFound(path.display().to_string())
+        } else {
+            AgentGearError::Io(e)
+        }
     })
-    .map_err(|e| e.into())
 }
 
 /// Threshold for switching to parallel read (files below this use serial read)
 const PARALLEL_READ_THRESHOLD: usize = 30;
 
+/// Files larger than this are memory-mapped by the line/range readers
+const MMAP_THRESHOLD: u64 = 1024 * 1024;
+
 /// Read multiple files in parallel
 ///
 /// Uses Rayon for parallel file I/O, releasing the Python GIL during execution.
 /// For small batches (< 30 files), uses serial read to avoid thread pool overhead.
+/// Contents are read as bytes and decoded once, straight into Python `str`
+/// objects (see `decode_utf8`); files that are not valid UTF-8 are skipped.
 ///
 /// # Arguments
 /// * `py` - Python GIL token
 /// * `paths` - Slice of file paths to read
 ///
 /// # Returns
-/// HashMap mapping file path strings to their contents
-pub fn read_batch(
-    py: Python<'_>,
+/// Dict mapping file path strings to their contents
+pub fn read_batch<'py>(
+    py: Python<'py>,
     paths: &[std::path::PathBuf],
-) -> PyResult<HashMap<String, String>> {
-    let result = py.allow_threads(|| {
-        // Use serial read for small batches to avoid Rayon overhead
-        if paths.len() < PARALLEL_READ_THRESHOLD {
-            read_batch_serial(paths)
-        } else {
-            read_batch_parallel(paths)
+) -> PyResult<Bound<'py, PyDict>> {
+    let contents = py.allow_threads(|| read_batch_bytes_internal(paths));
+    let result = PyDict::new(py);
+    for (path, content) in paths.iter().zip(contents) {
+        let Some(content) = content else { continue };
+        match decode_utf8(py, &content) {
+            Ok(text) => result.set_item(path.display().to_string(), text)?,
+            Err(e) => tracing::warn!("Failed to read {}: {}", path.display(), e),
         }
-    });
+    }
     Ok(result)
 }
 
+/// Read multiple files without touching the GIL
+pub fn read_batch_internal(paths: &[std::path::PathBuf]) -> HashMap<String, String> {
+    #[cfg(all(target_os = "linux", feature = "io-uring"))]
+    if paths.len() >= PARALLEL_READ_THRESHOLD {
+        if let Some(contents) = super::uring::read_batch(paths) {
+            return paths
+                .iter()
+                .zip(contents)
+                .filter_map(|(path, content)| match String::from_utf8(content?) {
+                    Ok(content) => Some((path.display().to_string(), content)),
+                    Err(e) => {
+                        tracing::warn!("Failed to read {}: {}", path.display(), e);
+                        None
+                    }
+                })
+                .collect();
+        }
+    }
+
+    // Use serial read for small batches to avoid Rayon overhead
+    if paths.len() < PARALLEL_READ_THRESHOLD {
+        read_batch_serial(paths)
+    } else {
+        read_batch_parallel(paths)
+    }
+}
+
 /// Serial batch read for small file counts
 #[inline]
 fn read_batch_serial(paths: &[std::path::PathBuf]) -> HashMap<String, String> {
@@ -92,6 +176,171 @@ fn read_batch_parallel(paths: &[std::path::PathBuf]) -> HashMap<String, String>
         .collect::<HashMap<String, String>>()
 }
 
+/// Read multiple files in parallel as raw bytes
+///
+/// Unlike `read_batch`, results keep the order of `paths` and skip UTF-8
+/// validation, so callers that only need bytes avoid a decode pass.
+///
+/// # Arguments
+/// * `py` - Python GIL token
+/// * `paths` - Slice of file paths to read
+///
+/// # Returns
+/// File contents in the same order as `paths` (`None` for unreadable files)
+pub fn read_batch_bytes(
+    py: Python<'_>,
+    paths: &[std::path::PathBuf],
+) -> PyResult<Vec<Option<Vec<u8>>>> {
+    Ok(py.allow_threads(|| read_batch_bytes_internal(paths)))
+}
+
+/// Read multiple files as raw bytes without touching the GIL
+fn read_batch_bytes_internal(paths: &[std::path::PathBuf]) -> Vec<Option<Vec<u8>>> {
+    let read = |path: &std::path::PathBuf| match std::fs::read(path) {
+        Ok(content) => Some(content),
+        Err(e) => {
+            tracing::warn!("Failed to read {}: {}", path.display(), e);
+            None
+        }
+    };
+
+    #[cfg(all(target_os = "linux", feature = "io-uring"))]
+    if paths.len() >= PARALLEL_READ_THRESHOLD {
+        if let Some(contents) = super::uring::read_batch(paths) {
+            return contents;
+        }
+    }
+
+    if paths.len() < PARALLEL_READ_THRESHOLD {
+        paths.iter().map(read).collect()
+    } else {
+        paths.par_iter().map(read).collect()
+    }
+}
+
+/// Copy files in parallel without routing their bytes through Python
+///
+/// Each pair is copied with `std::fs::copy`, which moves data in the kernel
+/// where it can: `copy_file_range` (falling back to `sendfile`, then a plain
+/// read/write loop on `EXDEV`/`ENOSYS`) on Linux and `fcopyfile` on macOS.
+/// Parent directories of the destinations are created as needed.
+///
+/// # Arguments
+/// * `py` - Python GIL token
+/// * `pairs` - (source, destination) path pairs
+///
+/// # Returns
+/// Total number of bytes copied
+pub fn copy_batch(py: Python<'_>, pairs: &[(PathBuf, PathBuf)]) -> PyResult<u64> {
+    let copy = |(src, dst): &(PathBuf, PathBuf)| -> Result<u64> {
+        if let Some(parent) = dst.parent() {
+            if !parent.exists() {
+                std::fs::create_dir_all(parent)?;
+            }
+        }
+        std::fs::copy(src, dst).map_err(|e| {
+            if e.kind() == std::io::ErrorKind::NotFound && !src.exists() {
+                AgentGearError::PathNotFound(src.display().to_string())
+            } else {
+                AgentGearError::Io(e)
+            }
+        })
+    };
+
+    py.allow_threads(|| {
+        if pairs.len() < PARALLEL_READ_THRESHOLD {
+            pairs.iter().map(copy).sum::<Result<u64>>()
+        } else {
+            pairs.par_iter().map(copy).sum::<Result<u64>>()
+        }
+    })
+    .map_err(|e| e.into())
+}
+
+/// Read-only memory-mapped file exposed through the Python buffer protocol
+///
+/// Wrap it in `memoryview()` to slice the file without copying. The mapping
+/// stays alive as long as any view of it exists. Truncating the file while it
+/// is mapped is undefined behaviour, as with any mmap.
+#[pyclass(frozen)]
+pub struct MmapFile {
+    /// `None` for empty files, which cannot be mapped on every platform
+    map: Option<Mmap>,
+}
+
+impl MmapFile {
+    fn as_bytes(&self) -> &[u8] {
+        self.map.as_deref().unwrap_or(&[])
+    }
+}
+
+#[pymethods]
+impl MmapFile {
+    fn __len__(&self) -> usize {
+        self.as_bytes().len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: std::os::raw::c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("MmapFile is read-only"));
+        }
+
+        let bytes = slf.get().as_bytes();
+        // Fills a 1-D byte buffer and takes a reference to `slf` for view.obj
+        let ret = ffi::PyBuffer_FillInfo(
+            view,
+            slf.as_ptr(),
+            bytes.as_ptr() as *mut std::os::raw::c_void,
+            bytes.len() as ffi::Py_ssize_t,
+            1,
+            flags,
+        );
+        if ret == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        Ok(())
+    }
+}
+
+/// Memory-map a file for zero-copy reading
+///
+/// # Arguments
+/// * `py` - Python GIL token
+/// * `path` - Path to the file
+///
+/// # Returns
+/// A read-only `MmapFile` covering the whole file
+pub fn read_file_view(py: Python<'_>, path: &Path) -> PyResult<MmapFile> {
+    py.allow_threads(|| -> Result<MmapFile> {
+        let file = std::fs::File::open(path).map_err(|e| {
+            if e.kind() == std::io::ErrorKind::NotFound {
+                AgentGearError::PathNotFound(path.display().to_string())
+            } else {
+                AgentGearError::Io(e)
+            }
+        })?;
+
+        if file.metadata()?.len() == 0 {
+            return Ok(MmapFile { map: None });
+        }
+
+        let map = unsafe { Mmap::map(&file) }?;
+
+        #[cfg(unix)]
+        let _ = map.advise(memmap2::Advice::Sequential);
+
+        Ok(MmapFile { map: Some(map) })
+    })
+    .map_err(|e| e.into())
+}
+
 /// Write content to a file atomically
 ///
 /// Uses the write-to-temp, fsync, rename pattern to ensure atomicity.
@@ -143,6 +392,9 @@ pub fn write_file_fast(py: Python<'_>, path: &Path, content: &str) -> PyResult<(
 
 /// Replace text in a file
 ///
+/// Occurrences are located with SIMD `memmem` and the result is assembled in
+/// a single pre-sized buffer before being written atomically.
+///
 /// # Arguments
 /// * `py` - Python GIL token
 /// * `path` - File path
@@ -169,8 +421,19 @@ pub fn edit_replace(
             }
         })?;
 
-        // Count occurrences
-        let count = content.matches(old_text).count();
+        // Locate every occurrence once; the positions drive both the
+        // uniqueness check and the rewrite
+        let positions: Vec<usize> = if old_text.is_empty() {
+            // An empty needle matches at every char boundary (as str::matches)
+            content
+                .char_indices()
+                .map(|(i, _)| i)
+                .chain(std::iter::once(content.len()))
+                .collect()
+        } else {
+            memchr::memmem::find_iter(content.as_bytes(), old_text.as_bytes()).collect()
+        };
+        let count = positions.len();
 
         if count == 0 {
             if strict {
@@ -183,11 +446,20 @@ pub fn edit_replace(
             return Err(AgentGearError::TextNotUnique(count));
         }
 
-        // Perform replacement
-        let new_content = content.replace(old_text, new_text);
+        // Splice the replacement into a buffer sized up front
+        let haystack = content.as_bytes();
+        let mut new_content =
+            Vec::with_capacity(haystack.len() - count * old_text.len() + count * new_text.len());
+        let mut last = 0;
+        for pos in positions {
+            new_content.extend_from_slice(&haystack[last..pos]);
+            new_content.extend_from_slice(new_text.as_bytes());
+            last = pos + old_text.len();
+        }
+        new_content.extend_from_slice(&haystack[last..]);
 
         // Write atomically
-        super::atomic::atomic_write(path, new_content.as_bytes())?;
+        super::atomic::atomic_write(path, &new_content)?;
 
         Ok(true)
     })
@@ -213,7 +485,6 @@ pub fn read_lines(
     start_line: usize,
     count: Option<usize>,
 ) -> PyResult<Vec<String>> {
-    use memmap2::Mmap;
     use std::io::{BufRead, BufReader};
 
     py.allow_threads(|| -> Result<Vec<String>> {
@@ -226,12 +497,17 @@ pub fn read_lines(
         })?;
 
         let metadata = file.metadata()?;
-        let file_size = metadata.len() as usize;
+        let file_size = metadata.len();
 
         // Use mmap for large files (> 1MB), buffered read for smaller
-        let lines: Vec<String> = if file_size > 1024 * 1024 {
+        let lines: Vec<String> = if file_size > MMAP_THRESHOLD {
             // Memory-mapped approach for large files
             let mmap = unsafe { Mmap::map(&file) }.map_err(AgentGearError::Io)?;
+
+            // Lines are consumed front to back: ask for aggressive readahead
+            #[cfg(unix)]
+            let _ = mmap.advise(memmap2::Advice::Sequential);
+
             let content = std::str::from_utf8(&mmap)
                 .map_err(|e| AgentGearError::Internal(format!("Invalid UTF-8: {}", e)))?;
 
@@ -255,14 +531,130 @@ pub fn read_lines(
     .map_err(|e| e.into())
 }
 
+/// Storage behind a `LinesIter`
+enum LineSource {
+    Map(Mmap),
+    Buffer(Vec<u8>),
+}
+
+impl LineSource {
+    fn as_bytes(&self) -> &[u8] {
+        match self {
+            LineSource::Map(map) => map,
+            LineSource::Buffer(buf) => buf,
+        }
+    }
+}
+
+/// Iterator over the lines of a file
+///
+/// Each `__next__` finds the next newline with `memchr` and decodes only that
+/// line, so no list of all lines is ever built. Lines are yielded without
+/// their trailing newline, as in `read_lines`.
+#[pyclass]
+pub struct LinesIter {
+    source: LineSource,
+    pos: usize,
+    remaining: Option<usize>,
+}
+
+#[pymethods]
+impl LinesIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__<'py>(&mut self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyString>>> {
+        let bytes = self.source.as_bytes();
+        if self.remaining == Some(0) || self.pos >= bytes.len() {
+            return Ok(None);
+        }
+
+        let rest = &bytes[self.pos..];
+        let (line, advance) = match memchr::memchr(b'\n', rest) {
+            Some(i) => {
+                let line = &rest[..i];
+                (line.strip_suffix(b"\r").unwrap_or(line), i + 1)
+            }
+            None => (rest, rest.len()),
+        };
+
+        self.pos += advance;
+        if let Some(remaining) = self.remaining.as_mut() {
+            *remaining -= 1;
+        }
+        decode_utf8(py, line).map(Some)
+    }
+}
+
+/// Open a file for lazy line-by-line reading
+///
+/// Large files are memory-mapped with sequential-access advice; smaller ones
+/// are read into a buffer.
+///
+/// # Arguments
+/// * `py` - Python GIL token
+/// * `path` - File path
+/// * `start_line` - Starting line number (0-indexed)
+/// * `count` - Number of lines to yield (None = read to end)
+pub fn read_lines_iter(
+    py: Python<'_>,
+    path: &Path,
+    start_line: usize,
+    count: Option<usize>,
+) -> PyResult<LinesIter> {
+    py.allow_threads(|| -> Result<LinesIter> {
+        let file = std::fs::File::open(path).map_err(|e| {
+            if e.kind() == std::io::ErrorKind::NotFound {
+                AgentGearError::PathNotFound(path.display().to_string())
+            } else {
+                AgentGearError::Io(e)
+            }
+        })?;
+
+        let source = if file.metadata()?.len() > MMAP_THRESHOLD {
+            let map = unsafe { Mmap::map(&file) }?;
+
+            #[cfg(unix)]
+            let _ = map.advise(memmap2::Advice::Sequential);
+
+            LineSource::Map(map)
+        } else {
+            let mut buf = Vec::new();
+            std::io::Read::read_to_end(&mut &file, &mut buf)?;
+            LineSource::Buffer(buf)
+        };
+
+        // Skip ahead to the first requested line
+        let bytes = source.as_bytes();
+        let pos = match start_line {
+            0 => 0,
+            n => memchr::memchr_iter(b'\n', bytes)
+                .nth(n - 1)
+                .map_or(bytes.len(), |i| i + 1),
+        };
+
+        Ok(LinesIter {
+            source,
+            pos,
+            remaining: count,
+        })
+    })
+    .map_err(|e| e.into())
+}
+
 /// Read file with offset and limit (for large files)
 ///
+/// For large files only the requested window is memory-mapped, with random
+/// access advice so the kernel does not read ahead past the window.
+///
 /// # Arguments
 /// * `py` - Python GIL token
 /// * `path` - File path
 /// * `offset` - Byte offset to start reading from
 /// * `limit` - Maximum bytes to read
 pub fn read_file_range(py: Python<'_>, path: &Path, offset: u64, limit: usize) -> PyResult<String> {
+    use memmap2::MmapOptions;
     use std::io::{Read, Seek, SeekFrom};
 
     py.allow_threads(|| -> Result<String> {
@@ -274,11 +666,30 @@ pub fn read_file_range(py: Python<'_>, path: &Path, offset: u64, limit: usize) -
             }
         })?;
 
+        let file_size = file.metadata()?.len();
+        let available = file_size.saturating_sub(offset);
+        let len = (limit as u64).min(available) as usize;
+
+        if file_size > MMAP_THRESHOLD && len > 0 {
+            // Map just the requested window rather than the whole file
+            let mmap = unsafe { MmapOptions::new().offset(offset).len(len).map(&file) }
+                .map_err(AgentGearError::Io)?;
+
+            #[cfg(unix)]
+            {
+                let _ = mmap.advise(memmap2::Advice::Random);
+                let _ = mmap.advise(memmap2::Advice::WillNeed);
+            }
+
+            return std::str::from_utf8(&mmap)
+                .map(|s| s.to_owned())
+                .map_err(|e| AgentGearError::Internal(format!("Invalid UTF-8: {}", e)));
+        }
+
         file.seek(SeekFrom::Start(offset))?;
 
-        let mut buffer = vec![0u8; limit];
-        let bytes_read = file.read(&mut buffer)?;
-        buffer.truncate(bytes_read);
+        let mut buffer = Vec::with_capacity(len);
+        file.take(len as u64).read_to_end(&mut buffer)?;
 
         String::from_utf8(buffer)
             .map_err(|e| AgentGearError::Internal(format!("Invalid UTF-8: {}", e)))
@@ -302,11 +713,144 @@ mod tests {
             write_file(py, &file_path, "Hello, World!").unwrap();
 
             // Read
-            let content = read_file(py, &file_path, "utf-8").unwrap();
+            let content = read_file(py, &file_path, "utf-8").unwrap().to_string();
             assert_eq!(content, "Hello, World!");
         });
     }
 
+    #[test]
+    fn test_read_file_invalid_utf8() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let file_path = dir.path().join("bad.txt");
+            std::fs::write(&file_path, b"ok \xff").unwrap();
+
+            let err = read_file(py, &file_path, "utf-8").unwrap_err();
+            assert!(err.is_instance_of::<pyo3::exceptions::PyIOError>(py));
+        });
+    }
+
+    #[test]
+    fn test_read_batch_skips_invalid_utf8() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let good = dir.path().join("good.txt");
+            let bad = dir.path().join("bad.txt");
+            std::fs::write(&good, "good").unwrap();
+            std::fs::write(&bad, b"bad \xff").unwrap();
+
+            let paths = vec![good.clone(), bad, dir.path().join("missing.txt")];
+            let contents = read_batch(py, &paths).unwrap();
+
+            assert_eq!(contents.len(), 1);
+            let text = contents.get_item(good.display().to_string()).unwrap();
+            assert_eq!(text.unwrap().extract::<String>().unwrap(), "good");
+        });
+    }
+
+    #[test]
+    fn test_read_batch_bytes() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let first = dir.path().join("a.txt");
+            let second = dir.path().join("b.txt");
+            std::fs::write(&first, "first").unwrap();
+            std::fs::write(&second, "second").unwrap();
+
+            let paths = vec![second, dir.path().join("missing.txt"), first];
+            let contents = read_batch_bytes(py, &paths).unwrap();
+
+            assert_eq!(contents[0].as_deref(), Some(&b"second"[..]));
+            assert_eq!(contents[1], None);
+            assert_eq!(contents[2].as_deref(), Some(&b"first"[..]));
+        });
+    }
+
+    #[test]
+    fn test_copy_batch() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let src = dir.path().join("a.txt");
+            std::fs::write(&src, "hello").unwrap();
+
+            let pairs = vec![
+                (src.clone(), dir.path().join("out/a.txt")),
+                (src.clone(), dir.path().join("b.txt")),
+            ];
+            assert_eq!(copy_batch(py, &pairs).unwrap(), 10);
+            assert_eq!(
+                std::fs::read(dir.path().join("out/a.txt")).unwrap(),
+                b"hello"
+            );
+            assert_eq!(std::fs::read(dir.path().join("b.txt")).unwrap(), b"hello");
+
+            let missing = vec![(dir.path().join("missing.txt"), dir.path().join("c.txt"))];
+            assert!(copy_batch(py, &missing).is_err());
+        });
+    }
+
+    #[test]
+    fn test_read_lines_iter() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let file_path = dir.path().join("test.txt");
+            write_file(py, &file_path, "a\r\nb\nc\nd").unwrap();
+
+            let collect = |mut iter: LinesIter| {
+                let mut lines = Vec::new();
+                while let Some(line) = iter.__next__(py).unwrap() {
+                    lines.push(line.to_string());
+                }
+                lines
+            };
+
+            let all = collect(read_lines_iter(py, &file_path, 0, None).unwrap());
+            assert_eq!(all, read_lines(py, &file_path, 0, None).unwrap());
+            assert_eq!(all, vec!["a", "b", "c", "d"]);
+
+            let window = collect(read_lines_iter(py, &file_path, 1, Some(2)).unwrap());
+            assert_eq!(window, vec!["b", "c"]);
+
+            assert!(collect(read_lines_iter(py, &file_path, 10, None).unwrap()).is_empty());
+        });
+    }
+
+    #[test]
+    fn test_read_file_range() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let file_path = dir.path().join("test.txt");
+            write_file(py, &file_path, "Hello, World!").unwrap();
+
+            assert_eq!(read_file_range(py, &file_path, 7, 5).unwrap(), "World");
+            assert_eq!(read_file_range(py, &file_path, 7, 100).unwrap(), "World!");
+            assert_eq!(read_file_range(py, &file_path, 100, 5).unwrap(), "");
+        });
+    }
+
+    #[test]
+    fn test_read_file_view() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            let file_path = dir.path().join("test.txt");
+            write_file(py, &file_path, "Hello, World!").unwrap();
+
+            let view = read_file_view(py, &file_path).unwrap();
+            assert_eq!(view.as_bytes(), b"Hello, World!");
+
+            let empty_path = dir.path().join("empty.txt");
+            write_file(py, &empty_path, "").unwrap();
+            assert_eq!(read_file_view(py, &empty_path).unwrap().__len__(), 0);
+        });
+    }
+
     #[test]
     fn test_edit_replace() {
         pyo3::prepare_freethreaded_python();
@@ -322,7 +866,7 @@ mod tests {
             assert!(result);
 
             // Verify
-            let content = read_file(py, &file_path, "utf-8").unwrap();
+            let content = read_file(py, &file_path, "utf-8").unwrap().to_string();
             assert_eq!(content, "Hello, Rust!");
         });
     }
@@ -363,8 +907,14 @@ mod tests {
             let result = edit_replace(py, &file_path, "Hello", "Hi", false).unwrap();
             assert!(result);
 
-            let content = read_file(py, &file_path, "utf-8").unwrap();
+            let content = read_file(py, &file_path, "utf-8").unwrap().to_string();
             assert_eq!(content, "Hi Hi Hi");
+
+            // Growing replacement around multi-byte text
+            write_file(py, &file_path, "é-x-é-x").unwrap();
+            assert!(edit_replace(py, &file_path, "x", "yyy", false).unwrap());
+            let content = read_file(py, &file_path, "utf-8").unwrap().to_string();
+            assert_eq!(content, "é-yyy-é-yyy");
         });
     }
 }
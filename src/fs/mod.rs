@@ -6,24 +6,35 @@
 //! - `searcher`: Grep-like search engine
 //! - `atomic`: Atomic file write operations
 //! - `watcher`: File system watching with debouncing
+//! - `uring`: io_uring batch reads (Linux, `io-uring` feature)
 
 pub mod atomic;
 pub mod index;
 pub mod io;
 pub mod searcher;
+#[cfg(all(target_os = "linux", feature = "io-uring"))]
+pub mod uring;
 pub mod watcher;
 
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyString};
+use pyo3::IntoPyObject;
 use std::path::PathBuf;
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::Arc;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 use crate::utils::error::AgentGearError;
 use index::FileIndex;
-use searcher::{SearchOptions, SearchResult, Searcher};
+use searcher::{GrepIter, LineMatcher, SearchOptions, SearchResult, Searcher};
 use watcher::{ChangeKind, FileWatcher};
 
+/// Results buffered ahead of a `grep_iter` consumer before the search blocks
+const GREP_ITER_BUFFER: usize = 256;
+
+/// Longest uninterrupted wait in `wait_ready` before checking for signals
+const WAIT_READY_SLICE: Duration = Duration::from_millis(200);
+
 /// High-performance file system interface
 ///
 /// Provides stateful, concurrent file operations with in-memory indexing.
@@ -31,7 +42,7 @@ use watcher::{ChangeKind, FileWatcher};
 pub struct FileSystem {
     root: PathBuf,
     index: Arc<FileIndex>,
-    searcher: Searcher,
+    searcher: Arc<Searcher>,
     watcher: Option<Arc<FileWatcher>>,
     #[allow(dead_code)]
     watcher_thread: Option<std::thread::JoinHandle<()>>,
@@ -61,16 +72,11 @@ impl FileSystem {
         }
 
         let index = Arc::new(FileIndex::new(root_path.clone()));
-        let searcher = Searcher::new(root_path.clone());
+        let searcher = Arc::new(Searcher::new(root_path.clone()));
         let stop_flag = Arc::new(AtomicBool::new(false));
 
         // Start background indexing
-        let index_clone = Arc::clone(&index);
-        std::thread::spawn(move || {
-            if let Err(e) = index_clone.build() {
-                tracing::error!("Failed to build index: {}", e);
-            }
-        });
+        index.spawn_build();
 
         // Optionally start file watcher
         let (watcher, watcher_thread) = if auto_watch {
@@ -115,8 +121,50 @@ impl FileSystem {
     /// Returns:
     ///     List of file paths relative to root
     #[pyo3(signature = (pattern = "**/*", only_files = true))]
-    pub fn list(&self, pattern: &str, only_files: bool) -> PyResult<Vec<String>> {
-        self.index.list(pattern, only_files).map_err(|e| e.into())
+    pub fn list(&self, py: Python<'_>, pattern: &str, only_files: bool) -> PyResult<Vec<String>> {
+        py.allow_threads(|| self.index.list(pattern, only_files))
+            .map_err(|e| e.into())
+    }
+
+    /// List files matching the pattern as one packed buffer
+    ///
+    /// Avoids creating a Python string per path: each path is followed by a
+    /// NUL byte in a single bytes object.
+    ///
+    /// Args:
+    ///     pattern: Glob pattern (default: "**/*")
+    ///     only_files: If true, only return files (not directories)
+    ///
+    /// Returns:
+    ///     Tuple of (buffer, offsets) where path `i` is
+    ///     `buffer[offsets[i]:offsets[i + 1] - 1]`
+    #[pyo3(signature = (pattern = "**/*", only_files = true))]
+    pub fn list_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        pattern: &str,
+        only_files: bool,
+    ) -> PyResult<(Bound<'py, PyBytes>, Vec<usize>)> {
+        let index = Arc::clone(&self.index);
+        let paths = py.allow_threads(|| index.list(pattern, only_files))?;
+
+        let mut offsets = Vec::with_capacity(paths.len() + 1);
+        let mut total = 0;
+        for path in &paths {
+            offsets.push(total);
+            total += path.len() + 1;
+        }
+        offsets.push(total);
+
+        // The buffer starts zeroed, so the separators are already in place
+        let buffer = PyBytes::new_with(py, total, |buf| {
+            for (path, &start) in paths.iter().zip(&offsets) {
+                buf[start..start + path.len()].copy_from_slice(path.as_bytes());
+            }
+            Ok(())
+        })?;
+
+        Ok((buffer, offsets))
     }
 
     /// Match files using glob pattern
@@ -126,8 +174,9 @@ impl FileSystem {
     ///
     /// Returns:
     ///     List of matching file paths
-    pub fn glob(&self, pattern: &str) -> PyResult<Vec<String>> {
-        self.index.glob(pattern).map_err(|e| e.into())
+    pub fn glob(&self, py: Python<'_>, pattern: &str) -> PyResult<Vec<String>> {
+        py.allow_threads(|| self.index.glob(pattern))
+            .map_err(|e| e.into())
     }
 
     /// Read a single file
@@ -139,7 +188,12 @@ impl FileSystem {
     /// Returns:
     ///     File content as string
     #[pyo3(signature = (path, encoding = "utf-8"))]
-    pub fn read_file(&self, py: Python<'_>, path: &str, encoding: &str) -> PyResult<String> {
+    pub fn read_file<'py>(
+        &self,
+        py: Python<'py>,
+        path: &str,
+        encoding: &str,
+    ) -> PyResult<Bound<'py, PyString>> {
         let full_path = self.resolve_path(path);
         io::read_file(py, &full_path, encoding)
     }
@@ -151,15 +205,107 @@ impl FileSystem {
     ///
     /// Returns:
     ///     Dict mapping path to content
-    pub fn read_batch(
+    pub fn read_batch<'py>(
         &self,
-        py: Python<'_>,
+        py: Python<'py>,
         paths: Vec<String>,
-    ) -> PyResult<std::collections::HashMap<String, String>> {
+    ) -> PyResult<Bound<'py, PyDict>> {
         let full_paths: Vec<PathBuf> = paths.iter().map(|p| self.resolve_path(p)).collect();
         io::read_batch(py, &full_paths)
     }
 
+    /// Read multiple files in parallel as bytes
+    ///
+    /// Skips UTF-8 decoding and preserves the order of `paths`.
+    ///
+    /// Args:
+    ///     paths: List of file paths
+    ///
+    /// Returns:
+    ///     List of file contents in the same order as `paths`
+    ///     (None for files that could not be read)
+    pub fn read_batch_bytes<'py>(
+        &self,
+        py: Python<'py>,
+        paths: Vec<String>,
+    ) -> PyResult<Vec<Option<Bound<'py, PyBytes>>>> {
+        let full_paths: Vec<PathBuf> = paths.iter().map(|p| self.resolve_path(p)).collect();
+        let contents = io::read_batch_bytes(py, &full_paths)?;
+        Ok(contents
+            .iter()
+            .map(|c| c.as_deref().map(|b| PyBytes::new(py, b)))
+            .collect())
+    }
+
+    /// Read multiple files in parallel into one contiguous buffer
+    ///
+    /// Allocates a single Python object for the whole batch instead of one
+    /// per file.
+    ///
+    /// Args:
+    ///     paths: List of file paths
+    ///
+    /// Returns:
+    ///     Tuple of (buffer, offsets) where file `i` is
+    ///     `buffer[offsets[i]:offsets[i + 1]]` (empty for unreadable files)
+    pub fn read_batch_concat<'py>(
+        &self,
+        py: Python<'py>,
+        paths: Vec<String>,
+    ) -> PyResult<(Bound<'py, PyBytes>, Vec<usize>)> {
+        let full_paths: Vec<PathBuf> = paths.iter().map(|p| self.resolve_path(p)).collect();
+        let contents = io::read_batch_bytes(py, &full_paths)?;
+
+        let mut offsets = Vec::with_capacity(contents.len() + 1);
+        let mut total = 0;
+        offsets.push(total);
+        for content in &contents {
+            total += content.as_ref().map_or(0, |b| b.len());
+            offsets.push(total);
+        }
+
+        let buffer = PyBytes::new_with(py, total, |buf| {
+            for (content, &start) in contents.iter().zip(&offsets) {
+                if let Some(bytes) = content {
+                    buf[start..start + bytes.len()].copy_from_slice(bytes);
+                }
+            }
+            Ok(())
+        })?;
+
+        Ok((buffer, offsets))
+    }
+
+    /// Copy files in parallel using in-kernel copies where available
+    ///
+    /// Destination parent directories are created as needed. Stops at the
+    /// first failure; pairs copied before it are left in place.
+    ///
+    /// Args:
+    ///     pairs: List of (source, destination) path pairs
+    ///
+    /// Returns:
+    ///     Total number of bytes copied
+    pub fn copy_batch(&self, py: Python<'_>, pairs: Vec<(String, String)>) -> PyResult<u64> {
+        let full_pairs: Vec<(PathBuf, PathBuf)> = pairs
+            .iter()
+            .map(|(src, dst)| (self.resolve_path(src), self.resolve_path(dst)))
+            .collect();
+        io::copy_batch(py, &full_pairs)
+    }
+
+    /// Memory-map a file for zero-copy reading
+    ///
+    /// Args:
+    ///     path: File path (relative to root or absolute)
+    ///
+    /// Returns:
+    ///     MmapFile supporting the buffer protocol (wrap in memoryview)
+    pub fn read_file_view(&self, py: Python<'_>, path: &str) -> PyResult<io::MmapFile> {
+        let full_path = self.resolve_path(path);
+        io::read_file_view(py, &full_path)
+    }
+
     /// Read specific lines from a file (for large files)
     ///
     /// Efficiently reads a range of lines without loading the entire file.
@@ -184,6 +330,27 @@ impl FileSystem {
         io::read_lines(py, &full_path, start_line, count)
     }
 
+    /// Iterate over lines of a file without building a list
+    ///
+    /// Args:
+    ///     path: File path
+    ///     start_line: Starting line number (0-indexed)
+    ///     count: Number of lines to yield (None = read to end)
+    ///
+    /// Returns:
+    ///     Iterator of line strings (without trailing newlines)
+    #[pyo3(signature = (path, start_line = 0, count = None))]
+    pub fn read_lines_iter(
+        &self,
+        py: Python<'_>,
+        path: &str,
+        start_line: usize,
+        count: Option<usize>,
+    ) -> PyResult<io::LinesIter> {
+        let full_path = self.resolve_path(path);
+        io::read_lines_iter(py, &full_path, start_line, count)
+    }
+
     /// Read a byte range from a file
     ///
     /// Args:
@@ -276,10 +443,13 @@ impl FileSystem {
     ///     glob_pattern: File pattern to search in
     ///     case_sensitive: Case sensitive search
     ///     max_results: Maximum number of results
+    ///     before: Context lines to attach before each match
+    ///     after: Context lines to attach after each match
     ///
     /// Returns:
     ///     List of SearchResult objects
-    #[pyo3(signature = (query, glob_pattern = "**/*", case_sensitive = false, max_results = 1000))]
+    #[pyo3(signature = (query, glob_pattern = "**/*", case_sensitive = false, max_results = 1000, before = 0, after = 0))]
+    #[allow(clippy::too_many_arguments)]
     pub fn grep(
         &self,
         py: Python<'_>,
@@ -287,31 +457,108 @@ impl FileSystem {
         glob_pattern: &str,
         case_sensitive: bool,
         max_results: usize,
+        before: usize,
+        after: usize,
     ) -> PyResult<Vec<SearchResult>> {
-        let options = SearchOptions {
-            case_sensitive,
-            max_results,
-            max_file_size: 10 * 1024 * 1024, // 10MB
-            context_lines: 0,
-        };
+        let options = Self::grep_options(case_sensitive, max_results).with_context(before, after);
+        py.allow_threads(|| {
+            grep_indexed(&self.index, &self.searcher, query, glob_pattern, &options)
+        })
+        .map_err(|e| e.into())
+    }
 
-        // Use index if ready, otherwise fall back to directory scan
-        if self.index.is_ready() {
-            match self.index.glob_paths(glob_pattern) {
-                Ok(files) => {
-                    return self.searcher.grep_with_files(py, query, files, &options);
-                }
-                Err(_) => {
-                    // Fall back to standard grep
-                }
+    /// Search files lazily, yielding results as they are found
+    ///
+    /// The search runs on a background thread and stops as soon as the
+    /// iterator is dropped, so callers that only need the first few matches
+    /// don't pay for the rest.
+    ///
+    /// Args:
+    ///     query: Search pattern (regex)
+    ///     glob_pattern: File pattern to search in
+    ///     case_sensitive: Case sensitive search
+    ///     max_results: Maximum number of results
+    ///
+    /// Returns:
+    ///     Iterator of SearchResult objects (in no particular order)
+    #[pyo3(signature = (query, glob_pattern = "**/*", case_sensitive = false, max_results = 1000))]
+    pub fn grep_iter(
+        &self,
+        query: &str,
+        glob_pattern: &str,
+        case_sensitive: bool,
+        max_results: usize,
+    ) -> PyResult<GrepIter> {
+        // Surface bad patterns here rather than as a silently empty iterator
+        let matcher = LineMatcher::new(query, case_sensitive)?;
+        globset::Glob::new(glob_pattern).map_err(AgentGearError::Glob)?;
+
+        let index = Arc::clone(&self.index);
+        let searcher = Arc::clone(&self.searcher);
+        let glob_pattern = glob_pattern.to_owned();
+        let options = Self::grep_options(case_sensitive, max_results);
+        let (tx, rx) = crossbeam::channel::bounded(GREP_ITER_BUFFER);
+
+        std::thread::spawn(move || {
+            let files = if index.is_ready() {
+                index.glob_paths(&glob_pattern).ok()
+            } else {
+                None
+            };
+            let (pattern, files) = match files {
+                Some(files) => ("**/*", Some(files)),
+                None => (glob_pattern.as_str(), None),
+            };
+            if let Err(e) = searcher.grep_each(&matcher, pattern, &options, files, |result| {
+                tx.send(result).is_ok()
+            }) {
+                tracing::warn!("grep_iter failed: {}", e);
             }
-        }
+        });
 
-        self.searcher.grep(py, query, glob_pattern, &options)
+        Ok(GrepIter::new(rx))
+    }
+
+    /// Search files for several literal queries in a single pass
+    ///
+    /// Every file is read and scanned once for all queries, which is much
+    /// cheaper than calling grep() once per query.
+    ///
+    /// Args:
+    ///     queries: Literal strings to search for (not regexes)
+    ///     glob_pattern: File pattern to search in
+    ///     case_sensitive: Case sensitive search (ASCII-only folding otherwise)
+    ///     max_results: Maximum number of results per query
+    ///
+    /// Returns:
+    ///     Dict mapping each query to its list of SearchResult objects
+    #[pyo3(signature = (queries, glob_pattern = "**/*", case_sensitive = false, max_results = 1000))]
+    pub fn grep_multi(
+        &self,
+        py: Python<'_>,
+        queries: Vec<String>,
+        glob_pattern: &str,
+        case_sensitive: bool,
+        max_results: usize,
+    ) -> PyResult<std::collections::HashMap<String, Vec<SearchResult>>> {
+        let options = Self::grep_options(case_sensitive, max_results);
+        py.allow_threads(|| {
+            grep_multi_indexed(
+                &self.index,
+                &self.searcher,
+                &queries,
+                glob_pattern,
+                &options,
+            )
+        })
+        .map_err(|e| e.into())
     }
 
     /// Get file metadata
     ///
+    /// Served from the in-memory index, so this does not release the GIL:
+    /// the lookup is cheaper than the release/reacquire round trip.
+    ///
     /// Args:
     ///     path: File path
     ///
@@ -324,9 +571,35 @@ impl FileSystem {
             .ok_or_else(|| AgentGearError::PathNotFound(path.to_string()).into())
     }
 
+    /// Take an immutable snapshot of the file index
+    ///
+    /// The snapshot answers list/glob/get_metadata without taking any locks
+    /// and does not change when files change afterwards.
+    ///
+    /// Returns:
+    ///     FileSystemSnapshot
+    ///
+    /// Raises:
+    ///     RuntimeError: If the index is not ready yet
+    pub fn snapshot(&self, py: Python<'_>) -> PyResult<index::IndexSnapshot> {
+        let index = Arc::clone(&self.index);
+        py.allow_threads(|| index::IndexSnapshot::new(index))
+            .map_err(|e| e.into())
+    }
+
     /// Force refresh the file index
-    pub fn refresh(&self) -> PyResult<()> {
-        self.index.refresh().map_err(|e| e.into())
+    pub fn refresh(&self, py: Python<'_>) -> PyResult<()> {
+        // Rebuilding walks the whole tree; let other threads run meanwhile
+        py.allow_threads(|| self.index.refresh())
+            .map_err(|e| e.into())
+    }
+
+    /// Report the SIMD instruction set used by the search routines
+    ///
+    /// Returns:
+    ///     "avx2", "sse2", "neon" or "none"
+    pub fn simd_backend(&self) -> &'static str {
+        searcher::simd_backend()
     }
 
     /// Check if the index is ready
@@ -334,6 +607,199 @@ impl FileSystem {
         self.index.is_ready()
     }
 
+    /// Block until the index is ready
+    ///
+    /// Waits on a condition variable signaled by the indexer, with the GIL
+    /// released, so the caller wakes as soon as the build completes. The wait
+    /// is split into slices so Ctrl-C can interrupt a long timeout.
+    ///
+    /// Args:
+    ///     timeout: Maximum time to wait in seconds
+    ///
+    /// Returns:
+    ///     True if the index is ready, False if the timeout was reached
+    #[pyo3(signature = (timeout = 30.0))]
+    pub fn wait_ready(&self, py: Python<'_>, timeout: f64) -> PyResult<bool> {
+        let timeout = Duration::try_from_secs_f64(timeout.max(0.0)).unwrap_or(Duration::MAX);
+        let deadline = Instant::now().checked_add(timeout);
+        loop {
+            let remaining = match deadline {
+                Some(deadline) => deadline.saturating_duration_since(Instant::now()),
+                None => Duration::MAX,
+            };
+            let slice = remaining.min(WAIT_READY_SLICE);
+            let index = Arc::clone(&self.index);
+            if py.allow_threads(move || index.wait_ready(slice)) {
+                return Ok(true);
+            }
+            if remaining <= WAIT_READY_SLICE {
+                return Ok(false);
+            }
+            py.check_signals()?;
+        }
+    }
+
+    /// Wait for the index to be ready without blocking the event loop
+    ///
+    /// Args:
+    ///     timeout: Maximum time to wait in seconds
+    ///
+    /// Returns:
+    ///     Awaitable resolving to True if the index is ready
+    #[pyo3(signature = (timeout = 30.0))]
+    pub fn wait_ready_async<'py>(
+        &self,
+        py: Python<'py>,
+        timeout: f64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let timeout = Duration::try_from_secs_f64(timeout.max(0.0)).unwrap_or(Duration::MAX);
+        let index = Arc::clone(&self.index);
+        spawn_blocking_py(py, move || Ok(index.wait_ready(timeout)))
+    }
+
+    /// List files from the memory index, returning an awaitable
+    ///
+    /// Args:
+    ///     pattern: Glob pattern (default: "**/*")
+    ///     only_files: If true, only return files (not directories)
+    ///
+    /// Returns:
+    ///     Awaitable resolving to file paths relative to root
+    #[pyo3(signature = (pattern = "**/*", only_files = true))]
+    pub fn list_async<'py>(
+        &self,
+        py: Python<'py>,
+        pattern: &str,
+        only_files: bool,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let index = Arc::clone(&self.index);
+        let pattern = pattern.to_owned();
+        spawn_blocking_py(py, move || Ok(index.list(&pattern, only_files)?))
+    }
+
+    /// Match files using glob pattern, returning an awaitable
+    ///
+    /// Args:
+    ///     pattern: Glob pattern
+    ///
+    /// Returns:
+    ///     Awaitable resolving to matching file paths
+    pub fn glob_async<'py>(&self, py: Python<'py>, pattern: &str) -> PyResult<Bound<'py, PyAny>> {
+        let index = Arc::clone(&self.index);
+        let pattern = pattern.to_owned();
+        spawn_blocking_py(py, move || Ok(index.glob(&pattern)?))
+    }
+
+    /// Read a single file, returning an awaitable
+    ///
+    /// Args:
+    ///     path: File path (relative to root or absolute)
+    ///     encoding: Text encoding (default: "utf-8")
+    ///
+    /// Returns:
+    ///     Awaitable resolving to the file content
+    #[pyo3(signature = (path, encoding = "utf-8"))]
+    pub fn read_file_async<'py>(
+        &self,
+        py: Python<'py>,
+        path: &str,
+        encoding: &str,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let _ = encoding; // only utf-8 is supported, as in read_file
+        let full_path = self.resolve_path(path);
+        spawn_blocking_py(py, move || Ok(io::read_file_internal(&full_path)?))
+    }
+
+    /// Read multiple files in parallel, returning an awaitable
+    ///
+    /// Args:
+    ///     paths: List of file paths
+    ///
+    /// Returns:
+    ///     Awaitable resolving to a dict mapping path to content
+    pub fn read_batch_async<'py>(
+        &self,
+        py: Python<'py>,
+        paths: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let full_paths: Vec<PathBuf> = paths.iter().map(|p| self.resolve_path(p)).collect();
+        spawn_blocking_py(py, move || Ok(io::read_batch_internal(&full_paths)))
+    }
+
+    /// Search files for content matching query, returning an awaitable
+    ///
+    /// Args:
+    ///     query: Search pattern (regex)
+    ///     glob_pattern: File pattern to search in
+    ///     case_sensitive: Case sensitive search
+    ///     max_results: Maximum number of results
+    ///     before: Context lines to attach before each match
+    ///     after: Context lines to attach after each match
+    ///
+    /// Returns:
+    ///     Awaitable resolving to a list of SearchResult objects
+    #[pyo3(signature = (query, glob_pattern = "**/*", case_sensitive = false, max_results = 1000, before = 0, after = 0))]
+    #[allow(clippy::too_many_arguments)]
+    pub fn grep_async<'py>(
+        &self,
+        py: Python<'py>,
+        query: &str,
+        glob_pattern: &str,
+        case_sensitive: bool,
+        max_results: usize,
+        before: usize,
+        after: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let index = Arc::clone(&self.index);
+        let searcher = Arc::clone(&self.searcher);
+        let query = query.to_owned();
+        let glob_pattern = glob_pattern.to_owned();
+        let options = Self::grep_options(case_sensitive, max_results).with_context(before, after);
+        spawn_blocking_py(py, move || {
+            Ok(grep_indexed(
+                &index,
+                &searcher,
+                &query,
+                &glob_pattern,
+                &options,
+            )?)
+        })
+    }
+
+    /// Search files for several literal queries, returning an awaitable
+    ///
+    /// Args:
+    ///     queries: Literal strings to search for (not regexes)
+    ///     glob_pattern: File pattern to search in
+    ///     case_sensitive: Case sensitive search (ASCII-only folding otherwise)
+    ///     max_results: Maximum number of results per query
+    ///
+    /// Returns:
+    ///     Awaitable resolving to a dict mapping each query to its results
+    #[pyo3(signature = (queries, glob_pattern = "**/*", case_sensitive = false, max_results = 1000))]
+    pub fn grep_multi_async<'py>(
+        &self,
+        py: Python<'py>,
+        queries: Vec<String>,
+        glob_pattern: &str,
+        case_sensitive: bool,
+        max_results: usize,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let index = Arc::clone(&self.index);
+        let searcher = Arc::clone(&self.searcher);
+        let glob_pattern = glob_pattern.to_owned();
+        let options = Self::grep_options(case_sensitive, max_results);
+        spawn_blocking_py(py, move || {
+            Ok(grep_multi_indexed(
+                &index,
+                &searcher,
+                &queries,
+                &glob_pattern,
+                &options,
+            )?)
+        })
+    }
+
     /// Close the filesystem and release resources
     pub fn close(&self) {
         // Signal the watcher thread to stop
@@ -350,12 +816,20 @@ impl FileSystem {
         self.watcher.is_some() && !self.stop_flag.load(Ordering::SeqCst)
     }
 
+    /// Get the index generation
+    ///
+    /// A counter that changes whenever files are added to or removed from
+    /// the index; list() results obtained at the same generation are
+    /// still current.
+    pub fn generation(&self) -> u64 {
+        self.index.generation()
+    }
+
     /// Get the number of pending file change events
-    pub fn pending_changes(&self) -> usize {
+    pub fn pending_changes(&self, py: Python<'_>) -> usize {
         if let Some(ref watcher) = self.watcher {
-            // Process events and return count
-            let events = watcher.process_events();
-            events.len()
+            // Process events and return count (contends with the watcher thread)
+            py.allow_threads(|| watcher.process_events().len())
         } else {
             0
         }
@@ -378,6 +852,18 @@ impl FileSystem {
 }
 
 impl FileSystem {
+    /// Search options used by `grep` and `grep_async`
+    fn grep_options(case_sensitive: bool, max_results: usize) -> SearchOptions {
+        SearchOptions {
+            case_sensitive,
+            max_results,
+            max_file_size: 10 * 1024 * 1024, // 10MB
+            context_lines: 0,
+            before_context: None,
+            after_context: None,
+        }
+    }
+
     /// Resolve a path relative to the root directory
     fn resolve_path(&self, path: &str) -> PathBuf {
         let path = PathBuf::from(path);
@@ -432,3 +918,54 @@ impl FileSystem {
         }
     }
 }
+
+/// Grep using the index's file list when it is ready
+///
+/// Falls back to a directory walk while the index is still building or if
+/// the glob cannot be served from the index.
+fn grep_indexed(
+    index: &FileIndex,
+    searcher: &Searcher,
+    query: &str,
+    glob_pattern: &str,
+    options: &SearchOptions,
+) -> crate::utils::error::Result<Vec<SearchResult>> {
+    if index.is_ready() {
+        if let Ok(files) = index.glob_paths(glob_pattern) {
+            return searcher.grep_internal(query, "**/*", options, Some(files));
+        }
+    }
+    searcher.grep_internal(query, glob_pattern, options, None)
+}
+
+/// Multi-query grep using the index's file list when it is ready
+fn grep_multi_indexed(
+    index: &FileIndex,
+    searcher: &Searcher,
+    queries: &[String],
+    glob_pattern: &str,
+    options: &SearchOptions,
+) -> crate::utils::error::Result<std::collections::HashMap<String, Vec<SearchResult>>> {
+    if index.is_ready() {
+        if let Ok(files) = index.glob_paths(glob_pattern) {
+            return searcher.grep_multi_internal(queries, "**/*", options, Some(files));
+        }
+    }
+    searcher.grep_multi_internal(queries, glob_pattern, options, None)
+}
+
+/// Run blocking work on Tokio's blocking pool and hand Python an awaitable
+///
+/// The awaitable resolves on the caller's event loop, so async callers do not
+/// tie up a thread from asyncio's default executor.
+fn spawn_blocking_py<'py, T, F>(py: Python<'py>, f: F) -> PyResult<Bound<'py, PyAny>>
+where
+    F: FnOnce() -> PyResult<T> + Send + 'static,
+    T: for<'a> IntoPyObject<'a> + Send + 'static,
+{
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        tokio::task::spawn_blocking(f)
+            .await
+            .map_err(|e| PyErr::from(AgentGearError::Internal(e.to_string())))?
+    })
+}
@@ -2,10 +2,13 @@
 //!
 //! Provides grep-like search functionality using the ripgrep core libraries.
 
+use aho_corasick::AhoCorasick;
+use crossbeam::channel::Receiver;
 use globset::{Glob, GlobMatcher};
 use memmap2::Mmap;
 use pyo3::prelude::*;
 use rayon::prelude::*;
+use std::collections::HashMap;
 use std::fs::File;
 use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
@@ -32,23 +35,56 @@ pub struct SearchOptions {
     /// Number of context lines before/after match
     #[pyo3(get, set)]
     pub context_lines: usize,
+
+    /// Context lines before a match (overrides `context_lines` when set)
+    #[pyo3(get, set)]
+    pub before_context: Option<usize>,
+
+    /// Context lines after a match (overrides `context_lines` when set)
+    #[pyo3(get, set)]
+    pub after_context: Option<usize>,
 }
 
 #[pymethods]
 impl SearchOptions {
     #[new]
-    #[pyo3(signature = (case_sensitive = false, max_results = 1000, max_file_size = 10485760, context_lines = 0))]
+    #[pyo3(signature = (case_sensitive = false, max_results = 1000, max_file_size = 10485760, context_lines = 0, before_context = None, after_context = None))]
     fn new(
         case_sensitive: bool,
         max_results: usize,
         max_file_size: u64,
         context_lines: usize,
+        before_context: Option<usize>,
+        after_context: Option<usize>,
     ) -> Self {
         Self {
             case_sensitive,
             max_results,
             max_file_size,
             context_lines,
+            before_context,
+            after_context,
+        }
+    }
+}
+
+impl SearchOptions {
+    /// Effective number of context lines before a match
+    pub fn lines_before(&self) -> usize {
+        self.before_context.unwrap_or(self.context_lines)
+    }
+
+    /// Effective number of context lines after a match
+    pub fn lines_after(&self) -> usize {
+        self.after_context.unwrap_or(self.context_lines)
+    }
+
+    /// Set separate before/after context line counts
+    pub fn with_context(self, before: usize, after: usize) -> Self {
+        Self {
+            before_context: Some(before),
+            after_context: Some(after),
+            ..self
         }
     }
 }
@@ -60,6 +96,8 @@ impl Default for SearchOptions {
             max_results: 1000,
             max_file_size: 10 * 1024 * 1024, // 10MB
             context_lines: 0,
+            before_context: None,
+            after_context: None,
         }
     }
 }
@@ -105,6 +143,128 @@ impl SearchResult {
     }
 }
 
+/// Regexes used by `Searcher::search_file`
+pub(crate) struct LineMatcher {
+    /// Finds candidates across a whole buffer (`^`/`$` match at line breaks);
+    /// `None` if the query anchors to the start or end of the haystack
+    scan: Option<regex::Regex>,
+    /// Decides whether a single line matches, exactly as a per-line search
+    line: regex::Regex,
+}
+
+impl LineMatcher {
+    pub(crate) fn new(query: &str, case_sensitive: bool) -> Result<Self> {
+        let build = |multi_line: bool| {
+            regex::RegexBuilder::new(query)
+                .case_insensitive(!case_sensitive)
+                .multi_line(multi_line)
+                .crlf(multi_line)
+                .build()
+                .map_err(|e| AgentGearError::Regex(e.to_string()))
+        };
+        let line = build(false)?;
+        // `\A`, `\z` and `(?-m)^`/`$` match at every line when each line is
+        // its own haystack, but only at the ends of a whole buffer, so such
+        // queries have to be matched line by line
+        let anchored = regex_syntax::ParserBuilder::new()
+            .multi_line(true)
+            .build()
+            .parse(query)
+            .map_or(true, |hir| {
+                hir.properties().look_set().contains_anchor_haystack()
+            });
+        Ok(Self {
+            scan: if anchored { None } else { Some(build(true)?) },
+            line,
+        })
+    }
+}
+
+/// Up to `n` lines preceding the line that starts at `line_start`
+fn lines_before(content: &str, line_start: usize, n: usize) -> Vec<String> {
+    let bytes = content.as_bytes();
+    let mut lines = Vec::with_capacity(n);
+    let mut start = line_start;
+    while lines.len() < n && start > 0 {
+        let end = start - 1; // the '\n' ending the previous line
+        let begin = memchr::memrchr(b'\n', &bytes[..end]).map_or(0, |i| i + 1);
+        let line = &content[begin..end];
+        lines.push(line.strip_suffix('\r').unwrap_or(line).to_string());
+        start = begin;
+    }
+    lines.reverse();
+    lines
+}
+
+/// Up to `n` lines following the line that ends at `line_end`
+fn lines_after(content: &str, line_end: usize, n: usize) -> Vec<String> {
+    let bytes = content.as_bytes();
+    let mut lines = Vec::with_capacity(n);
+    let mut start = line_end + 1;
+    while lines.len() < n && start < content.len() {
+        let end = memchr::memchr(b'\n', &bytes[start..]).map_or(content.len(), |i| start + i);
+        let line = &content[start..end];
+        let line = if end < content.len() {
+            line.strip_suffix('\r').unwrap_or(line)
+        } else {
+            line
+        };
+        lines.push(line.to_string());
+        start = end + 1;
+    }
+    lines
+}
+
+/// Widest vector instruction set used by the literal search routines
+///
+/// `memchr`, `aho-corasick` and `regex` pick their SIMD implementation at
+/// runtime; this reports what that selection resolves to on this CPU.
+pub fn simd_backend() -> &'static str {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            "avx2"
+        } else {
+            "sse2"
+        }
+    }
+    #[cfg(target_arch = "aarch64")]
+    {
+        "neon"
+    }
+    #[cfg(not(any(target_arch = "x86_64", target_arch = "aarch64")))]
+    {
+        "none"
+    }
+}
+
+/// Iterator over grep results produced by a background search
+///
+/// Results arrive as files finish scanning, in no particular order. Dropping
+/// the iterator stops the search.
+#[pyclass(frozen)]
+pub struct GrepIter {
+    rx: Receiver<SearchResult>,
+}
+
+impl GrepIter {
+    pub(crate) fn new(rx: Receiver<SearchResult>) -> Self {
+        Self { rx }
+    }
+}
+
+#[pymethods]
+impl GrepIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&self, py: Python<'_>) -> Option<SearchResult> {
+        // Wait for the producer without holding the GIL
+        py.allow_threads(|| self.rx.recv().ok())
+    }
+}
+
 /// Search engine for file content
 pub struct Searcher {
     root: PathBuf,
@@ -140,7 +300,8 @@ impl Searcher {
             .map_err(|e| e.into())
     }
 
-    fn grep_internal(
+    /// Search without touching the GIL (callers release it or run off-thread)
+    pub(crate) fn grep_internal(
         &self,
         query: &str,
         glob_pattern: &str,
@@ -148,24 +309,10 @@ impl Searcher {
         pre_collected_files: Option<Vec<PathBuf>>,
     ) -> Result<Vec<SearchResult>> {
         // Build regex pattern
-        let regex = if options.case_sensitive {
-            regex::Regex::new(query)
-        } else {
-            regex::RegexBuilder::new(query)
-                .case_insensitive(true)
-                .build()
-        }
-        .map_err(|e| AgentGearError::Regex(e.to_string()))?;
+        let matcher = LineMatcher::new(query, options.case_sensitive)?;
 
         // Get files to search
-        let files = if let Some(files) = pre_collected_files {
-            files
-        } else {
-            let glob_matcher = Glob::new(glob_pattern)
-                .map(|g| g.compile_matcher())
-                .map_err(AgentGearError::Glob)?;
-            self.collect_files(&glob_matcher, options.max_file_size)?
-        };
+        let files = self.files_to_search(glob_pattern, options, pre_collected_files)?;
 
         // Counter for limiting results
         let result_count = Arc::new(AtomicUsize::new(0));
@@ -187,7 +334,7 @@ impl Searcher {
 
                 self.search_file(
                     path,
-                    &regex,
+                    &matcher,
                     options,
                     &result_count,
                     &cancelled,
@@ -203,6 +350,143 @@ impl Searcher {
         Ok(results)
     }
 
+    /// Search files in parallel, handing each match to `emit` as found
+    ///
+    /// Stops early once `emit` returns false or `max_results` matches have
+    /// been produced. Results are emitted file by file in completion order.
+    pub(crate) fn grep_each<F>(
+        &self,
+        matcher: &LineMatcher,
+        glob_pattern: &str,
+        options: &SearchOptions,
+        pre_collected_files: Option<Vec<PathBuf>>,
+        emit: F,
+    ) -> Result<()>
+    where
+        F: Fn(SearchResult) -> bool + Sync,
+    {
+        let files = self.files_to_search(glob_pattern, options, pre_collected_files)?;
+
+        let result_count = Arc::new(AtomicUsize::new(0));
+        let cancelled = AtomicBool::new(false);
+
+        files.par_iter().for_each(|path| {
+            if cancelled.load(Ordering::Relaxed) {
+                return;
+            }
+
+            let results = self
+                .search_file(
+                    path,
+                    matcher,
+                    options,
+                    &result_count,
+                    &cancelled,
+                    options.max_results,
+                )
+                .unwrap_or_default();
+
+            for result in results {
+                if !emit(result) {
+                    cancelled.store(true, Ordering::Relaxed);
+                    return;
+                }
+            }
+        });
+
+        Ok(())
+    }
+
+    /// Search for several literal queries in one pass per file
+    ///
+    /// All queries are compiled into a single Aho-Corasick automaton, so each
+    /// file is read and scanned once no matter how many queries are given.
+    /// Case-insensitive matching folds ASCII letters only.
+    ///
+    /// # Returns
+    /// Map from each query to its matches (at most `max_results` per query)
+    pub fn grep_multi(
+        &self,
+        py: Python<'_>,
+        queries: &[String],
+        glob_pattern: &str,
+        options: &SearchOptions,
+    ) -> PyResult<HashMap<String, Vec<SearchResult>>> {
+        py.allow_threads(|| self.grep_multi_internal(queries, glob_pattern, options, None))
+            .map_err(|e| e.into())
+    }
+
+    /// Multi-query search without touching the GIL
+    pub(crate) fn grep_multi_internal(
+        &self,
+        queries: &[String],
+        glob_pattern: &str,
+        options: &SearchOptions,
+        pre_collected_files: Option<Vec<PathBuf>>,
+    ) -> Result<HashMap<String, Vec<SearchResult>>> {
+        // Pattern ids index into this list, so duplicates are dropped up front
+        let mut unique: Vec<&str> = Vec::with_capacity(queries.len());
+        for query in queries {
+            if !unique.contains(&query.as_str()) {
+                unique.push(query);
+            }
+        }
+
+        let mut grouped: HashMap<String, Vec<SearchResult>> =
+            unique.iter().map(|q| (q.to_string(), Vec::new())).collect();
+        if unique.is_empty() {
+            return Ok(grouped);
+        }
+
+        let automaton = AhoCorasick::builder()
+            .ascii_case_insensitive(!options.case_sensitive)
+            .build(&unique)
+            .map_err(|e| AgentGearError::Pattern(e.to_string()))?;
+
+        let files = self.files_to_search(glob_pattern, options, pre_collected_files)?;
+
+        // Per-query result counters
+        let counts: Vec<AtomicUsize> = unique.iter().map(|_| AtomicUsize::new(0)).collect();
+        let max_results = options.max_results;
+
+        let matches: Vec<(usize, SearchResult)> = files
+            .par_iter()
+            .flat_map(|path| {
+                if counts
+                    .iter()
+                    .all(|c| c.load(Ordering::Relaxed) >= max_results)
+                {
+                    return Vec::new();
+                }
+                self.search_file_multi(path, &automaton, &counts, max_results)
+            })
+            .collect();
+
+        for (id, result) in matches {
+            if let Some(bucket) = grouped.get_mut(unique[id]) {
+                bucket.push(result);
+            }
+        }
+
+        Ok(grouped)
+    }
+
+    /// Resolve the files a search should cover
+    fn files_to_search(
+        &self,
+        glob_pattern: &str,
+        options: &SearchOptions,
+        pre_collected_files: Option<Vec<PathBuf>>,
+    ) -> Result<Vec<PathBuf>> {
+        if let Some(files) = pre_collected_files {
+            return Ok(files);
+        }
+        let glob_matcher = Glob::new(glob_pattern)
+            .map(|g| g.compile_matcher())
+            .map_err(AgentGearError::Glob)?;
+        self.collect_files(&glob_matcher, options.max_file_size)
+    }
+
     /// Collect files matching the glob pattern
     fn collect_files(&self, glob_matcher: &GlobMatcher, max_size: u64) -> Result<Vec<PathBuf>> {
         use ignore::WalkState;
@@ -253,51 +537,53 @@ impl Searcher {
     }
 
     /// Search a single file for matches using mmap for large files
+    ///
+    /// The regex runs over the whole buffer rather than line by line, so its
+    /// SIMD literal prefilter gets long runs of bytes to skip through; each
+    /// candidate is then confirmed against its own line.
     fn search_file(
         &self,
         path: &Path,
-        regex: &regex::Regex,
+        matcher: &LineMatcher,
         options: &SearchOptions,
         result_count: &Arc<AtomicUsize>,
         cancel_flag: &AtomicBool,
         max_results: usize,
     ) -> Result<Vec<SearchResult>> {
+        use std::io::Read;
+
         if cancel_flag.load(Ordering::Relaxed) {
             return Ok(Vec::new());
         }
 
-        // Get file size
-        let metadata = match std::fs::metadata(path) {
-            Ok(m) => m,
+        let file = match File::open(path) {
+            Ok(f) => f,
             Err(_) => return Ok(Vec::new()),
         };
-
-        let file_size = metadata.len() as usize;
-
-        // Use mmap for larger files (> 32KB), regular read for smaller
-        let content: String = if file_size > 32 * 1024 {
-            // Memory-mapped read
-            let file = match File::open(path) {
-                Ok(f) => f,
-                Err(_) => return Ok(Vec::new()),
-            };
-            let mmap = match unsafe { Mmap::map(&file) } {
+        let file_size = file.metadata().map(|m| m.len()).unwrap_or(0);
+
+        // Use mmap for larger files (> 32KB), regular read for smaller;
+        // either way the content is borrowed, not copied into a String
+        let mmap;
+        let mut buffer = Vec::new();
+        let bytes: &[u8] = if file_size > 32 * 1024 {
+            mmap = match unsafe { Mmap::map(&file) } {
                 Ok(m) => m,
                 Err(_) => return Ok(Vec::new()),
             };
-            match std::str::from_utf8(&mmap) {
-                Ok(s) => s.to_string(),
-                Err(_) => return Ok(Vec::new()), // Skip non-UTF8 files
-            }
+            &mmap
         } else {
-            // Regular read for small files
-            match std::fs::read_to_string(path) {
-                Ok(c) => c,
-                Err(_) => return Ok(Vec::new()),
+            if (&file).read_to_end(&mut buffer).is_err() {
+                return Ok(Vec::new());
             }
+            &buffer
+        };
+
+        let content = match std::str::from_utf8(bytes) {
+            Ok(s) => s,
+            Err(_) => return Ok(Vec::new()), // Skip non-UTF8 files
         };
 
-        let lines: Vec<&str> = content.lines().collect();
         let mut results = Vec::new();
 
         let relative_path = path
@@ -306,7 +592,13 @@ impl Searcher {
             .to_string_lossy()
             .to_string();
 
-        for (i, line) in lines.iter().enumerate() {
+        // Line number bookkeeping: newlines are counted incrementally up to
+        // `counted_to`, which only ever moves forward
+        let mut line_number = 1usize;
+        let mut counted_to = 0usize;
+        let mut pos = 0usize;
+
+        while pos <= content.len() {
             // Check if we've hit the limit
             if cancel_flag.load(Ordering::Relaxed)
                 || result_count.load(Ordering::Relaxed) >= max_results
@@ -314,57 +606,174 @@ impl Searcher {
                 break;
             }
 
-            if regex.is_match(line) {
-                // Collect context lines
-                let context_before: Vec<String> = if options.context_lines > 0 {
-                    let start = i.saturating_sub(options.context_lines);
-                    lines[start..i].iter().map(|s| s.to_string()).collect()
-                } else {
-                    Vec::new()
-                };
+            let candidate = match &matcher.scan {
+                Some(scan) => match scan.find_at(content, pos) {
+                    Some(m) => m.start(),
+                    None => break,
+                },
+                // Every line is a candidate
+                None => pos,
+            };
 
-                let context_after: Vec<String> = if options.context_lines > 0 {
-                    let end = (i + 1 + options.context_lines).min(lines.len());
-                    lines[(i + 1)..end].iter().map(|s| s.to_string()).collect()
-                } else {
-                    Vec::new()
-                };
+            // A match at the very end sits past the last line
+            if candidate == content.len() && (content.is_empty() || content.ends_with('\n')) {
+                break;
+            }
 
-                let updated =
-                    result_count.fetch_update(Ordering::Relaxed, Ordering::Relaxed, |current| {
-                        if current >= max_results {
-                            None
-                        } else {
-                            Some(current + 1)
-                        }
-                    });
+            // Expand the candidate to its enclosing line
+            let line_start = memchr::memrchr(b'\n', &bytes[..candidate]).map_or(0, |i| i + 1);
+            let line_end = memchr::memchr(b'\n', &bytes[line_start..])
+                .map_or(content.len(), |i| line_start + i);
+            let line = &content[line_start..line_end];
+            let line = if line_end < content.len() {
+                line.strip_suffix('\r').unwrap_or(line)
+            } else {
+                line
+            };
 
-                match updated {
-                    Ok(prev) => {
-                        results.push(SearchResult {
-                            file: relative_path.clone(),
-                            line_number: (i + 1) as u32,
-                            content: line.to_string(),
-                            context_before,
-                            context_after,
-                        });
-
-                        if prev + 1 >= max_results {
-                            cancel_flag.store(true, Ordering::Relaxed);
-                            break;
-                        }
+            line_number += memchr::memchr_iter(b'\n', &bytes[counted_to..line_start]).count();
+            counted_to = line_start;
+            pos = line_end + 1;
+
+            // Confirm on the line alone (a buffer-wide match may span lines)
+            if !matcher.line.is_match(line) {
+                continue;
+            }
+
+            // Collect context lines from the buffer already in hand
+            let context_before = match options.lines_before() {
+                0 => Vec::new(),
+                count => lines_before(content, line_start, count),
+            };
+
+            let context_after = match options.lines_after() {
+                0 => Vec::new(),
+                count => lines_after(content, line_end, count),
+            };
+
+            let updated =
+                result_count.fetch_update(Ordering::Relaxed, Ordering::Relaxed, |current| {
+                    if current >= max_results {
+                        None
+                    } else {
+                        Some(current + 1)
                     }
-                    Err(_) => {
+                });
+
+            match updated {
+                Ok(prev) => {
+                    results.push(SearchResult {
+                        file: relative_path.clone(),
+                        line_number: line_number as u32,
+                        content: line.to_string(),
+                        context_before,
+                        context_after,
+                    });
+
+                    if prev + 1 >= max_results {
                         cancel_flag.store(true, Ordering::Relaxed);
                         break;
                     }
                 }
+                Err(_) => {
+                    cancel_flag.store(true, Ordering::Relaxed);
+                    break;
+                }
             }
         }
 
         Ok(results)
     }
 
+    /// Search a single file for every query in an Aho-Corasick automaton
+    ///
+    /// Returns `(pattern id, result)` pairs; a line matching several queries
+    /// yields one result per query.
+    fn search_file_multi(
+        &self,
+        path: &Path,
+        automaton: &AhoCorasick,
+        counts: &[AtomicUsize],
+        max_results: usize,
+    ) -> Vec<(usize, SearchResult)> {
+        use std::io::Read;
+
+        let file = match File::open(path) {
+            Ok(f) => f,
+            Err(_) => return Vec::new(),
+        };
+        let file_size = file.metadata().map(|m| m.len()).unwrap_or(0);
+
+        // Same mmap cutoff as search_file; the bytes are borrowed, not copied
+        let mmap;
+        let mut buffer = Vec::new();
+        let bytes: &[u8] = if file_size > 32 * 1024 {
+            mmap = match unsafe { Mmap::map(&file) } {
+                Ok(m) => m,
+                Err(_) => return Vec::new(),
+            };
+            &mmap
+        } else {
+            if (&file).read_to_end(&mut buffer).is_err() {
+                return Vec::new();
+            }
+            &buffer
+        };
+
+        // A single automaton pass rejects files without any hit
+        if !automaton.is_match(bytes) {
+            return Vec::new();
+        }
+
+        let content = match std::str::from_utf8(bytes) {
+            Ok(s) => s,
+            Err(_) => return Vec::new(), // Skip non-UTF8 files
+        };
+
+        let relative_path = path
+            .strip_prefix(&self.root)
+            .unwrap_or(path)
+            .to_string_lossy()
+            .to_string();
+
+        let mut results = Vec::new();
+        let mut hits: Vec<usize> = Vec::new();
+
+        for (i, line) in content.lines().enumerate() {
+            hits.clear();
+            hits.extend(
+                automaton
+                    .find_overlapping_iter(line)
+                    .map(|m| m.pattern().as_usize()),
+            );
+            hits.sort_unstable();
+            hits.dedup();
+
+            for &id in &hits {
+                let claimed = counts[id]
+                    .fetch_update(Ordering::Relaxed, Ordering::Relaxed, |current| {
+                        (current < max_results).then_some(current + 1)
+                    })
+                    .is_ok();
+
+                if claimed {
+                    results.push((
+                        id,
+                        SearchResult {
+                            file: relative_path.clone(),
+                            line_number: (i + 1) as u32,
+                            content: line.to_string(),
+                            context_before: Vec::new(),
+                            context_after: Vec::new(),
+                        },
+                    ));
+                }
+            }
+        }
+
+        results
+    }
+
     /// Check if a file appears to be binary
     fn is_binary_file(path: &Path) -> bool {
         use std::io::Read;
@@ -480,6 +889,117 @@ pub fn goodbye() {
         });
     }
 
+    #[test]
+    fn test_search_line_numbers_and_context() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            std::fs::write(dir.path().join("a.txt"), "one\r\ntwo\nthree\nfour\n").unwrap();
+
+            let searcher = Searcher::new(dir.path().to_path_buf());
+            let options = SearchOptions {
+                context_lines: 1,
+                ..Default::default()
+            };
+
+            let results = searcher.grep(py, "^t", "**/*", &options).unwrap();
+            assert_eq!(results.len(), 2);
+            assert_eq!(results[0].line_number, 2);
+            assert_eq!(results[0].context_before, vec!["one"]);
+            assert_eq!(results[0].context_after, vec!["three"]);
+            assert_eq!(results[1].line_number, 3);
+            assert_eq!(results[1].content, "three");
+
+            let options = SearchOptions {
+                context_lines: 1,
+                before_context: Some(0),
+                after_context: Some(2),
+                ..Default::default()
+            };
+            let results = searcher.grep(py, "^two", "**/*", &options).unwrap();
+            assert!(results[0].context_before.is_empty());
+            assert_eq!(results[0].context_after, vec!["three", "four"]);
+
+            // A pattern spanning a line break never matches a single line
+            let results = searcher.grep(py, "e\\s+two", "**/*", &options).unwrap();
+            assert!(results.is_empty());
+
+            // An empty pattern matches each line once, not past the end
+            let results = searcher.grep(py, "", "**/*", &options).unwrap();
+            assert_eq!(results.len(), 4);
+        });
+    }
+
+    #[test]
+    fn test_search_haystack_anchors_match_per_line() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            std::fs::write(dir.path().join("a.txt"), "one\r\ntwo\nthree\nfour\n").unwrap();
+
+            let searcher = Searcher::new(dir.path().to_path_buf());
+            let options = SearchOptions::default();
+            let line_numbers = |query: &str| -> Vec<u32> {
+                let results = searcher.grep(py, query, "**/*", &options).unwrap();
+                results.iter().map(|r| r.line_number).collect()
+            };
+
+            // Each line is its own haystack, as before the whole-buffer scan
+            assert_eq!(line_numbers("\\At"), vec![2, 3]);
+            assert_eq!(line_numbers("(?-m)^t"), vec![2, 3]);
+            assert_eq!(line_numbers("o\\z"), vec![2]);
+            assert_eq!(line_numbers("(?-m)e$"), vec![1, 3]);
+            assert_eq!(line_numbers("\\A\\z"), Vec::<u32>::new());
+        });
+    }
+
+    #[test]
+    fn test_grep_each_stops_early() {
+        let dir = tempdir().unwrap();
+        // A single matching file, so no other worker can emit concurrently
+        std::fs::write(dir.path().join("a.txt"), "needle 1\nneedle 2\nneedle 3\n").unwrap();
+        std::fs::write(dir.path().join("b.txt"), "haystack\n").unwrap();
+
+        let searcher = Searcher::new(dir.path().to_path_buf());
+        let matcher = LineMatcher::new("needle", false).unwrap();
+        let options = SearchOptions::default();
+
+        let seen = AtomicUsize::new(0);
+        searcher
+            .grep_each(&matcher, "**/*", &options, None, |_| {
+                seen.fetch_add(1, Ordering::Relaxed);
+                false
+            })
+            .unwrap();
+        assert_eq!(seen.load(Ordering::Relaxed), 1);
+    }
+
+    #[test]
+    fn test_grep_multi() {
+        pyo3::prepare_freethreaded_python();
+        Python::with_gil(|py| {
+            let dir = tempdir().unwrap();
+            create_test_files(dir.path());
+
+            let searcher = Searcher::new(dir.path().to_path_buf());
+            let options = SearchOptions::default();
+            let queries = vec![
+                "hello".to_string(),
+                "goodbye".to_string(),
+                "missing".to_string(),
+            ];
+
+            let results = searcher
+                .grep_multi(py, &queries, "**/*.rs", &options)
+                .unwrap();
+            assert_eq!(results.len(), 3);
+            // Case insensitive by default: "Hello" and "hello" both match
+            assert_eq!(results["hello"].len(), 3);
+            assert_eq!(results["goodbye"].len(), 2);
+            assert!(results["missing"].is_empty());
+        });
+    }
+
     #[test]
     fn test_search_max_results() {
         pyo3::prepare_freethreaded_python();
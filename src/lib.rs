@@ -22,9 +22,15 @@ fn _rust_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Register search result types
     m.add_class::<fs::searcher::SearchResult>()?;
     m.add_class::<fs::searcher::SearchOptions>()?;
+    m.add_class::<fs::searcher::GrepIter>()?;
+
+    // Register zero-copy file views
+    m.add_class::<fs::io::MmapFile>()?;
+    m.add_class::<fs::io::LinesIter>()?;
 
     // Register metadata types
     m.add_class::<fs::index::FileMetadata>()?;
+    m.add_class::<fs::index::IndexSnapshot>()?;
 
     // Module version
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
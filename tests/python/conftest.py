@@ -0,0 +1,178 @@
+"""Shared fixtures for the agent_gear Python tests."""
+
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from agent_gear import AsyncFileSystem, FileSystem
+from agent_gear.python_backend import PythonFileBackend
+
+
+def _create_project(root):
+    """Populate root with the sample project and return it."""
+    # Create directory structure
+    (root / "src").mkdir()
+    (root / "tests").mkdir()
+
+    # Create files
+    (root / "src" / "main.py").write_text(
+        '''"""Main module."""
+
+def main():
+    """Entry point."""
+    print("Hello, World!")
+
+if __name__ == "__main__":
+    main()
+'''
+    )
+
+    (root / "src" / "utils.py").write_text(
+        '''"""Utility functions."""
+
+def helper():
+    """A helper function."""
+    return 42
+
+def another_helper():
+    """Another helper."""
+    return "hello"
+'''
+    )
+
+    (root / "tests" / "test_main.py").write_text(
+        '''"""Tests for main module."""
+
+def test_main():
+    """Test main function."""
+    assert True
+'''
+    )
+
+    (root / "README.md").write_text("# Test Project\n\nThis is a test.")
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    """Write the sample project once per session; tests must not modify it."""
+    return _create_project(tmp_path_factory.mktemp("project_template"))
+
+
+@pytest.fixture
+def temp_project(project_template, tmp_path):
+    """Create a temporary project directory with test files."""
+    return shutil.copytree(project_template, tmp_path / "project")
+
+
+@pytest.fixture(scope="class")
+def shared_project(project_template):
+    """Project shared by a test class; tests must not modify it."""
+    return project_template
+
+
+@pytest.fixture(scope="class")
+def fs(shared_project):
+    """Open a ready FileSystem on shared_project once per test class."""
+    fs = FileSystem(str(shared_project))
+    assert fs.wait_ready(timeout=5.0)
+    yield fs
+    fs.close()
+
+
+@dataclass(frozen=True)
+class ExternalEnv:
+    """External directory with its commonly used paths precomputed as strings."""
+
+    root: Path
+    log: str
+    new_file: str
+    glob_all: str
+    glob_data: str
+
+    @classmethod
+    def at(cls, root):
+        """Build the environment for an existing external directory."""
+        return cls(
+            root=root,
+            log=str(root / "test.log"),
+            new_file=str(root / "new_file.txt"),
+            glob_all=str(root / "**" / "*"),
+            glob_data=str(root / "external" / "*"),
+        )
+
+
+def _create_external(root):
+    """Populate root with the sample external directory and return it."""
+    # Create directory structure
+    (root / "external").mkdir()
+
+    # Create files
+    (root / "external" / "data.txt").write_text("External data file content.")
+    (root / "external" / "config.json").write_text('{"key": "value"}')
+    (root / "test.log").write_text("Log line 1\nLog line 2\nLog line 3\n")
+
+    return root
+
+
+@pytest.fixture(scope="session")
+def external_template(tmp_path_factory):
+    """Write the sample external directory once per session; tests must not modify it."""
+    return _create_external(tmp_path_factory.mktemp("external_template"))
+
+
+@pytest.fixture
+def external_dir(external_template, tmp_path):
+    """Create a temporary external directory (outside project root)."""
+    return ExternalEnv.at(shutil.copytree(external_template, tmp_path / "external_root"))
+
+
+@pytest.fixture(scope="class")
+def shared_external_dir(external_template):
+    """External directory shared by a test class; tests must not modify it."""
+    return ExternalEnv.at(external_template)
+
+
+@pytest.fixture
+def make_fs():
+    """Return a factory for ready FileSystem instances closed at teardown."""
+    opened = []
+
+    def make(root, **kwargs):
+        fs = FileSystem(str(root), **kwargs)
+        assert fs.wait_ready(timeout=5.0)
+        opened.append(fs)
+        return fs
+
+    yield make
+    for fs in opened:
+        fs.close()
+
+
+@pytest.fixture
+def python_backend():
+    """Create a PythonFileBackend whose thread pool is shut down at teardown."""
+    backend = PythonFileBackend()
+    yield backend
+    backend.close()
+
+
+@pytest.fixture(scope="class")
+def fs_allow_ext(shared_project):
+    """Open a ready FileSystem with allow_external=True once per test class."""
+    fs = FileSystem(str(shared_project), allow_external=True)
+    assert fs.wait_ready(timeout=5.0)
+    yield fs
+    fs.close()
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def async_fs_allow_ext(shared_project):
+    """Open a ready AsyncFileSystem with allow_external=True once per test class."""
+    async with AsyncFileSystem(str(shared_project), allow_external=True) as fs:
+        assert await fs.wait_ready()
+        yield fs
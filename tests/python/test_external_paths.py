@@ -1,99 +1,51 @@
 """Tests for external path support in agent_gear.FileSystem."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def temp_project():
-    """Create a temporary project directory with test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-
-        # Create directory structure
-        (root / "src").mkdir()
-
-        # Create files
-        (root / "src" / "main.py").write_text(
-            '''"""Main module."""
-
-def main():
-    """Entry point."""
-    print("Hello, World!")
-'''
-        )
-
-        (root / "README.md").write_text("# Test Project\n\nThis is a test.")
-
-        yield root
-
-
-@pytest.fixture
-def external_dir():
-    """Create a temporary external directory (outside project root)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-
-        # Create directory structure
-        (root / "external").mkdir()
-
-        # Create files
-        (root / "external" / "data.txt").write_text("External data file content.")
-        (root / "external" / "config.json").write_text('{"key": "value"}')
-        (root / "test.log").write_text("Log line 1\nLog line 2\nLog line 3\n")
-
-        yield root
-
-
 class TestExternalPathsDisabled:
     """Tests for external path handling when allow_external=False (default)."""
 
-    def test_read_external_file_raises(self, temp_project, external_dir):
+    def test_read_external_file_raises(self, make_fs, temp_project, external_dir):
         """Test that reading external file raises ValueError."""
-        from agent_gear import FileSystem
+        fs = make_fs(temp_project, allow_external=False)
 
-        fs = FileSystem(str(temp_project), allow_external=False)
-        fs.wait_ready()
-
-        external_file = str(external_dir / "test.log")
+        external_file = external_dir.log
 
         with pytest.raises(ValueError, match="outside root directory"):
             fs.read_file(external_file)
 
-    def test_write_external_file_raises(self, temp_project, external_dir):
+    def test_write_external_file_raises(self, make_fs, temp_project, external_dir):
         """Test that writing external file raises ValueError."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=False)
-        fs.wait_ready()
+        fs = make_fs(temp_project, allow_external=False)
 
-        external_file = str(external_dir / "new_file.txt")
+        external_file = external_dir.new_file
 
         with pytest.raises(ValueError, match="outside root directory"):
             fs.write_file(external_file, "content")
 
-    def test_relative_path_still_works(self, temp_project):
-        """Test that relative paths work normally."""
-        from agent_gear import FileSystem
+    def test_read_batch_external_raises(self, make_fs, temp_project, external_dir):
+        """Test that a batch with an external path raises ValueError."""
+        fs = make_fs(temp_project, allow_external=False)
 
-        fs = FileSystem(str(temp_project), allow_external=False)
-        fs.wait_ready()
+        external_file = external_dir.log
 
+        with pytest.raises(ValueError, match="outside root directory"):
+            fs.read_batch(["src/main.py", external_file])
+
+    def test_relative_path_still_works(self, fs):
+        """Test that relative paths work normally."""
         # Relative path should work
         content = fs.read_file("src/main.py")
         assert "def main():" in content
 
-    def test_absolute_path_within_root_works(self, temp_project):
+    def test_absolute_path_within_root_works(self, fs, shared_project):
         """Test that absolute paths within root work."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=False)
-        fs.wait_ready()
-
         # Absolute path within root should work
-        abs_path = str(temp_project / "src" / "main.py")
+        abs_path = str(shared_project / "src" / "main.py")
         content = fs.read_file(abs_path)
         assert "def main():" in content
 
@@ -101,54 +53,84 @@ class TestExternalPathsDisabled:
 class TestExternalPathsEnabled:
     """Tests for external path handling when allow_external=True."""
 
-    def test_read_external_file(self, temp_project, external_dir):
+    def test_read_external_file(self, fs_allow_ext, shared_external_dir):
         """Test reading external file."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
-
-        external_file = str(external_dir / "test.log")
-        content = fs.read_file(external_file)
+        content = fs_allow_ext.read_file(shared_external_dir.log)
 
         assert "Log line 1" in content
         assert "Log line 2" in content
 
-    def test_read_lines_external(self, temp_project, external_dir):
+    def test_read_lines_external(self, fs_allow_ext, shared_external_dir):
         """Test reading lines from external file."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
-
-        external_file = str(external_dir / "test.log")
-        lines = fs.read_lines(external_file, start_line=0, count=2)
+        lines = fs_allow_ext.read_lines(shared_external_dir.log, start_line=0, count=2)
 
         assert len(lines) == 2
         assert lines[0] == "Log line 1"
         assert lines[1] == "Log line 2"
 
-    def test_write_external_file(self, temp_project, external_dir):
-        """Test writing to external file."""
-        from agent_gear import FileSystem
+    def test_read_external_large_file(self, make_fs, temp_project, external_dir):
+        """Test reading an external file above the 1 MiB mmap threshold."""
+        fs = make_fs(temp_project, allow_external=True)
+        big = external_dir.root / "big.txt"
+        big.write_bytes(("Grüße\r\n" * 200000).encode())
+
+        content = fs.read_file(str(big))
+        assert content == "Grüße\n" * 200000
+
+    def test_read_lines_external_whole_file(self, make_fs, temp_project, external_dir):
+        """Test reading every line of an external file in one call."""
+        fs = make_fs(temp_project, allow_external=True)
+        crlf = external_dir.root / "crlf.txt"
+        crlf.write_bytes(b"one\r\n\r\nthree\r\n\r\n")
+        unterminated = external_dir.root / "unterminated.txt"
+        unterminated.write_text("first\nlast")
+
+        assert fs.read_lines(external_dir.log) == ["Log line 1", "Log line 2", "Log line 3"]
+        assert fs.read_lines(str(crlf)) == ["one", "", "three", ""]
+        assert fs.read_lines(str(unterminated)) == ["first", "last"]
+        assert fs.read_lines(str(crlf), 0, 10) == fs.read_lines(str(crlf))
+
+    def test_read_file_range_external(self, fs_allow_ext, shared_external_dir):
+        """Test byte-range reads of an external file, including past EOF."""
+        log = shared_external_dir.log
+
+        assert fs_allow_ext.read_file_range(log, 4, 6) == "line 1"
+        assert fs_allow_ext.read_file_range(log, 22, 100) == "Log line 3\n"
+        assert fs_allow_ext.read_file_range(log, 1000, 10) == ""
+        assert fs_allow_ext.read_file_range(log, 22, -1) == "Log line 3\n"
+
+    def test_get_metadata_external(self, fs_allow_ext, shared_external_dir):
+        """Test getting metadata for external file."""
+        metadata = fs_allow_ext.get_metadata(shared_external_dir.log)
+
+        # Check metadata structure (dict for external paths)
+        assert "size" in metadata
+        assert "mtime" in metadata
+        assert metadata["size"] > 0
 
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
+    def test_grep_external_directory(self, fs_allow_ext, shared_external_dir):
+        """Test grep in external directory."""
+        results = fs_allow_ext.grep("Log line", shared_external_dir.glob_all)
 
-        external_file = str(external_dir / "new_file.txt")
+        # Should find matches in external files
+        assert len(results) >= 1
+        assert any("Log line" in r.content for r in results)
+
+    def test_write_external_file(self, make_fs, temp_project, external_dir):
+        """Test writing to external file."""
+        fs = make_fs(temp_project, allow_external=True)
+
+        external_file = external_dir.new_file
         fs.write_file(external_file, "New content here.")
 
         # Verify written content
         assert Path(external_file).read_text() == "New content here."
 
-    def test_edit_replace_external(self, temp_project, external_dir):
+    def test_edit_replace_external(self, make_fs, temp_project, external_dir):
         """Test editing external file."""
-        from agent_gear import FileSystem
+        fs = make_fs(temp_project, allow_external=True)
 
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
-
-        external_file = str(external_dir / "test.log")
+        external_file = external_dir.log
         result = fs.edit_replace(external_file, "Log line 1", "Modified line 1")
 
         assert result is True
@@ -156,17 +138,12 @@ class TestExternalPathsEnabled:
         assert "Modified line 1" in content
         assert "Log line 1" not in content
 
-    def test_read_batch_mixed_paths(self, temp_project, external_dir):
+    def test_read_batch_mixed_paths(self, fs_allow_ext, shared_external_dir):
         """Test reading batch of mixed internal and external paths."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
-
         internal_file = "src/main.py"
-        external_file = str(external_dir / "test.log")
+        external_file = shared_external_dir.log
 
-        results = fs.read_batch([internal_file, external_file])
+        results = fs_allow_ext.read_batch([internal_file, external_file])
 
         # Internal file may be returned with absolute path by Rust
         internal_content = None
@@ -180,15 +157,25 @@ class TestExternalPathsEnabled:
         assert "def main():" in internal_content
         assert "Log line 1" in results[external_file]
 
-    def test_list_external_directory(self, temp_project, external_dir):
-        """Test listing files in external directory."""
-        from agent_gear import FileSystem
+    def test_read_batch_external_skips_unreadable(self, make_fs, temp_project, external_dir):
+        """Test that external batch reads keep what they can read and skip the rest."""
+        fs = make_fs(temp_project, allow_external=True)
+        root = external_dir.root
+        (root / "empty.txt").write_bytes(b"")
+        (root / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+        (root / "latin1.txt").write_bytes(b"caf\xe9\n")
+        names = ("empty.txt", "crlf.txt", "latin1.txt", "missing.txt")
+        paths = [str(root / name) for name in names]
 
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
+        results = fs.read_batch([*paths, str(root / "external")])
+        assert results == {paths[0]: "", paths[1]: "one\ntwo\n"}
+
+    def test_list_external_directory(self, make_fs, temp_project, external_dir):
+        """Test listing files in external directory."""
+        fs = make_fs(temp_project, allow_external=True)
 
         # List files in external directory
-        pattern = str(external_dir / "external" / "*")
+        pattern = external_dir.glob_data
         files = fs.list(pattern)
 
         # Should find the external files
@@ -197,81 +184,230 @@ class TestExternalPathsEnabled:
         assert "data.txt" in file_names
         assert "config.json" in file_names
 
-    def test_grep_external_directory(self, temp_project, external_dir):
-        """Test grep in external directory."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
+    def test_list_external_glob_patterns(self, make_fs, temp_project, external_dir):
+        """Test glob semantics of the external listing."""
+        fs = make_fs(temp_project, allow_external=True)
+
+        def names(pattern, only_files=True):
+            return [Path(f).name for f in fs.list(str(external_dir.root / pattern), only_files)]
+
+        assert names("**/*") == ["config.json", "data.txt", "test.log"]
+        assert names("**/*.json") == ["config.json"]
+        assert names("*.log") == ["test.log"]
+        assert names("*", only_files=False) == ["external", "test.log"]
+        assert names("external/[cd]*.t?t") == ["data.txt"]
+
+    def test_list_external_named_symlink(self, make_fs, temp_project, external_dir):
+        """Test that a segment naming a symlinked directory descends into it."""
+        fs = make_fs(temp_project, allow_external=True)
+        try:
+            (external_dir.root / "linked").symlink_to(
+                external_dir.root / "external", target_is_directory=True
+            )
+        except OSError:
+            pytest.skip("symlinks are not supported here")
+
+        def names(pattern):
+            return [Path(f).name for f in fs.list(str(external_dir.root / pattern))]
+
+        assert names("**/linked/*") == ["config.json", "data.txt"]
+        assert names("linked/*.json") == ["config.json"]
+        # "**" itself does not descend into symlinked directories
+        assert names("**/*.json") == ["config.json"]
+
+    def test_list_external_trailing_slash(self, make_fs, temp_project, external_dir):
+        """Test that a pattern ending in "/" matches directories only."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "external" / "nested").mkdir()
+        root = str(external_dir.root)
+
+        def names(pattern, only_files=False):
+            return [Path(f).name for f in fs.list(root + pattern, only_files)]
+
+        assert names("/*/") == ["external"]
+        assert names("/external/**/") == ["external", "nested"]
+        assert names("/*/", only_files=True) == []
+
+    def test_grep_external_regex_with_literal(self, make_fs, temp_project, external_dir):
+        """Test external grep for regexes that contain a required literal."""
+        fs = make_fs(temp_project, allow_external=True)
+
+        pattern = external_dir.glob_all
+        results = fs.grep(r"Log line \d", pattern)
+        assert [r.line_number for r in results] == [1, 2, 3]
+
+        results = fs.grep(r"LOG LINE [23]", pattern)
+        assert [r.line_number for r in results] == [2, 3]
+
+        assert fs.grep(r"Log line [4-9]", pattern) == []
+
+    def test_grep_external_literal_prefilter(self, make_fs, temp_project, external_dir):
+        """Test external grep for escaped metacharacters and alternations."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "calls.txt").write_text("fn(x) done\nfnx done\n")
+        (external_dir.root / "alt.txt").write_text("foo first\nnothing\nbar second\n")
+
+        pattern = external_dir.glob_all
+        results = fs.grep(r"fn\(x\)", pattern)
+        assert [(Path(r.file).name, r.line_number) for r in results] == [("calls.txt", 1)]
+
+        # No literal is required by every match, so no file may be skipped
+        results = fs.grep("foo|bar", pattern)
+        assert [(Path(r.file).name, r.line_number) for r in results] == [
+            ("alt.txt", 1),
+            ("alt.txt", 3),
+        ]
+
+    def test_grep_external_line_anchors(self, make_fs, temp_project, external_dir):
+        """Test that ^ and $ anchor to each line, not to the whole file."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "anchors.txt").write_text(
+            "start of line\n  start indented\nends with end\nend not last\n"
+        )
 
-        # Search in external directory
-        pattern = str(external_dir / "**" / "*")
+        pattern = external_dir.glob_all
+        assert [r.line_number for r in fs.grep("^start", pattern)] == [1]
+        assert [r.line_number for r in fs.grep("end$", pattern)] == [3]
+        assert [r.line_number for r in fs.grep("^end", pattern)] == [4]
+
+    def test_grep_external_atomic_group(self, make_fs, temp_project, external_dir):
+        """Test that an atomic group cannot swallow a line break and miss a line."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "atomic.txt").write_text("a x\nbbb\n")
+
+        results = fs.grep(r"(?>.*\s)x", external_dir.glob_all)
+        assert [(Path(r.file).name, r.content) for r in results] == [("atomic.txt", "a x")]
+
+    def test_grep_external_plain_literals(self, make_fs, temp_project, external_dir):
+        """Test literal-looking patterns keep their regex and case semantics."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "dots.txt").write_text("call a.b here\naxb only\n")
+        (external_dir.root / "umlaut.txt").write_text("Grüße aus KÖLN\nkeine\n")
+
+        pattern = external_dir.glob_all
+        assert [r.line_number for r in fs.grep("a.b", pattern)] == [1, 2]
+        assert [r.line_number for r in fs.grep(r"a\.b", pattern)] == [1]
+
+        assert [r.line_number for r in fs.grep("köln", pattern)] == [1]
+        assert [r.line_number for r in fs.grep("GRÜßE", pattern)] == [1]
+        assert fs.grep("köln", pattern, case_sensitive=True) == []
+
+    def test_grep_external_skips_binary(self, make_fs, temp_project, external_dir):
+        """Test that external grep skips files with a NUL byte near the start."""
+        fs = make_fs(temp_project, allow_external=True)
+        (external_dir.root / "blob.txt").write_bytes(b"needle\x00\x01\x02\nneedle\n")
+        (external_dir.root / "text.txt").write_text("needle\n")
+
+        results = fs.grep("needle", external_dir.glob_all)
+        assert [Path(r.file).name for r in results] == ["text.txt"]
+
+    def test_grep_external_large_file(self, make_fs, temp_project, external_dir):
+        """Test external grep on files above the 1 MiB mmap threshold."""
+        fs = make_fs(temp_project, allow_external=True)
+        filler = "x" * 99 + "\n"
+        (external_dir.root / "big.txt").write_text(filler * 20000 + "needle here\n" + filler)
+        (external_dir.root / "big_miss.txt").write_text(filler * 20000)
+
+        results = fs.grep("needle", external_dir.glob_all, before=1, after=1)
+        assert len(results) == 1
+        assert Path(results[0].file).name == "big.txt"
+        assert results[0].line_number == 20001
+        assert results[0].content == "needle here"
+        assert results[0].context_before == ["x" * 99]
+        assert results[0].context_after == ["x" * 99]
+
+    def test_grep_external_sees_new_files(self, make_fs, temp_project, external_dir):
+        """Test repeated external grep picks up files added between calls."""
+        fs = make_fs(temp_project, allow_external=True)
+
+        pattern = str(external_dir.root / "**" / "*.log")
+        assert len(fs.grep("Log line", pattern)) == 3
+
+        nested = external_dir.root / "nested" / "deeper"
+        nested.mkdir(parents=True)
+        (nested / "extra.log").write_text("Log line 4\n")
         results = fs.grep("Log line", pattern)
+        assert len(results) == 4
+        assert any(r.file.endswith("extra.log") for r in results)
 
-        # Should find matches in external files
-        assert len(results) >= 1
-        assert any("Log line" in r.content for r in results)
-
-    def test_get_metadata_external(self, temp_project, external_dir):
-        """Test getting metadata for external file."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
+    def test_external_calls_after_close(self, make_fs, temp_project, external_dir):
+        """Test that external batch reads and grep keep working after close()."""
+        fs = make_fs(temp_project, allow_external=True)
+        fs.close()
 
-        external_file = str(external_dir / "test.log")
-        metadata = fs.get_metadata(external_file)
+        data_file = str(external_dir.root / "external" / "data.txt")
+        results = fs.read_batch([external_dir.log, data_file])
+        assert "Log line 1" in results[external_dir.log]
+        assert results[data_file] == "External data file content."
 
-        # Check metadata structure (dict for external paths)
-        assert "size" in metadata
-        assert "mtime" in metadata
-        assert metadata["size"] > 0
+        assert len(fs.grep("Log line", external_dir.glob_all)) == 3
 
-    def test_relative_path_still_uses_rust(self, temp_project):
+    def test_relative_path_still_uses_rust(self, make_fs, temp_project):
         """Test that relative paths still use Rust implementation."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), allow_external=True)
-        fs.wait_ready()
+        fs = make_fs(temp_project, allow_external=True)
 
         # Relative path should work with Rust
         content = fs.read_file("src/main.py")
         assert "def main():" in content
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestAsyncExternalPaths:
     """Tests for async external path support."""
 
-    def test_async_read_external_file(self, temp_project, external_dir):
+    async def test_async_read_external_file(self, async_fs_allow_ext, shared_external_dir):
         """Test async reading external file."""
-        import asyncio
+        content = await async_fs_allow_ext.read_file(shared_external_dir.log)
+
+        assert "Log line 1" in content
 
-        from agent_gear import AsyncFileSystem
+    async def test_async_write_external_file(self, async_fs_allow_ext, external_dir):
+        """Test async writing to external file."""
+        external_file = str(external_dir.root / "async_new.txt")
+        await async_fs_allow_ext.write_file(external_file, "Async content.")
+
+        assert Path(external_file).read_text() == "Async content."
 
-        async def run_test():
-            async with AsyncFileSystem(str(temp_project), allow_external=True) as fs:
-                await fs.wait_ready()
+    async def test_async_read_batch_mixed_paths(self, async_fs_allow_ext, shared_external_dir):
+        """Test async batch read of mixed internal, external and missing paths."""
+        external_file = shared_external_dir.log
+        missing_file = str(shared_external_dir.root / "missing.txt")
+        results = await async_fs_allow_ext.read_batch(["src/main.py", external_file, missing_file])
 
-                external_file = str(external_dir / "test.log")
-                content = await fs.read_file(external_file)
+        assert any(p.endswith("main.py") for p in results)
+        assert "Log line 1" in results[external_file]
+        assert missing_file not in results
 
-                assert "Log line 1" in content
 
-        asyncio.run(run_test())
+class TestPythonBackendWrite:
+    """Tests for PythonFileBackend.write_file durability modes."""
 
-    def test_async_write_external_file(self, temp_project, external_dir):
-        """Test async writing to external file."""
-        import asyncio
+    @pytest.mark.parametrize(
+        "durability,synced",
+        [("none", []), ("fsync", ["fsync"]), ("fdatasync", ["fdatasync"])],
+    )
+    def test_write_file_durability(self, monkeypatch, python_backend, tmp_path, durability, synced):
+        """Test that each durability mode writes the file and syncs as documented."""
+        calls = []
+        monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync"))
+        if hasattr(os, "fdatasync"):
+            monkeypatch.setattr(os, "fdatasync", lambda fd: calls.append("fdatasync"))
+        elif durability == "fdatasync":
+            # Platforms without fdatasync fall back to a full fsync
+            synced = ["fsync"]
 
-        from agent_gear import AsyncFileSystem
+        target = tmp_path / "out.txt"
+        assert python_backend.write_file(str(target), "content", durability=durability)
 
-        async def run_test():
-            async with AsyncFileSystem(str(temp_project), allow_external=True) as fs:
-                await fs.wait_ready()
+        assert target.read_text() == "content"
+        assert calls == synced
+        assert not (tmp_path / "out.txt.tmp").exists()
 
-                external_file = str(external_dir / "async_new.txt")
-                await fs.write_file(external_file, "Async content.")
+    def test_write_file_unknown_durability(self, python_backend, tmp_path):
+        """Test that an unknown durability mode raises before touching the file."""
+        target = tmp_path / "out.txt"
 
-                assert Path(external_file).read_text() == "Async content."
+        with pytest.raises(ValueError, match="Unknown durability mode"):
+            python_backend.write_file(str(target), "content", durability="sometimes")
 
-        asyncio.run(run_test())
+        assert not target.exists()
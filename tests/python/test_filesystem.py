@@ -1,59 +1,21 @@
 """Integration tests for agent_gear.FileSystem."""
 
-import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
+from agent_gear import AsyncFileSystem, FileSystem, PathList
 
-@pytest.fixture
-def temp_project():
-    """Create a temporary project directory with test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
 
-        # Create directory structure
-        (root / "src").mkdir()
-        (root / "tests").mkdir()
-
-        # Create files
-        (root / "src" / "main.py").write_text(
-            '''"""Main module."""
-
-def main():
-    """Entry point."""
-    print("Hello, World!")
-
-if __name__ == "__main__":
-    main()
-'''
-        )
-
-        (root / "src" / "utils.py").write_text(
-            '''"""Utility functions."""
-
-def helper():
-    """A helper function."""
-    return 42
-
-def another_helper():
-    """Another helper."""
-    return "hello"
-'''
-        )
-
-        (root / "tests" / "test_main.py").write_text(
-            '''"""Tests for main module."""
-
-def test_main():
-    """Test main function."""
-    assert True
-'''
-        )
-
-        (root / "README.md").write_text("# Test Project\n\nThis is a test.")
-
-        yield root
+def _wait_for(pred, timeout=5.0, interval=0.01):
+    """Poll pred until it returns True or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pred():
+            return True
+        time.sleep(interval)
+    return False
 
 
 class TestFileSystem:
@@ -61,50 +23,42 @@ class TestFileSystem:
 
     def test_init(self, temp_project):
         """Test FileSystem initialization."""
-        from agent_gear import FileSystem
-
         fs = FileSystem(str(temp_project))
         assert fs.wait_ready(timeout=5.0)
 
-    def test_list_all_files(self, temp_project):
+    def test_list_all_files(self, fs):
         """Test listing all files."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         files = fs.list("**/*")
         assert len(files) == 4  # main.py, utils.py, test_main.py, README.md
 
-    def test_glob_pattern(self, temp_project):
-        """Test glob pattern matching."""
-        from agent_gear import FileSystem
+    def test_list_bytes(self, fs):
+        """Test packed path listing and PathList."""
+        paths = PathList(*fs.list_bytes("**/*.py"))
+        assert sorted(paths) == sorted(fs.list("**/*.py"))
+        assert len(paths) == 3
+        assert paths[-1] == list(paths)[-1]
+        assert paths[:2] == list(paths)[:2]
 
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
+        empty = PathList(*fs.list_bytes("**/*.nothing"))
+        assert len(empty) == 0
+        assert list(empty) == []
 
+    def test_glob_pattern(self, fs):
+        """Test glob pattern matching."""
         py_files = fs.glob("**/*.py")
         assert len(py_files) == 3
 
         src_files = fs.glob("src/*.py")
         assert len(src_files) == 2
 
-    def test_read_file(self, temp_project):
+    def test_read_file(self, fs):
         """Test reading a single file."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
         content = fs.read_file("src/main.py")
         assert "def main():" in content
         assert "Hello, World!" in content
 
-    def test_read_batch(self, temp_project):
+    def test_read_batch(self, fs):
         """Test batch file reading."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         paths = ["src/main.py", "src/utils.py"]
         contents = fs.read_batch(paths)
 
@@ -115,10 +69,109 @@ class TestFileSystem:
         assert "def main():" in main_content
         assert "def helper():" in utils_content
 
+    def test_read_batch_bytes(self, fs):
+        """Test ordered byte batch reads and the concatenated variant."""
+        paths = ["src/utils.py", "missing.py", "src/main.py"]
+        contents = fs.read_batch_bytes(paths)
+        assert b"def helper():" in contents[0]
+        assert contents[1] is None
+        assert b"def main():" in contents[2]
+
+        buffer, offsets = fs.read_batch_concat(paths)
+        assert len(offsets) == len(paths) + 1
+        assert buffer[offsets[0] : offsets[1]] == contents[0]
+        assert buffer[offsets[1] : offsets[2]] == b""
+        assert buffer[offsets[2] : offsets[3]] == contents[2]
+
+        views = fs.read_batch_views(paths)
+        assert list(views) == paths
+        assert views["src/utils.py"] == contents[0]
+        assert views["missing.py"].nbytes == 0
+        assert views["src/main.py"].obj is views["src/utils.py"].obj
+
+    def test_pathlike_arguments(self, temp_project):
+        """Test that paths may be given as os.PathLike or bytes."""
+        fs = FileSystem(temp_project)
+
+        assert "def main():" in fs.read_file(Path("src/main.py"))
+        assert "def main():" in fs.read_file(b"src/main.py")
+        assert "def main():" in fs.read_file(temp_project / "src/main.py")
+
+        contents = fs.read_batch([Path("src/main.py"), b"src/utils.py"])
+        assert len(contents) == 2
+
+        fs.write_file(Path("new.txt"), "hello")
+        assert fs.read_lines(b"new.txt") == ["hello"]
+
+        fs.close()
+
+    def test_list_cache_invalidation(self, make_fs, temp_project):
+        """Test that repeated listings pick up index changes."""
+        fs = make_fs(temp_project, auto_watch=False)
+
+        first = fs.glob("**/*.py")
+        first.append("mutated.py")
+        assert "mutated.py" not in fs.glob("**/*.py")
+
+        (temp_project / "src" / "new.py").write_text("print('new')")
+        fs.refresh()
+        assert "src/new.py" in fs.glob("**/*.py")
+        assert "src/new.py" in fs.list()
+
+    def test_snapshot(self, make_fs, temp_project):
+        """Test that snapshots are unaffected by later changes."""
+        fs = make_fs(temp_project, auto_watch=False)
+
+        snapshot = fs.snapshot()
+        assert len(snapshot) == len(fs.list())
+
+        (temp_project / "src" / "new.py").write_text("print('new')")
+        fs.refresh()
+
+        assert "src/new.py" in fs.glob("**/*.py")
+        assert "src/new.py" not in snapshot.glob("**/*.py")
+        assert "src/main.py" in snapshot.list("src/*")
+        assert snapshot.get_metadata("src/main.py").size > 0
+        with pytest.raises(ValueError):
+            snapshot.get_metadata("src/new.py")
+
+    def test_copy_batch(self, temp_project):
+        """Test parallel file copies."""
+        fs = FileSystem(str(temp_project))
+
+        copied = fs.copy_batch([("README.md", "backup/README.md")])
+        assert copied == (temp_project / "README.md").stat().st_size
+        assert (temp_project / "backup/README.md").read_bytes() == (
+            temp_project / "README.md"
+        ).read_bytes()
+
+        fs.read_batch_into(["src/main.py", "src/utils.py"], "out")
+        assert (temp_project / "out/src/main.py").exists()
+        assert (temp_project / "out/src/utils.py").exists()
+
+        with pytest.raises(ValueError):
+            fs.copy_batch([("missing.py", "out/missing.py")])
+
+        fs.close()
+
+    def test_read_file_view(self, fs, shared_project):
+        """Test zero-copy file views."""
+        view = fs.read_file_view("src/main.py")
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view[:17].tobytes() == b'"""Main module."""'[:17]
+        assert bytes(view) == (shared_project / "src" / "main.py").read_bytes()
+
+    def test_read_lines_iter(self, fs):
+        """Test lazy line iteration."""
+        assert list(fs.read_lines_iter("src/utils.py")) == fs.read_lines("src/utils.py")
+        assert list(fs.read_lines_iter("src/utils.py", 2, 2)) == fs.read_lines("src/utils.py", 2, 2)
+
+        lines = fs.read_lines_iter("src/main.py")
+        assert next(lines) == '"""Main module."""'
+
     def test_write_file(self, temp_project):
         """Test writing a file."""
-        from agent_gear import FileSystem
-
         fs = FileSystem(str(temp_project))
 
         # Write new file
@@ -130,8 +183,6 @@ class TestFileSystem:
 
     def test_edit_replace(self, temp_project):
         """Test text replacement."""
-        from agent_gear import FileSystem
-
         fs = FileSystem(str(temp_project))
 
         # Replace text
@@ -143,45 +194,26 @@ class TestFileSystem:
         assert "My Project" in content
         assert "Test Project" not in content
 
-    def test_edit_replace_strict_not_found(self, temp_project):
+    def test_edit_replace_strict_not_found(self, fs):
         """Test edit_replace fails in strict mode when text not found."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-
         with pytest.raises(ValueError, match="not found"):
             fs.edit_replace("README.md", "NonExistent", "Replacement", strict=True)
 
-    def test_grep_basic(self, temp_project):
+    def test_grep_basic(self, fs):
         """Test basic grep search."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         results = fs.grep("def", "**/*.py")
         assert len(results) >= 3  # main, helper, another_helper, test_main
 
-    def test_grep_glob_filter(self, temp_project):
+    def test_grep_glob_filter(self, fs):
         """Test grep with glob filter."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         # Only search in src/
         results = fs.grep("def", "src/*.py")
         for r in results:
             # Handle both Unix (/) and Windows (\) path separators
             assert r.file.startswith("src/") or r.file.startswith("src\\")
 
-    def test_grep_case_sensitive(self, temp_project):
+    def test_grep_case_sensitive(self, fs):
         """Test case-sensitive grep."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         # Case insensitive (default)
         results = fs.grep("hello", "**/*", case_sensitive=False)
         assert len(results) >= 1
@@ -192,48 +224,116 @@ class TestFileSystem:
         hello_results = [r for r in results if "hello" in r.content.lower()]
         assert all("hello" in r.content for r in hello_results)
 
-    def test_grep_max_results(self, temp_project):
+    def test_grep_max_results(self, fs):
         """Test grep result limiting."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         results = fs.grep("def", "**/*", max_results=1)
         assert len(results) == 1
 
+    def test_grep_context(self, fs):
+        """Test before/after context lines attached to grep results."""
+        results = fs.grep("def main", "src/*.py", before=2, after=1)
+        assert len(results) == 1
+        assert results[0].context_before == ['"""Main module."""', ""]
+        assert results[0].context_after == ['    """Entry point."""']
+
+        results = fs.grep("def main", "src/*.py")
+        assert results[0].context_before == []
+        assert results[0].context_after == []
+
+    def test_grep_iter(self, fs):
+        """Test streaming grep and early exit."""
+        streamed = sorted((r.file, r.line_number) for r in fs.grep_iter("def", "**/*.py"))
+        listed = sorted((r.file, r.line_number) for r in fs.grep("def", "**/*.py"))
+        assert streamed == listed
+
+        assert fs.grep_any("helper")
+        assert not fs.grep_any("nonexistent_pattern_xyz")
+
+        with pytest.raises(ValueError):
+            fs.grep_iter("(")
+
+    def test_grep_multi(self, fs):
+        """Test searching for several literals in one pass."""
+        results = fs.grep_multi(["def helper", "def main", "nonexistent"], "**/*.py")
+        assert set(results) == {"def helper", "def main", "nonexistent"}
+        assert len(results["def helper"]) == 1
+        assert results["def main"][0].file.endswith("main.py")
+        assert results["nonexistent"] == []
+
+    def test_simd_backend(self, temp_project):
+        """Test the SIMD diagnostic."""
+        fs = FileSystem(str(temp_project), auto_watch=False)
+        assert fs.simd_backend() in {"avx2", "sse2", "neon", "none"}
+        fs.close()
+
     def test_context_manager(self, temp_project):
         """Test using FileSystem as context manager."""
-        from agent_gear import FileSystem
-
         with FileSystem(str(temp_project)) as fs:
             fs.wait_ready()
             files = fs.list("**/*")
             assert len(files) > 0
 
-    def test_get_metadata(self, temp_project):
+    def test_get_metadata(self, fs):
         """Test getting file metadata."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         metadata = fs.get_metadata("src/main.py")
         assert metadata.size > 0
         assert not metadata.is_dir
         assert not metadata.is_binary
 
 
+class TestSharedHandles:
+    """Tests for FileSystem.open() handle sharing."""
+
+    def test_open_shares_index(self, temp_project):
+        """Test that handles on the same root share one Rust instance."""
+        first = FileSystem.open(str(temp_project))
+        second = FileSystem.open(str(temp_project))
+        assert first._inner is second._inner
+
+        fresh = FileSystem(str(temp_project))
+        assert fresh._inner is not first._inner
+        fresh.close()
+
+        first.close()
+        first.close()  # closing twice must not release the other handle
+        assert second.is_watching()
+        assert second.wait_ready()
+
+        second.close()
+        assert not second.is_watching()
+
+        reopened = FileSystem.open(str(temp_project))
+        assert reopened._inner is not second._inner
+        reopened.close()
+
+
+class TestAsyncFileSystem:
+    """Tests for AsyncFileSystem native async operations."""
+
+    async def test_native_async_operations(self, temp_project):
+        """Test list, read and grep through the Rust futures."""
+        async with AsyncFileSystem(str(temp_project)) as fs:
+            assert await fs.wait_ready()
+
+            files = await fs.list("**/*.py")
+            assert "src/main.py" in files
+
+            content = await fs.read_file("src/main.py")
+            assert "def main():" in content
+
+            contents = await fs.read_batch(["src/main.py", "src/utils.py"])
+            assert len(contents) == 2
+
+            results = await fs.grep("def helper", "**/*.py")
+            assert len(results) == 1
+            assert results[0].file.endswith("utils.py")
+
+
 class TestSearchResult:
     """Tests for SearchResult class."""
 
-    def test_search_result_attributes(self, temp_project):
+    def test_search_result_attributes(self, fs):
         """Test SearchResult attributes."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project))
-        fs.wait_ready()
-
         results = fs.grep("main", "**/*.py")
         assert len(results) > 0
 
@@ -251,31 +351,21 @@ class TestSearchResult:
 class TestFileWatching:
     """Tests for file watching functionality."""
 
-    def test_is_watching_enabled(self, temp_project):
+    def test_is_watching_enabled(self, shared_project):
         """Test that file watching is enabled by default."""
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), auto_watch=True)
-        # Watching should be active
-        assert fs.is_watching()
-        fs.close()
+        with FileSystem(str(shared_project), auto_watch=True) as fs:
+            # Watching should be active
+            assert fs.is_watching()
 
-    def test_is_watching_disabled(self, temp_project):
+    def test_is_watching_disabled(self, shared_project):
         """Test that file watching can be disabled."""
-        from agent_gear import FileSystem
+        with FileSystem(str(shared_project), auto_watch=False) as fs:
+            # Watching should not be active
+            assert not fs.is_watching()
 
-        fs = FileSystem(str(temp_project), auto_watch=False)
-        # Watching should not be active
-        assert not fs.is_watching()
-        fs.close()
-
-    def test_file_creation_detected(self, temp_project):
+    def test_file_creation_detected(self, make_fs, temp_project):
         """Test that new files are detected by the watcher."""
-        import time
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), auto_watch=True)
-        fs.wait_ready()
+        fs = make_fs(temp_project, auto_watch=True)
 
         initial_count = len(fs.list("**/*"))
 
@@ -283,25 +373,14 @@ class TestFileWatching:
         new_file = temp_project / "new_watched_file.py"
         new_file.write_text("# New file\n")
 
-        # Wait for watcher to detect the change
-        time.sleep(0.5)
-
-        # Refresh to apply any pending changes
-        # (In production, this would happen automatically via the watcher thread)
-        fs.refresh()
-
-        new_count = len(fs.list("**/*"))
-        assert new_count > initial_count, "New file should be detected"
-
-        fs.close()
+        # Wait for the watcher thread to apply the change to the index
+        assert _wait_for(lambda: len(fs.list("**/*")) > initial_count), (
+            "New file should be detected"
+        )
 
-    def test_file_deletion_detected(self, temp_project):
+    def test_file_deletion_detected(self, make_fs, temp_project):
         """Test that deleted files are detected by the watcher."""
-        import time
-        from agent_gear import FileSystem
-
-        fs = FileSystem(str(temp_project), auto_watch=True)
-        fs.wait_ready()
+        fs = make_fs(temp_project, auto_watch=True)
 
         initial_count = len(fs.list("**/*"))
 
@@ -309,21 +388,13 @@ class TestFileWatching:
         file_to_delete = temp_project / "README.md"
         file_to_delete.unlink()
 
-        # Wait for watcher to detect the change
-        time.sleep(0.5)
-
-        # Refresh to apply any pending changes
-        fs.refresh()
-
-        new_count = len(fs.list("**/*"))
-        assert new_count < initial_count, "Deleted file should be removed from index"
-
-        fs.close()
+        # Wait for the watcher thread to apply the change to the index
+        assert _wait_for(lambda: len(fs.list("**/*")) < initial_count), (
+            "Deleted file should be removed from index"
+        )
 
     def test_close_stops_watching(self, temp_project):
         """Test that close() stops the file watcher."""
-        from agent_gear import FileSystem
-
         fs = FileSystem(str(temp_project), auto_watch=True)
         assert fs.is_watching()
 